@@ -15,6 +15,7 @@ flattened into ``PatternRunRecord`` and aggregated through
 import asyncio
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
@@ -38,9 +39,10 @@ from src.evaluation import (
     flatten_pattern_metrics,
     inject_self_consistency_scores,
     load_test_suite,
+    token_estimator,
 )
 from src.evaluation.evaluator import evaluate_multiple_patterns
-from src.evaluation.report_generator import _build_phase_f_metadata
+from src.evaluation.report_generator import ReportInputs, _build_phase_f_metadata
 from src.evaluation.visualization import EvaluationVisualizer
 
 
@@ -134,6 +136,7 @@ async def _run_multi(
     max_concurrency: int,
     robustness_every_run: bool,
     output_dir: str,
+    task_concurrency: int = 1,
     full_console: bool = False,
 ):
     """Top-level Phase F multi-run orchestrator.
@@ -174,6 +177,7 @@ async def _run_multi(
             task_timeout=task_timeout,
             parallel=parallel,
             max_concurrency=max_concurrency,
+            task_concurrency=task_concurrency,
         )
 
         if not robustness_every_run and include_robustness:
@@ -230,6 +234,7 @@ async def _run_multi(
         task_timeout=task_timeout,
         parallel=parallel,
         max_concurrency=max_concurrency,
+        task_concurrency=task_concurrency,
         robustness_reused=robustness_reused,
         insufficient_runs=(num_runs == 1),
     )
@@ -238,24 +243,39 @@ async def _run_multi(
     md_path = output_root / "evaluation_report.md"
     csv_path = output_root / "comparison_table.csv"
 
-    ReportGenerator.generate_json_report(
-        latest_pattern_metrics,
-        output_path=str(json_path),
-        statistical_report=statistical_report,
-        run_metadata=metadata,
-    )
-    ReportGenerator.generate_markdown_report(
-        latest_pattern_metrics,
-        output_path=str(md_path),
-        statistical_report=statistical_report,
-        run_metadata=metadata,
-    )
-    ReportGenerator.generate_csv_comparison(
-        latest_pattern_metrics,
-        output_path=str(csv_path),
-    )
+    # The three formats are independent once the shared comparison and
+    # per-pattern dicts exist; build those first so the threads only read
+    # them, then overlap rendering with the file writes.
+    report_inputs = ReportInputs.from_metrics(latest_pattern_metrics)
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        futures = [
+            pool.submit(
+                ReportGenerator.generate_json_report,
+                latest_pattern_metrics,
+                output_path=str(json_path),
+                statistical_report=statistical_report,
+                run_metadata=metadata,
+                inputs=report_inputs,
+            ),
+            pool.submit(
+                ReportGenerator.generate_markdown_report,
+                latest_pattern_metrics,
+                output_path=str(md_path),
+                statistical_report=statistical_report,
+                run_metadata=metadata,
+                inputs=report_inputs,
+            ),
+            pool.submit(
+                ReportGenerator.generate_csv_comparison,
+                latest_pattern_metrics,
+                output_path=str(csv_path),
+                inputs=report_inputs,
+            ),
+        ]
+        for future in futures:
+            future.result()
     if full_console:
-        ReportGenerator.print_console_report(latest_pattern_metrics)
+        ReportGenerator.print_console_report(latest_pattern_metrics, inputs=report_inputs)
 
     visualizer = EvaluationVisualizer(output_dir=str(output_root / "figures"))
     visualizer.generate_all_plots(
@@ -271,6 +291,7 @@ async def run_full_evaluation(
     task_timeout: float = 180.0,
     parallel: bool = True,
     max_concurrency: int = 2,
+    task_concurrency: int = 1,
     num_runs: int = 1,
     robustness_every_run: bool = True,
     output_dir: str = "reports",
@@ -297,6 +318,7 @@ async def run_full_evaluation(
         task_timeout=task_timeout,
         parallel=parallel,
         max_concurrency=max_concurrency,
+        task_concurrency=task_concurrency,
         robustness_every_run=robustness_every_run,
         output_dir=output_dir,
         full_console=True,
@@ -308,6 +330,7 @@ async def run_quick_test(
     task_timeout: float = 180.0,
     parallel: bool = True,
     max_concurrency: int = 2,
+    task_concurrency: int = 1,
     num_runs: int = 1,
     robustness_every_run: bool = True,
     output_dir: str = "reports",
@@ -332,6 +355,7 @@ async def run_quick_test(
         task_timeout=task_timeout,
         parallel=parallel,
         max_concurrency=max_concurrency,
+        task_concurrency=task_concurrency,
         robustness_every_run=robustness_every_run,
         output_dir=output_dir,
         full_console=True,
@@ -344,6 +368,7 @@ async def run_category_test(
     task_timeout: float = 180.0,
     parallel: bool = True,
     max_concurrency: int = 2,
+    task_concurrency: int = 1,
     num_runs: int = 1,
     robustness_every_run: bool = True,
     output_dir: str = "reports",
@@ -371,6 +396,7 @@ async def run_category_test(
         task_timeout=task_timeout,
         parallel=parallel,
         max_concurrency=max_concurrency,
+        task_concurrency=task_concurrency,
         robustness_every_run=robustness_every_run,
         output_dir=output_dir,
         full_console=True,
@@ -399,7 +425,8 @@ def main():
         "--delay",
         type=float,
         default=1.0,
-        help="Delay in seconds between tasks to avoid rate limits (default: 1.0)"
+        help="Minimum spacing in seconds between task starts within a pattern, "
+             "enforced by a token bucket (default: 1.0)"
     )
     parser.add_argument(
         "--sequential",
@@ -419,6 +446,14 @@ def main():
         help="Max number of patterns to run concurrently in parallel mode (default: 1). "
              "Lower values reduce Ollama resource contention but increase total time."
     )
+    parser.add_argument(
+        "--task-concurrency",
+        type=int,
+        default=1,
+        help="Max number of tasks in flight within each pattern (default: 1). "
+             "Higher values overlap LLM latency, but per-task latency then "
+             "includes time spent queueing on the backend."
+    )
     # Phase F: multi-run + statistical rigor controls
     parser.add_argument(
         "--num-runs",
@@ -470,8 +505,12 @@ def main():
     start_dt = datetime.now()
     print(f"\n{'='*60}")
     print(f"  Evaluation started at: {start_dt.strftime('%Y-%m-%d %H:%M:%S')}")
-    print(f"  Mode: {args.mode} | Delay: {args.delay}s | Timeout: {args.timeout}s | Parallel: {parallel} | Concurrency: {args.concurrency}")
+    print(f"  Mode: {args.mode} | Delay: {args.delay}s | Timeout: {args.timeout}s | Parallel: {parallel} | Concurrency: {args.concurrency} | Task concurrency: {args.task_concurrency}")
     print(f"  Phase F: num_runs={args.num_runs} | robustness_every_run={args.robustness_every_run}")
+    # Resolve the token estimator (tiktoken may fetch its BPE file) before
+    # the event loop starts, rather than on the first estimate inside it.
+    # The report metadata records which one was used.
+    token_estimator()
     print(f"{'='*60}\n")
 
     common_kwargs = dict(
@@ -479,6 +518,7 @@ def main():
         task_timeout=args.timeout,
         parallel=parallel,
         max_concurrency=args.concurrency,
+        task_concurrency=max(1, args.task_concurrency),
         num_runs=args.num_runs,
         robustness_every_run=args.robustness_every_run,
         output_dir=args.output_dir,
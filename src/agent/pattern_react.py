@@ -90,16 +90,18 @@ def create_enhanced_react_agent_with_prompt(model, tools, system_prompt=None):
     else:
         return create_react_agent(model=model, tools=tools)
 
+# 使用配置的 LLM - one shared instance so both agents reuse the same HTTP pool
+llm = get_llm()
+
 # Create the basic ReAct agent (maintains compatibility)
-# 使用配置的 LLM
 graph_pattern_react = create_react_agent(
-    model=get_llm(),
+    model=llm,
     tools=tools
 )
 
 # Create the enhanced ReAct agent with system prompt
 enhanced_graph_pattern_react = create_enhanced_react_agent_with_prompt(
-    model=get_llm(),
+    model=llm,
     tools=tools,
     system_prompt=REACT_SYSTEM_PROMPT.format(
         tool_names=", ".join([tool.name for tool in tools])
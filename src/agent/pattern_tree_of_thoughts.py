@@ -42,12 +42,90 @@ llm = get_llm()
 # Configuration
 TOT_CONFIG: dict[str, int | float] = {
     "max_depth": 2,           # Reduced from 3 to avoid timeout (>3min)
-    "thoughts_per_level": 2,  # Reduced from 3 to cut LLM calls per task
+    "thoughts_per_level": 3,  # Branching factor at the root level
+    "deep_thoughts_per_level": 2,  # Deeper levels rarely change the winner
     "top_k_selection": 1,     # Reduced from 2 to limit branching
-    "evaluation_threshold": 0.7
+    "evaluation_threshold": 0.7,
+    "evaluation_temperature": 0.2,  # Upper bound for the scoring model
 }
 
 
+def _thoughts_for_depth(depth: int) -> int:
+    """Return how many thoughts to generate at ``depth`` (0 = root).
+
+    Exploration matters most at the root; below it the branches mostly
+    refine the already-selected path, so we spend fewer calls there.
+    """
+    if depth == 0:
+        return int(TOT_CONFIG["thoughts_per_level"])
+    return int(TOT_CONFIG["deep_thoughts_per_level"])
+
+
+def _with_max_temperature(model, temperature: float):
+    """Return a copy of ``model`` whose temperature is at most ``temperature``.
+
+    Chat models are pydantic objects, so ``model_copy`` is the portable way
+    to override sampling settings (``bind(temperature=...)`` is not
+    understood by every backend, e.g. ChatOllama expects it in ``options``).
+    Models already at or below the cap -- or without a temperature field --
+    are returned unchanged.
+    """
+    if "temperature" not in getattr(type(model), "model_fields", {}):
+        return model
+    current = getattr(model, "temperature", None)
+    if current is not None and current <= temperature:
+        return model
+    return model.model_copy(update={"temperature": temperature})
+
+
+# Lower-variance model for scoring thoughts (fewer unparseable / noisy scores).
+eval_llm = _with_max_temperature(llm, float(TOT_CONFIG["evaluation_temperature"]))
+
+
+def _stream_json(prompt: str, model=None) -> str:
+    """Stream a JSON-emitting prompt and stop at the closing brace.
+
+    Thought generation and evaluation only ever parse the first JSON
+    object in the reply, so any tokens the model emits after it are pure
+    latency.  We track brace depth (ignoring braces inside JSON strings)
+    and abandon the stream as soon as the top-level object closes.
+    """
+    parts: List[str] = []
+    depth = 0
+    started = False
+    in_string = False
+    escaped = False
+    model = model if model is not None else llm
+    for chunk in model.stream([{"role": "user", "content": prompt}]):
+        piece = chunk.content if isinstance(chunk.content, str) else str(chunk.content)
+        parts.append(piece)
+        for ch in piece:
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif ch == "\\":
+                    escaped = True
+                elif ch == '"':
+                    in_string = False
+            elif ch == '"' and started:
+                in_string = True
+            elif ch == "{":
+                depth += 1
+                started = True
+            elif ch == "}" and started:
+                depth -= 1
+        if started and depth <= 0:
+            break
+
+    text = "".join(parts).strip()
+    if text.startswith("```"):
+        text = text.replace("```json", "").replace("```", "").strip()
+    if started:
+        # Drop any preamble before the object and the tail after it.
+        text = text[text.find("{"):text.rfind("}") + 1]
+    return text
+
+
 def thought_generation_node(state: TreeOfThoughtsState):
     """Generate multiple distinct thought branches in parallel."""
     original_query = state.get("original_query") or (
@@ -56,7 +134,7 @@ def thought_generation_node(state: TreeOfThoughtsState):
     current_depth = state.get("current_depth", 0)
 
     if current_depth >= TOT_CONFIG["max_depth"]:
-        return {**state, "current_depth": current_depth}
+        return {"current_depth": current_depth}
 
     # Get context from previous thoughts
     best_thoughts = state.get("best_thoughts", [])
@@ -69,6 +147,7 @@ def thought_generation_node(state: TreeOfThoughtsState):
         context_paths = [[]]  # Start with empty path
 
     all_new_thoughts = []
+    n_thoughts = _thoughts_for_depth(current_depth)
 
     for path in context_paths:
         context_str = " -> ".join(path) if path else "Starting analysis"
@@ -78,26 +157,22 @@ def thought_generation_node(state: TreeOfThoughtsState):
             prompt = f'''For query: "{original_query}"
                 Current path: {context_str}
 
-                Generate 3 practical approaches to get both date and weather information:
-                1. Use date tool for current date
-                2. Use search tool for weather
-                3. Combine results effectively
+                Generate {n_thoughts} practical approaches to get both date and weather information, such as:
+                - Use date tool for current date
+                - Use search tool for weather
+                - Combine results effectively
 
                 Format as JSON: {{"thoughts": [{{"content": "approach", "reasoning": "why"}}]}}'''
         else:
             prompt = f'''For query: "{original_query}"
                 Current path: {context_str}
 
-                Generate 3 different solution approaches. Be specific and actionable.
+                Generate {n_thoughts} different solution approaches. Be specific and actionable.
 
                 Format as JSON: {{"thoughts": [{{"content": "approach", "reasoning": "why"}}]}}'''
 
         try:
-            response = llm.invoke([{"role": "user", "content": prompt}])
-            text = response.content.strip()
-
-            if text.startswith("```"):
-                text = text.replace("```json", "").replace("```", "").strip()
+            text = _stream_json(prompt)
 
             try:
                 data = json.loads(text)
@@ -105,10 +180,10 @@ def thought_generation_node(state: TreeOfThoughtsState):
             except (json.JSONDecodeError, ValueError):
                 thoughts = [
                     {"content": f"Approach {i+1}: Systematic problem solving", "reasoning": "Fallback"}
-                    for i in range(3)
+                    for i in range(n_thoughts)
                 ]
 
-            for thought_data in thoughts:
+            for thought_data in thoughts[:n_thoughts]:
                 content = thought_data.get("content", "No content")
                 new_path = path + [content]
 
@@ -123,7 +198,7 @@ def thought_generation_node(state: TreeOfThoughtsState):
 
         except Exception:
             # Fallback thoughts
-            for i in range(3):
+            for i in range(n_thoughts):
                 content = f"Approach {i+1}: Alternative solution method"
                 new_path = path + [content]
                 thought_node = {
@@ -135,13 +210,12 @@ def thought_generation_node(state: TreeOfThoughtsState):
                 }
                 all_new_thoughts.append(thought_node)
 
+    # Return only the changed channels; LangGraph merges them into state.
     return {
-        **state,
         "thought_tree": all_new_thoughts,
         "current_depth": current_depth + 1,
         "original_query": original_query,
         "max_depth": TOT_CONFIG["max_depth"],
-        "evaluation_mode": state.get("evaluation_mode", False)
     }
 
 
@@ -151,7 +225,7 @@ def evaluation_node(state: TreeOfThoughtsState):
     original_query = state.get("original_query", "")
 
     if not thought_tree:
-        return {**state, "evaluation_results": []}
+        return {}
 
     evaluated_thoughts = []
 
@@ -169,11 +243,7 @@ def evaluation_node(state: TreeOfThoughtsState):
             Return JSON: {{"overall_score": 0.8, "explanation": "why"}}'''
 
         try:
-            response = llm.invoke([{"role": "user", "content": eval_prompt}])
-            text = response.content.strip()
-
-            if text.startswith("```"):
-                text = text.replace("```json", "").replace("```", "").strip()
+            text = _stream_json(eval_prompt, eval_llm)
 
             try:
                 eval_data = json.loads(text)
@@ -190,11 +260,7 @@ def evaluation_node(state: TreeOfThoughtsState):
         }
         evaluated_thoughts.append(evaluated_thought)
 
-    return {
-        **state,
-        "thought_tree": evaluated_thoughts,
-        "evaluation_mode": state.get("evaluation_mode", False)
-    }
+    return {"thought_tree": evaluated_thoughts}
 
 
 def search_and_prune_node(state: TreeOfThoughtsState):
@@ -204,7 +270,7 @@ def search_and_prune_node(state: TreeOfThoughtsState):
     max_depth = state.get("max_depth", TOT_CONFIG["max_depth"])
 
     if not thought_tree:
-        return {**state, "best_thoughts": [], "final_solution": "No thoughts generated"}
+        return {"best_thoughts": [], "final_solution": "No thoughts generated"}
 
     # Sort by score
     sorted_thoughts = sorted(thought_tree, key=lambda x: x.get("score", 0), reverse=True)
@@ -222,20 +288,16 @@ def search_and_prune_node(state: TreeOfThoughtsState):
             final_solution = f"Best approach: {solution_path}"  # Formatted for demo
 
         return {
-            **state,
             "best_thoughts": sorted_thoughts[:int(TOT_CONFIG["top_k_selection"])],
             "final_solution": final_solution,
-            "evaluation_mode": state.get("evaluation_mode", False)
         }
 
     # Continue with top thoughts
     top_thoughts = sorted_thoughts[:int(TOT_CONFIG["top_k_selection"])]
 
     return {
-        **state,
         "best_thoughts": top_thoughts,
         "final_solution": "",
-        "evaluation_mode": state.get("evaluation_mode", False)
     }
 
 
@@ -281,17 +343,10 @@ Provide ONLY the direct answer, no explanations:"""
             else:
                 concise_output = response.content.strip()
 
-            new_messages = state["messages"] + [AIMessage(content=concise_output)]
             return {
-                "messages": new_messages,
-                "original_query": original_query,
-                "thought_tree": state.get("thought_tree", []),
-                "current_depth": state.get("current_depth", 0),
-                "max_depth": state.get("max_depth", TOT_CONFIG["max_depth"]),
-                "best_thoughts": best_thoughts,
+                "messages": [AIMessage(content=concise_output)],
                 "final_solution": concise_output,
                 "output": concise_output,
-                "evaluation_mode": True
             }
         except Exception:
             # Fallback: use simple LLM response
@@ -301,17 +356,10 @@ Provide ONLY the direct answer, no explanations:"""
             except Exception:
                 concise_output = "Error generating answer"
 
-            new_messages = state["messages"] + [AIMessage(content=concise_output)]
             return {
-                "messages": new_messages,
-                "original_query": original_query,
-                "thought_tree": state.get("thought_tree", []),
-                "current_depth": state.get("current_depth", 0),
-                "max_depth": state.get("max_depth", TOT_CONFIG["max_depth"]),
-                "best_thoughts": best_thoughts,
+                "messages": [AIMessage(content=concise_output)],
                 "final_solution": concise_output,
                 "output": concise_output,
-                "evaluation_mode": True
             }
 
     # Solution synthesis for Tree of Thoughts (demo mode)
@@ -387,19 +435,10 @@ Provide ONLY the direct answer, no explanations:"""
         else:
             concise_output = "Completed exploration"
 
-    new_messages = state["messages"] + [AIMessage(content=concise_output)]
-
-    # Ensure all required fields are returned
+    # ``add_messages`` appends the new message to the existing history.
     return {
-        "messages": new_messages,
-        "original_query": state.get("original_query", ""),
-        "thought_tree": state.get("thought_tree", []),
-        "current_depth": state.get("current_depth", 0),
-        "max_depth": state.get("max_depth", TOT_CONFIG["max_depth"]),
-        "best_thoughts": state.get("best_thoughts", []),
-        "final_solution": state.get("final_solution", ""),
+        "messages": [AIMessage(content=concise_output)],
         "output": concise_output,  # Clean, concise output for user
-        "evaluation_mode": evaluation_mode
     }
 
 
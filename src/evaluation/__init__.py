@@ -55,7 +55,7 @@ from .statistics import (
     flatten_pattern_metrics,
 )
 from .test_suite import TEST_SUITE, load_test_suite
-from .trace import AgentTrace, StepRecord, StepType, TraceExtractor
+from .trace import AgentTrace, StepRecord, StepType, TraceExtractor, token_estimator
 
 __all__ = [
     "TEST_SUITE",
@@ -107,4 +107,5 @@ __all__ = [
     "StepRecord",
     "StepType",
     "TraceExtractor",
+    "token_estimator",
 ]
@@ -0,0 +1,8 @@
+"""Python-version shims shared by the evaluation modules."""
+
+import sys
+from typing import Any, Dict
+
+# ``@dataclass(**DATACLASS_SLOTS)``: ``slots=True`` drops the per-instance
+# ``__dict__`` but needs Python 3.10+; the package still supports 3.9.
+DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
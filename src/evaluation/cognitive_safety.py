@@ -93,6 +93,12 @@ CONFIDENCE_PHRASES: List[str] = [
     "absolutely correct",
 ]
 
+#: Single alternation over ``CONFIDENCE_PHRASES`` (one scan of the
+#: lowercased output instead of one substring scan per phrase).
+_CONFIDENCE_ANY_PATTERN: re.Pattern = re.compile(
+    "|".join(re.escape(p) for p in CONFIDENCE_PHRASES)
+)
+
 #: Truncation cap for excerpt fields on ``FlaggedSegment`` -- keeps the
 #: report payload bounded.
 _EXCERPT_MAX_CHARS: int = 200
@@ -666,7 +672,7 @@ class CognitiveSafetyScreener:
         if (
             gt is not None
             and not judge_success
-            and any(p in output_text.lower() for p in CONFIDENCE_PHRASES)
+            and _CONFIDENCE_ANY_PATTERN.search(output_text.lower())
         ):
             contradiction_hits += 1
             flagged.append(FlaggedSegment(
@@ -4,18 +4,22 @@ Runs test tasks on patterns and collects metrics.
 """
 
 import asyncio
+import contextlib
+import hashlib
+import logging
 import threading
 import time
+from collections import Counter, OrderedDict
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
+from ._compat import DATACLASS_SLOTS
 from .judge import Judge, LLMJudge
 from .metrics import (
     AlignmentMetrics,
     BehaviouralSafetyMetrics,
     ControllabilityMetrics,
     EfficiencyMetrics,
-    MetricsAggregator,
     PatternMetrics,
     RobustnessMetrics,
     SuccessMetrics,
@@ -32,7 +36,7 @@ from .cognitive_safety import (
     aggregate_cognitive_safety_metrics,
 )
 from .safety import check_tool_compliance, check_content_safety, compute_task_safety
-from .trace import AgentTrace, TraceExtractor
+from .trace import AgentTrace, TraceExtractor, estimate_tokens
 from .test_suite import TEST_SUITE, TestTask
 from .controllability import (
     compute_controllability_result,
@@ -40,8 +44,86 @@ from .controllability import (
 )
 from .scoring import compute_all_scores, NormalizedDimensionScores, CompositeScore
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+
+# Content-addressed memo of rule-based judge verdicts.  Identical outputs
+# recur across patterns, runs and perturbation variants ("408", "Paris"),
+# and the judge is deterministic, so a verdict can be reused for the same
+# (output, ground_truth, judge config, schema).  Process-local and bounded;
+# not persisted, so edits to the judge logic never serve stale verdicts.
+_JUDGE_CACHE_MAX = 4096
+_judge_cache: "OrderedDict[str, Tuple[bool, str, bool, str]]" = OrderedDict()
+
+
+def _judge_cache_key(output: str, task: TestTask) -> str:
+    """SHA-256 over everything a judge verdict depends on."""
+    # exact/json verdicts (messages included) ignore surrounding whitespace,
+    # so responses differing only in leading/trailing blank lines or
+    # indentation -- common across perturbation variants -- share one entry.
+    if isinstance(output, str) and task.judge.get("mode", "exact") in ("exact", "json"):
+        output = output.strip()
+    payload = repr((output, task.ground_truth, task.judge, task.schema))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _judge_with_cache(output: str, task: TestTask) -> Tuple[bool, str, bool, str]:
+    """Return ``Judge.evaluate_both`` for ``output``, memoised by content hash."""
+    key = _judge_cache_key(output, task)
+    verdict = _judge_cache.get(key)
+    if verdict is not None:
+        _judge_cache.move_to_end(key)
+        return verdict
+
+    verdict = Judge.evaluate_both(
+        output, task.ground_truth, Judge.compile_config(task.judge, task.schema)
+    )
+    _judge_cache[key] = verdict
+    if len(_judge_cache) > _JUDGE_CACHE_MAX:
+        _judge_cache.popitem(last=False)
+    return verdict
+
+
+# Characters of agent output kept on a TaskResult once it has been judged.
+MAX_OUTPUT_CHARS = 8192
+
+
+class _TaskTimeout(Exception):
+    """Raised internally when a graph run exceeds ``task_timeout``."""
+
+
+class _TokenBucket:
+    """Minimal asyncio token bucket: ``rate`` acquisitions per second.
+
+    Unlike a fixed ``sleep`` after every task, time spent running a task
+    refills the bucket, so a slow task is not followed by an idle pause.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock: Optional[asyncio.Lock] = None
+
+    async def acquire(self) -> None:
+        """Wait until a token is available, then consume it."""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                await asyncio.sleep((1.0 - self._tokens) / self.rate)
+
+
+@dataclass(**DATACLASS_SLOTS)
 class TaskResult:
     """Result of running a single task."""
 
@@ -112,19 +194,44 @@ class PatternEvaluator:
     # Default timeout per task in seconds (3 minutes)
     DEFAULT_TASK_TIMEOUT = 180
 
-    def __init__(self, use_llm_judge: bool = False, delay_between_tasks: float = 2.0, task_timeout: float = DEFAULT_TASK_TIMEOUT):
+    def __init__(
+        self,
+        use_llm_judge: bool = False,
+        delay_between_tasks: float = 2.0,
+        task_timeout: float = DEFAULT_TASK_TIMEOUT,
+        task_concurrency: int = 1,
+        requests_per_minute: Optional[float] = None,
+    ):
         """Initialize evaluator.
 
         Args:
             use_llm_judge: Whether to use LLM-as-Judge for quality evaluation
-            delay_between_tasks: Delay in seconds between tasks to avoid rate limits
+            delay_between_tasks: Minimum spacing in seconds between task
+                starts, to avoid rate limits.  Ignored when
+                ``requests_per_minute`` is given.
             task_timeout: Timeout in seconds per task (default: 180s / 3 minutes)
+            task_concurrency: Max number of tasks in flight at once for this
+                evaluator (default: 1, i.e. sequential).  Higher values
+                overlap LLM latency but on a local backend the per-task
+                latency metric then includes queueing time.
+            requests_per_minute: Explicit task-start rate limit.  Defaults
+                to ``60 / delay_between_tasks`` (no limit when the delay
+                is 0).
         """
         self.use_llm_judge = use_llm_judge
         self.llm_judge = LLMJudge() if use_llm_judge else None
-        self.results: List[TaskResult] = []
         self.delay_between_tasks = delay_between_tasks
         self.task_timeout = task_timeout
+        self.task_concurrency = max(1, task_concurrency)
+        # Created lazily inside the running event loop (see _get_task_semaphore).
+        self._task_semaphore: Optional[asyncio.Semaphore] = None
+
+        if requests_per_minute is None and delay_between_tasks > 0:
+            requests_per_minute = 60.0 / delay_between_tasks
+        self._rate_limiter: Optional[_TokenBucket] = (
+            _TokenBucket(requests_per_minute / 60.0)
+            if requests_per_minute else None
+        )
 
     async def evaluate_pattern(
         self,
@@ -151,20 +258,69 @@ class PatternEvaluator:
         # Initialize metrics
         metrics = PatternMetrics(pattern_name=pattern_name)
 
-        # Run original tasks
-        original_results = await self._run_tasks(
-            pattern_name, graph, test_tasks, variant="original"
-        )
+        # Run original tasks and, when requested, the perturbed variants.
+        # The two batches are independent until metric aggregation, so they
+        # share one gather; the evaluator's semaphore and rate limiter still
+        # bound how many tasks are in flight across both.
+        #
+        # Reasoning-quality judging makes blocking LLM calls, usually to the
+        # same backend as the agent.  Sequential runs (task_concurrency=1)
+        # judge only after the timed batch so the judge never skews task
+        # latency.  Concurrent runs already share the backend, so each
+        # judging job starts as its result lands but takes one of the same
+        # semaphore slots as a task run.
+        reasoning_jobs: Dict[int, asyncio.Future] = {}
+        on_result = None
+        if self.task_concurrency > 1:
+            reasoning_judge = ReasoningJudge()
+            semaphore = self._get_task_semaphore()
+
+            async def _judge_in_slot(
+                task: TestTask, result: TaskResult
+            ) -> Optional[ReasoningQualityResult]:
+                async with semaphore:
+                    return await asyncio.to_thread(
+                        compute_task_reasoning_quality, task, result, reasoning_judge
+                    )
+
+            def on_result(index: int, task: TestTask, result: TaskResult) -> None:
+                reasoning_jobs[index] = asyncio.ensure_future(
+                    _judge_in_slot(task, result)
+                )
+
+        try:
+            original_run = self._run_tasks(
+                pattern_name, graph, test_tasks, on_result=on_result
+            )
+            perturbed_results: Optional[List[TaskResult]] = None
+            if include_robustness:
+                original_results, perturbed_results = await asyncio.gather(
+                    original_run,
+                    self._run_robustness_tests(pattern_name, graph, test_tasks),
+                )
+            else:
+                original_results = await original_run
+
+            # Collect metrics from original results
+            self._collect_success_metrics(metrics.success, original_results, test_tasks)
+            self._collect_efficiency_metrics(metrics.efficiency, original_results)
+            self._collect_controllability_metrics(metrics.controllability, original_results, test_tasks)
+            self._collect_alignment_metrics(metrics.alignment, original_results, test_tasks)
+            self._collect_safety_metrics(metrics.safety, original_results, test_tasks)
+            await self._collect_cognitive_metrics(
+                metrics, original_results, test_tasks,
+                pending=(
+                    [reasoning_jobs[i] for i in range(len(original_results))]
+                    if on_result is not None else None
+                ),
+            )
+        finally:
+            # No-op on success; if the batch raised, don't leave judging
+            # jobs orphaned on the loop.
+            for job in reasoning_jobs.values():
+                job.cancel()
+            await asyncio.gather(*reasoning_jobs.values(), return_exceptions=True)
 
-        # Collect metrics from original results
-        self._collect_success_metrics(metrics.success, original_results, test_tasks)
-        self._collect_efficiency_metrics(metrics.efficiency, original_results)
-        self._collect_controllability_metrics(metrics.controllability, original_results, test_tasks)
-        self._collect_alignment_metrics(metrics.alignment, original_results, test_tasks)
-        self._collect_safety_metrics(metrics.safety, original_results, test_tasks)
-        await self._collect_cognitive_metrics(
-            metrics, original_results, test_tasks
-        )
         self._collect_cognitive_safety_metrics(
             metrics, original_results, test_tasks
         )
@@ -172,18 +328,11 @@ class PatternEvaluator:
         # Calculate original success rate for robustness
         metrics.robustness.original_success_rate = metrics.success.success_rate()
 
-        # Run robustness tests
-        if include_robustness:
-            perturbed_results = await self._run_robustness_tests(
-                pattern_name, graph, test_tasks
-            )
-
-            # Collect robustness metrics
+        # Collect robustness metrics
+        if perturbed_results is not None:
             self._collect_robustness_metrics(
                 metrics.robustness, original_results, perturbed_results
             )
-        else:
-            pass
 
 
         # Phase D2: Pre-compute controllability data (without resource_efficiency,
@@ -242,34 +391,161 @@ class PatternEvaluator:
         pattern_name: str,
         graph,
         tasks: List[TestTask],
-        variant: str = "original",
+        prompts: Optional[List[str]] = None,
+        on_result: Optional[Callable[[int, TestTask, TaskResult], None]] = None,
     ) -> List[TaskResult]:
-        """Run a list of tasks on a pattern."""
-        results = []
-
-        for i, task in enumerate(tasks, 1):
-            prompt = task.prompt
-            if variant == "perturbed" and task.get_perturbations():
-                # Use first perturbation
-                prompt = task.get_perturbations()[0]
+        """Run a list of tasks on a pattern.
 
-            # Wrap prompt with evaluation format instructions
-            prompt = self._wrap_prompt_for_evaluation(prompt, task)
-
-            result = await self._run_single_task(pattern_name, graph, task, prompt)
-            results.append(result)
-
-            # Display strict evaluation result
-
-            # If lenient result differs, show it as well
-            if result.lenient_judge_success != result.judge_success:
-                pass
-
-            # Add delay between tasks to avoid rate limits
-            if i < len(tasks) and self.delay_between_tasks > 0:
-                await asyncio.sleep(self.delay_between_tasks)
+        Args:
+            pattern_name: Name of the pattern being evaluated
+            graph: Compiled LangGraph graph
+            tasks: Tasks to run
+            prompts: Raw prompts parallel to ``tasks`` (e.g. perturbed
+                variants); defaults to each task's own prompt
+            on_result: Called with ``(index, task, result)`` as each task
+                finishes, for work that should overlap with later tasks
+        """
+        if prompts is None:
+            prompts = [task.prompt for task in tasks]
+
+        # Wrap prompt with evaluation format instructions
+        jobs = [
+            (task, self._wrap_prompt_for_evaluation(prompt, task))
+            for task, prompt in zip(tasks, prompts)
+        ]
+        return await self._run_jobs(pattern_name, graph, jobs, on_result)
+
+    def _get_task_semaphore(self) -> asyncio.Semaphore:
+        """Return the per-evaluator semaphore bounding in-flight tasks."""
+        if self._task_semaphore is None:
+            self._task_semaphore = asyncio.Semaphore(self.task_concurrency)
+        return self._task_semaphore
+
+    async def _run_jobs(
+        self,
+        pattern_name: str,
+        graph,
+        jobs: List[Tuple[TestTask, str]],
+        on_result: Optional[Callable[[int, TestTask, TaskResult], None]] = None,
+    ) -> List[TaskResult]:
+        """Run ``(task, wrapped_prompt)`` jobs through a bounded worker pool.
+
+        A fixed pool of ``task_concurrency`` workers drains a bounded
+        ``asyncio.Queue`` fed by a producer, so only a handful of task
+        coroutines exist at any time regardless of suite size.  Workers also
+        share the evaluator-wide semaphore, which keeps the original and
+        perturbed batches within ``task_concurrency`` combined, and task
+        starts are paced by the token-bucket rate limiter.  Results are
+        written by index, so they come back in job order; ``on_result``
+        fires as each one lands.
+        """
+        if not jobs:
+            return []
+
+        semaphore = self._get_task_semaphore()
+        limiter = self._rate_limiter
+        n_workers = min(self.task_concurrency, len(jobs))
+        queue: asyncio.Queue = asyncio.Queue(maxsize=n_workers * 2)
+        results: List[Optional[TaskResult]] = [None] * len(jobs)
+        errors: List[BaseException] = []
+
+        async def _worker() -> None:
+            while True:
+                index, task, prompt = await queue.get()
+                try:
+                    async with semaphore:
+                        if limiter is not None:
+                            await limiter.acquire()
+                        result = await self._run_single_task(
+                            pattern_name, graph, task, prompt
+                        )
+                    results[index] = result
+                    # Per-task progress goes through logging (no-op unless a
+                    # handler is enabled) rather than blocking stdout writes.
+                    logger.debug(
+                        "%s %s: success=%s judge=%s latency=%.2fs%s",
+                        pattern_name, task.id, result.success, result.judge_success,
+                        result.latency, f" error={result.error}" if result.error else "",
+                    )
+                    if on_result is not None:
+                        on_result(index, task, result)
+                except Exception as exc:
+                    # Keep draining the queue; re-raised once the batch ends.
+                    errors.append(exc)
+                finally:
+                    queue.task_done()
 
-        return results
+        workers = [asyncio.ensure_future(_worker()) for _ in range(n_workers)]
+        try:
+            for index, (task, prompt) in enumerate(jobs):
+                await queue.put((index, task, prompt))
+            await queue.join()
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+        if errors:
+            raise errors[0]
+        return results  # type: ignore[return-value]
+
+    async def _invoke_graph(
+        self, graph, payload: Dict[str, Any], timeout: float
+    ) -> Any:
+        """Run ``graph`` on ``payload`` within ``timeout`` seconds.
+
+        Compiled LangGraph graphs expose ``ainvoke``, which runs on the
+        event loop (sync nodes are dispatched to the loop's executor), so
+        concurrent tasks do not each pin a dedicated thread.  Objects with
+        only ``invoke`` fall back to a daemon thread.  On timeout the async
+        run is cancelled, which stops async nodes (and their in-flight async
+        HTTP calls) at their next await.  Cancellation cannot interrupt sync
+        nodes: a node already running in an executor thread -- e.g. ToT and
+        the custom patterns, which call ``llm.invoke`` -- keeps its thread
+        and connection until that call returns; only the graph's later steps
+        are skipped.
+
+        Raises:
+            _TaskTimeout: If the run does not finish within ``timeout``.
+        """
+        if hasattr(graph, "ainvoke"):
+            run = asyncio.ensure_future(graph.ainvoke(payload))
+            done, _ = await asyncio.wait({run}, timeout=timeout)
+            if not done:
+                run.cancel()
+                with contextlib.suppress(asyncio.CancelledError, Exception):
+                    await run
+                raise _TaskTimeout()
+            # Re-raises any exception from inside the graph run.
+            return run.result()
+
+        # Fallback: daemon=True ensures the thread won't block process exit
+        # if it's still running after a timeout (the underlying
+        # graph.invoke / LLM HTTP call cannot be forcibly cancelled from
+        # Python, so a non-daemon thread would keep the process alive).
+        response_holder: List[Any] = []  # [response] on success
+        error_holder: List[Exception] = []  # [exception] on failure
+
+        def _invoke():
+            try:
+                response_holder.append(graph.invoke(payload))
+            except Exception as exc:
+                error_holder.append(exc)
+
+        worker = threading.Thread(target=_invoke, daemon=True)
+        worker.start()
+        # Join off the event loop so concurrent tasks keep progressing.
+        await asyncio.to_thread(worker.join, timeout)
+
+        if worker.is_alive():
+            # Thread still running — treat as timeout.
+            # The daemon thread will be killed when the process exits.
+            raise _TaskTimeout()
+
+        # Thread finished — check for errors raised inside the thread
+        if error_holder:
+            raise error_holder[0]
+        return response_holder[0]
 
     async def _run_single_task(
         self,
@@ -287,54 +563,30 @@ class PatternEvaluator:
         )
 
         try:
-            # Execute task with timeout using a daemon thread.
-            # daemon=True ensures the thread won't block process exit if it's
-            # still running after an asyncio timeout (the underlying
-            # graph.invoke / LLM HTTP call cannot be forcibly cancelled from
-            # Python, so a non-daemon thread would keep the process alive).
             start_time = time.time()
+            payload = {
+                "messages": [{"role": "user", "content": prompt}],
+                "evaluation_mode": True  # Clean output for evaluation
+            }
 
-            response_holder: List[Any] = []  # [response] on success
-            error_holder: List[Exception] = []  # [exception] on failure
-
-            def _invoke():
-                try:
-                    resp = graph.invoke(
-                        {
-                            "messages": [{"role": "user", "content": prompt}],
-                            "evaluation_mode": True  # Clean output for evaluation
-                        }
-                    )
-                    response_holder.append(resp)
-                except Exception as exc:
-                    error_holder.append(exc)
-
-            worker = threading.Thread(target=_invoke, daemon=True)
-            worker.start()
-            worker.join(timeout=self.task_timeout)
-
-            if worker.is_alive():
-                # Thread still running — treat as timeout.
-                # The daemon thread will be killed when the process exits.
+            # Per-task override (e.g. long planning tasks), else the evaluator default.
+            timeout = task.timeout or self.task_timeout
+            try:
+                response = await self._invoke_graph(graph, payload, timeout)
+            except _TaskTimeout:
                 end_time = time.time()
                 result.start_time = start_time
                 result.end_time = end_time
                 result.latency = end_time - start_time
                 result.success = False
-                result.error = f"Task timed out after {self.task_timeout}s (>{self.task_timeout/60:.0f} min)"
+                result.error = f"Task timed out after {timeout}s (>{timeout/60:.0f} min)"
                 result.output = ""
                 result.judge_success = False
-                result.judge_message = f"Timeout: task did not complete within {self.task_timeout/60:.0f} minutes"
+                result.judge_message = f"Timeout: task did not complete within {timeout/60:.0f} minutes"
                 result.lenient_judge_success = False
-                result.lenient_judge_message = f"Timeout: task did not complete within {self.task_timeout/60:.0f} minutes"
+                result.lenient_judge_message = f"Timeout: task did not complete within {timeout/60:.0f} minutes"
                 return result
 
-            # Thread finished — check for errors raised inside the thread
-            if error_holder:
-                raise error_holder[0]
-
-            response = response_holder[0]
-
             end_time = time.time()
 
             # Extract output
@@ -370,34 +622,24 @@ class PatternEvaluator:
             result.total_tokens = trace.total_tokens
             result.tokens_estimated = trace.any_tokens_estimated
 
-            # Fallback: if trace tokens are all zero, use old estimation
+            # Fallback: if trace tokens are all zero, estimate from the text
             if result.total_tokens == 0:
-                result.input_tokens = len(prompt) // 4
-                result.output_tokens = len(result.output) // 4
+                result.input_tokens = estimate_tokens(prompt)
+                result.output_tokens = estimate_tokens(result.output)
                 result.total_tokens = result.input_tokens + result.output_tokens
                 result.tokens_estimated = True
 
-            # Judge output - Strict evaluation (exact match)
-            judge_success, judge_msg = Judge.evaluate(
-                result.output,
-                task.ground_truth,
-                task.judge,
-                task.schema,
-                lenient=False  # Strict mode
-            )
+            # Judge output - strict (exact match) and lenient (with answer
+            # extraction) verdicts from one fused, memoised call.
+            (
+                judge_success,
+                judge_msg,
+                lenient_judge_success,
+                lenient_judge_msg,
+            ) = _judge_with_cache(result.output, task)
 
             result.judge_success = judge_success
             result.judge_message = judge_msg
-
-            # Judge output - Lenient evaluation (with answer extraction)
-            lenient_judge_success, lenient_judge_msg = Judge.evaluate(
-                result.output,
-                task.ground_truth,
-                task.judge,
-                task.schema,
-                lenient=True  # Lenient mode with answer extraction
-            )
-
             result.lenient_judge_success = lenient_judge_success
             result.lenient_judge_message = lenient_judge_msg
 
@@ -405,6 +647,10 @@ class PatternEvaluator:
             if task.schema:
                 result.schema_compliant = judge_success
 
+            # Verdicts are in; keep only a bounded prefix for the downstream
+            # metrics so long generations are not retained per result.
+            result.output = result.output[:MAX_OUTPUT_CHARS]
+
         except Exception as e:
             result.success = False
             result.error = str(e)
@@ -420,24 +666,15 @@ class PatternEvaluator:
         tasks: List[TestTask],
     ) -> List[TaskResult]:
         """Run robustness tests with ALL perturbations for each task."""
-        perturbed_results: List[TaskResult] = []
-
+        # Expand perturbations once into parallel (task, prompt) lists.
+        variant_tasks: List[TestTask] = []
+        variant_prompts: List[str] = []
         for task in tasks:
-            perturbations = task.get_perturbations()
-            if not perturbations:
-                continue
-
-            for prompt_variant in perturbations:
-                wrapped_prompt = self._wrap_prompt_for_evaluation(prompt_variant, task)
-                result = await self._run_single_task(
-                    pattern_name, graph, task, wrapped_prompt
-                )
-                perturbed_results.append(result)
+            for prompt_variant in task.get_perturbations():
+                variant_tasks.append(task)
+                variant_prompts.append(prompt_variant)
 
-                if self.delay_between_tasks > 0:
-                    await asyncio.sleep(self.delay_between_tasks)
-
-        return perturbed_results
+        return await self._run_tasks(pattern_name, graph, variant_tasks, variant_prompts)
 
     def _collect_success_metrics(
         self,
@@ -446,26 +683,38 @@ class PatternEvaluator:
         tasks: List[TestTask],
     ):
         """Collect success dimension metrics (both strict and lenient)."""
+        # Single pass over results: overall and per-category/complexity tallies.
+        strict_ok = lenient_ok = 0
+        cat_total: Counter = Counter()
+        cat_ok: Counter = Counter()
+        comp_total: Counter = Counter()
+        comp_ok: Counter = Counter()
+        for r in results:
+            cat_total[r.task_category] += 1
+            comp_total[r.task_complexity] += 1
+            if r.judge_success:
+                strict_ok += 1
+                cat_ok[r.task_category] += 1
+                comp_ok[r.task_complexity] += 1
+            if r.lenient_judge_success:
+                lenient_ok += 1
+
         success_metrics.total_tasks = len(results)
-        success_metrics.successful_tasks = sum(1 for r in results if r.judge_success)
-        success_metrics.lenient_successful_tasks = sum(1 for r in results if r.lenient_judge_success)
-        success_metrics.failed_tasks = sum(1 for r in results if not r.judge_success)
-
-        # By category
-        categories = set(task.category for task in tasks)
-        for category in categories:
-            cat_results = [r for r in results if r.task_category == category]
-            if cat_results:
-                success_rate = sum(1 for r in cat_results if r.judge_success) / len(cat_results)
-                success_metrics.success_by_category[category] = success_rate
-
-        # By complexity
-        complexities = set(task.complexity for task in tasks)
-        for complexity in complexities:
-            comp_results = [r for r in results if r.task_complexity == complexity]
-            if comp_results:
-                success_rate = sum(1 for r in comp_results if r.judge_success) / len(comp_results)
-                success_metrics.success_by_complexity[complexity] = success_rate
+        success_metrics.successful_tasks = strict_ok
+        success_metrics.lenient_successful_tasks = lenient_ok
+        success_metrics.failed_tasks = len(results) - strict_ok
+
+        # Only categories/complexities present in the task set are reported.
+        categories = {task.category for task in tasks}
+        complexities = {task.complexity for task in tasks}
+        success_metrics.success_by_category.update({
+            category: cat_ok[category] / n
+            for category, n in cat_total.items() if category in categories
+        })
+        success_metrics.success_by_complexity.update({
+            complexity: comp_ok[complexity] / n
+            for complexity, n in comp_total.items() if complexity in complexities
+        })
 
     def _collect_efficiency_metrics(
         self,
@@ -475,16 +724,21 @@ class PatternEvaluator:
         """Collect efficiency dimension metrics."""
         for result in results:
             if result.success:
-                efficiency_metrics.latencies.append(result.latency)
-                efficiency_metrics.input_tokens.append(result.input_tokens)
-                efficiency_metrics.output_tokens.append(result.output_tokens)
-                efficiency_metrics.step_counts.append(result.step_count)
-                efficiency_metrics.tool_call_counts.append(result.tool_call_count)
+                efficiency_metrics.record(
+                    result.latency,
+                    result.input_tokens,
+                    result.output_tokens,
+                    result.step_count,
+                    result.tool_call_count,
+                )
                 if result.trace:
                     efficiency_metrics.tao_cycle_counts.append(result.trace.tao_cycles)
                     if result.tokens_estimated:
                         efficiency_metrics.any_tokens_estimated = True
 
+        # Collection is complete; summaries/reports reuse the aggregates.
+        efficiency_metrics.finalize()
+
     def _collect_robustness_metrics(
         self,
         robustness_metrics: RobustnessMetrics,
@@ -565,8 +819,14 @@ class PatternEvaluator:
         json_tasks = [t for t in tasks if t.schema is not None]
         controllability_metrics.total_json_tasks = len(json_tasks)
 
+        # Index once so the per-result / per-task lookups below are O(1).
+        task_lookup = {t.id: t for t in tasks}
+        results_by_id: Dict[str, TaskResult] = {}
+        for result in results:
+            results_by_id.setdefault(result.task_id, result)
+
         for result in results:
-            task = next((t for t in tasks if t.id == result.task_id), None)
+            task = task_lookup.get(result.task_id)
             if task and task.schema:
                 if result.schema_compliant:
                     controllability_metrics.schema_compliant_tasks += 1
@@ -575,14 +835,12 @@ class PatternEvaluator:
         tool_tasks = [t for t in tasks if t.policy and "tool_whitelist" in t.policy]
         controllability_metrics.total_tool_tasks = len(tool_tasks)
 
-        # Build task lookup for whitelist checking
-        task_lookup = {t.id: t for t in tasks}
         compliant_count = 0
         total_unauthorized = 0
 
         for task_def in tool_tasks:
             whitelist = set(task_def.policy["tool_whitelist"])
-            result = next((r for r in results if r.task_id == task_def.id), None)
+            result = results_by_id.get(task_def.id)
             if result is None or result.trace is None:
                 compliant_count += 1  # No trace = no evidence of violation
                 continue
@@ -873,6 +1131,7 @@ class PatternEvaluator:
         metrics: PatternMetrics,
         results: List[TaskResult],
         tasks: List[TestTask],
+        pending: Optional[List[Awaitable[Optional[ReasoningQualityResult]]]] = None,
     ):
         """Collect Dim1 Reasoning Quality metrics + Phase F bridge.
 
@@ -884,7 +1143,10 @@ class PatternEvaluator:
         Phase F).
 
         Judge calls are blocking I/O against Ollama, so we run them in
-        parallel via ``asyncio.gather`` + ``asyncio.to_thread``.
+        parallel via ``asyncio.gather`` + ``asyncio.to_thread``.  When
+        ``evaluate_pattern`` has already started them as tasks finished,
+        the in-flight jobs are passed as ``pending`` (parallel to
+        ``results``) and simply awaited here.
 
         Phase F bridge (this method's second responsibility): the per-task
         ``ReasoningQualityResult`` list and per-task agent outputs are
@@ -896,21 +1158,24 @@ class PatternEvaluator:
         feed into ``inject_self_consistency_scores()``.
         """
         cognitive_metrics = metrics.cognitive
-        task_lookup = {t.id: t for t in tasks}
 
-        # Build a single ReasoningJudge so the underlying chat model
-        # client is shared across tasks for one pattern run.
-        judge = ReasoningJudge()
+        if pending is None:
+            task_lookup = {t.id: t for t in tasks}
 
-        async def _eval_one(result: TaskResult) -> Optional[ReasoningQualityResult]:
-            task = task_lookup.get(result.task_id)
-            if task is None:
-                return None
-            return await asyncio.to_thread(
-                compute_task_reasoning_quality, task, result, judge
-            )
+            # Build a single ReasoningJudge so the underlying chat model
+            # client is shared across tasks for one pattern run.
+            judge = ReasoningJudge()
+
+            async def _eval_one(result: TaskResult) -> Optional[ReasoningQualityResult]:
+                task = task_lookup.get(result.task_id)
+                if task is None:
+                    return None
+                return await asyncio.to_thread(
+                    compute_task_reasoning_quality, task, result, judge
+                )
 
-        gathered = await asyncio.gather(*(_eval_one(r) for r in results))
+            pending = [_eval_one(r) for r in results]
+        gathered = await asyncio.gather(*pending)
         per_task = [rq for rq in gathered if rq is not None]
 
         aggregated = aggregate_cognitive_metrics(per_task)
@@ -994,14 +1259,18 @@ def _compute_success_by_complexity(
     original_results: List[TaskResult],
 ) -> Dict[str, float]:
     """Compute success rate grouped by task complexity level."""
-    result: Dict[str, float] = {}
-
-    for level in ("simple", "medium", "complex"):
-        subset = [r for r in original_results if r.task_complexity == level]
-        if subset:
-            result[level] = sum(1 for r in subset if r.judge_success) / len(subset)
-
-    return result
+    totals: Counter = Counter()
+    passed: Counter = Counter()
+    for r in original_results:
+        totals[r.task_complexity] += 1
+        if r.judge_success:
+            passed[r.task_complexity] += 1
+
+    return {
+        level: passed[level] / totals[level]
+        for level in ("simple", "medium", "complex")
+        if totals[level]
+    }
 
 
 def _compute_complexity_decline(success_by_complexity: Dict[str, float]) -> float:
@@ -1023,6 +1292,7 @@ async def evaluate_multiple_patterns(
     task_timeout: float = PatternEvaluator.DEFAULT_TASK_TIMEOUT,
     parallel: bool = True,
     max_concurrency: int = 2,
+    task_concurrency: int = 1,
 ) -> Dict[str, PatternMetrics]:
     """Evaluate multiple patterns and compare.
 
@@ -1035,45 +1305,37 @@ async def evaluate_multiple_patterns(
         parallel: Whether to run patterns in parallel (default: True)
         max_concurrency: Max number of patterns to run concurrently (default: 2).
             Prevents resource contention on local LLM backends like Ollama.
+        task_concurrency: Max number of tasks in flight per pattern
+            (default: 1, sequential within a pattern).
 
     Returns:
         Dict of {pattern_name: PatternMetrics}
     """
-    results = {}
-
-    if parallel:
-        # Use semaphore to limit concurrency — prevents Ollama resource contention
-        semaphore = asyncio.Semaphore(max_concurrency)
-
-        async def _eval_one(name: str, graph) -> tuple:
-            async with semaphore:
+    # Sequential mode is the same pipeline with a concurrency limit of 1.
+    # Each pattern gets its own evaluator so no per-run state (semaphore,
+    # rate limiter) is shared between concurrently evaluated patterns.
+    semaphore = asyncio.Semaphore(max_concurrency if parallel else 1)
+
+    async def _eval_one(name: str, graph) -> PatternMetrics:
+        async with semaphore:
+            if parallel:
                 print(f"  [Parallel] Starting evaluation: {name}")
-                evaluator = PatternEvaluator(
-                    delay_between_tasks=delay_between_tasks, task_timeout=task_timeout
-                )
-                metrics = await evaluator.evaluate_pattern(
-                    name, graph, test_tasks, include_robustness
-                )
-                print(f"  [Parallel] Completed evaluation: {name}")
-                return name, metrics
-
-        tasks = [_eval_one(name, graph) for name, graph in patterns.items()]
-        completed = await asyncio.gather(*tasks)
-        for name, metrics in completed:
-            results[name] = metrics
-    else:
-        # Sequential fallback
-        evaluator = PatternEvaluator(
-            delay_between_tasks=delay_between_tasks, task_timeout=task_timeout
-        )
-        for pattern_name, graph in patterns.items():
+            evaluator = PatternEvaluator(
+                delay_between_tasks=delay_between_tasks,
+                task_timeout=task_timeout,
+                task_concurrency=task_concurrency,
+            )
             metrics = await evaluator.evaluate_pattern(
-                pattern_name, graph, test_tasks, include_robustness
+                name, graph, test_tasks, include_robustness
             )
-            results[pattern_name] = metrics
+            if parallel:
+                print(f"  [Parallel] Completed evaluation: {name}")
+            return metrics
 
-    # Print comparison
-    MetricsAggregator.compare_patterns(results)
+    coros = {name: _eval_one(name, graph) for name, graph in patterns.items()}
+    results: Dict[str, PatternMetrics] = dict(
+        zip(coros.keys(), await asyncio.gather(*coros.values()))
+    )
 
     # --- Phase D2: Compute controllability results (cross-pattern) ---
     # Collect avg tokens per pattern for resource efficiency normalisation
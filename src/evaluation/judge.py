@@ -3,11 +3,270 @@
 Supports 3 modes: exact, json, regex.
 """
 
+import asyncio
+import contextlib
+import hashlib
 import json
+import multiprocessing
+import os
 import re
-from typing import Any, Dict, Optional, Tuple
+import tempfile
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache, partial
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Pattern,
+    Tuple,
+    Union,
+)
+
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
+
+# Patterns used on every judged output, compiled once at import.
+_NUM_GT_RE = re.compile(r'^\d+(\.\d+)?$')
+_NUM_EXTRACT_RE = re.compile(r'\b(\d+(?:\.\d+)?)\b')
+_DATE_GT_RE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+_DATE_EXTRACT_RE = re.compile(r'\b(\d{4}-\d{2}-\d{2})\b')
+_TRAILING_PUNCT_RE = re.compile(r'[\.\*\!]+$')
+_SIGNED_NUM_RE = re.compile(r"-?\d+(?:\.\d+)?")
+# Answer-leading phrases stripped (in order) by lenient extraction.  They
+# carry optional words and whitespace runs, so they stay regexes rather
+# than literal startswith() prefixes.
+_ANSWER_PREFIX_PATTERNS = (
+    r"^(?:the\s+)?answer\s+is[:\s]+",
+    r"^it\s+is[:\s]+",
+    r"^(?:the\s+)?result\s+is[:\s]+",
+    r"^this\s+is[:\s]+",
+    r"^(?:the\s+)?(?:shortest|tallest|largest|smallest)\s+(?:is|person\s+is)[:\s]+",
+    r"^based\s+on\s+.*?[,\.]\s*",
+    r"^\*\*",  # Strip markdown bold markers
+)
+_ANSWER_PREFIX_RES = tuple(
+    re.compile(pattern, re.IGNORECASE) for pattern in _ANSWER_PREFIX_PATTERNS
+)
+# All prefixes as one alternation.  If none matches at the start, the
+# ordered strip chain cannot change the text, so it is skipped entirely.
+_ANY_ANSWER_PREFIX_RE = re.compile(
+    "|".join(f"(?:{pattern})" for pattern in _ANSWER_PREFIX_PATTERNS),
+    re.IGNORECASE,
+)
+_LONG_DIGITS_RE = re.compile(r'\d{19}')
+_JSON_START_RE = re.compile(r'[\[{]')
+_JSON_DECODER = json.JSONDecoder()
+# Items per worker round-trip in Judge.evaluate_batch; batches no larger
+# than one chunk are judged in-process.
+_BATCH_CHUNKSIZE = 256
+
+
+def _extract_number(gt_re: Pattern[str], output: str) -> Optional[str]:
+    """Numeric ground truth: the ground-truth number itself, else the first number."""
+    # Try to find the exact ground truth number in output first
+    exact_match = gt_re.search(output)
+    if exact_match:
+        return exact_match.group(0)
+    # Fallback: extract first number from output
+    match = _NUM_EXTRACT_RE.search(output)
+    return match.group(1) if match else None
+
+
+def _extract_date(output: str) -> Optional[str]:
+    """ISO-date ground truth: the first YYYY-MM-DD in the output."""
+    match = _DATE_EXTRACT_RE.search(output)
+    return match.group(1) if match else None
+
+
+def _extract_word(gt_re: Pattern[str], single_word: bool, output: str) -> Optional[str]:
+    """Short word/phrase ground truth: the phrase itself, else the cleaned answer."""
+    # First, check if ground_truth appears directly in output (case-insensitive)
+    gt_match = gt_re.search(output)
+    if gt_match:
+        return gt_match.group(0)
+
+    # Remove common prefix phrases
+    cleaned = output
+    if _ANY_ANSWER_PREFIX_RE.match(cleaned):
+        for prefix_re in _ANSWER_PREFIX_RES:
+            cleaned = prefix_re.sub("", cleaned).strip()
+
+    # Remove trailing punctuation and markdown
+    cleaned = _TRAILING_PUNCT_RE.sub('', cleaned).strip()
+
+    # If cleaned result is short enough, use it
+    if cleaned and len(cleaned) < 50:
+        # Get first line only
+        first_line = cleaned.split('\n')[0].strip()
+        if first_line:
+            return first_line
+
+    # Fallback: get first word
+    if single_word:
+        words = cleaned.split()
+        if words:
+            return words[0].rstrip('.,!?:;*')
+    return None
+
+
+def _no_extraction(output: str) -> Optional[str]:
+    return None
+
+
+@lru_cache(maxsize=8192)
+def _classify_gt(ground_truth_str: str) -> Callable[[str], Optional[str]]:
+    """Pick the lenient answer extractor for a ground truth, once per value.
+
+    The extractor returns None when it finds nothing, in which case the
+    output is judged as-is.
+    """
+    if _NUM_GT_RE.match(ground_truth_str):
+        gt_re = re.compile(r'\b' + re.escape(ground_truth_str) + r'\b')
+        return partial(_extract_number, gt_re)
+    if _DATE_GT_RE.match(ground_truth_str):
+        return _extract_date
+    if len(ground_truth_str) < 30:
+        gt_re = re.compile(re.escape(ground_truth_str), re.IGNORECASE)
+        return partial(_extract_word, gt_re, ' ' not in ground_truth_str)
+    return _no_extraction
+
+
+@lru_cache(maxsize=256)
+def _compile_user_pattern(pattern: str) -> Pattern[str]:
+    """Compile a task-supplied regex once (raises ``re.error`` if invalid)."""
+    return re.compile(pattern)
+
+
+try:  # Optional accelerator: faster parsing of agent JSON outputs.
+    import orjson
+except ImportError:
+    orjson = None
+
+try:  # Optional accelerator: code-generated validators for the pass path.
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
+# Compiled schema validators keyed by a digest of the canonical schema JSON.
+# The suite reuses a handful of schemas, so check_schema() and validator
+# construction run once per schema instead of once per judged output.
+_VALIDATOR_CACHE: Dict[str, Any] = {}
+# fastjsonschema functions per schema; None when the schema uses features
+# fastjsonschema cannot compile (jsonschema alone is used then).
+_FAST_VALIDATOR_CACHE: Dict[str, Optional[Callable[[Any], Any]]] = {}
+
+
+def _json_loads(text: str) -> Any:
+    """``json.loads`` semantics, via orjson when it is installed.
+
+    orjson rejects ``NaN``/``Infinity`` (retried with ``json``; its
+    ``JSONDecodeError`` subclasses the stdlib one) and turns integers
+    beyond 64 bits into floats, so texts with long digit runs go straight
+    to ``json``.
+    """
+    if orjson is not None and not _LONG_DIGITS_RE.search(text):
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
+
+
+def _schema_key(schema: Dict[str, Any]) -> str:
+    return hashlib.blake2b(
+        json.dumps(schema, sort_keys=True).encode("utf-8"), digest_size=16
+    ).hexdigest()
+
+
+def _get_validator(schema: Dict[str, Any], key: Optional[str] = None) -> Any:
+    """Return a cached validator for ``schema`` (draft chosen like ``validate``)."""
+    key = key or _schema_key(schema)
+    validator = _VALIDATOR_CACHE.get(key)
+    if validator is None:
+        cls = validator_for(schema)
+        cls.check_schema(schema)
+        validator = _VALIDATOR_CACHE[key] = cls(schema)
+    return validator
+
+
+def _get_fast_validator(schema: Dict[str, Any], key: str) -> Optional[Callable[[Any], Any]]:
+    """Return a cached fastjsonschema function, or None if unavailable."""
+    if fastjsonschema is None:
+        return None
+    if key not in _FAST_VALIDATOR_CACHE:
+        try:
+            _FAST_VALIDATOR_CACHE[key] = fastjsonschema.compile(schema)
+        except fastjsonschema.JsonSchemaDefinitionException:
+            _FAST_VALIDATOR_CACHE[key] = None
+    return _FAST_VALIDATOR_CACHE[key]
+
+
+def _schema_error(
+    instance: Any, schema: Dict[str, Any], key: Optional[str] = None
+) -> Optional[str]:
+    """Return the schema violation message for ``instance``, or None if valid.
+
+    When fastjsonschema is installed, valid instances are accepted by its
+    generated function alone.  Rejections are re-checked with jsonschema,
+    which stays authoritative and supplies the same ``best_match`` message
+    as ``jsonschema.validate()``, so verdicts and explanations do not
+    depend on whether the accelerator is present.
+    """
+    key = key or _schema_key(schema)
+    fast = _get_fast_validator(schema, key)
+    if fast is not None:
+        try:
+            fast(instance)
+            return None
+        except fastjsonschema.JsonSchemaValueException:
+            pass
+    error = best_match(_get_validator(schema, key).iter_errors(instance))
+    return error.message if error is not None else None
+
+
+@dataclass(frozen=True)
+class CompiledJudgeConfig:
+    """A task's judge config (and schema) preprocessed once for reuse.
+
+    Built by :meth:`Judge.compile_config`; accepted anywhere a judge
+    config dict is.  ``get`` reads the original config, so explanations
+    are identical to judging with the dict.
+    """
+
+    mode: str
+    ignore_fields: FrozenSet[str] = frozenset()
+    schema: Optional[Dict[str, Any]] = field(default=None, compare=False)
+    schema_key: Optional[str] = None
+    options: Dict[str, Any] = field(default_factory=dict, compare=False)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Read ``key`` from the original judge config, like ``dict.get``."""
+        return self.options.get(key, default)
+
+
+# Compiled configs keyed by the repr of (config, schema).
+_COMPILED_CONFIG_CACHE: Dict[str, CompiledJudgeConfig] = {}
+
+
+def _resolve_schema(
+    judge_config: Any, schema: Optional[Dict[str, Any]]
+) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """Return (schema, precomputed schema key) for a dict or compiled config."""
+    if isinstance(judge_config, CompiledJudgeConfig) and schema is None:
+        return judge_config.schema, judge_config.schema_key
+    return schema, None
 
-from jsonschema import ValidationError, validate
+
+class _JSONJudgeError(ValueError):
+    """JSON parse / schema failure carrying the judge explanation."""
 
 
 class Judge:
@@ -17,22 +276,28 @@ class Judge:
     def evaluate(
         output: str,
         ground_truth: Any,
-        judge_config: Dict[str, Any],
+        judge_config: Union[Dict[str, Any], CompiledJudgeConfig],
         schema: Optional[Dict[str, Any]] = None,
-        lenient: bool = False
+        lenient: bool = False,
+        need_explanation: bool = True,
     ) -> Tuple[bool, str]:
         """Evaluate output against ground truth.
 
         Args:
             output: Agent output (string)
             ground_truth: Expected answer
-            judge_config: Judge configuration with 'mode' field
+            judge_config: Judge configuration with 'mode' field, as a dict
+                or a :class:`CompiledJudgeConfig`
             schema: Optional JSON schema for validation
             lenient: If True, extract answer from output before judging
+            need_explanation: If False, successes return an empty
+                explanation without formatting it (failures still explain)
 
         Returns:
             Tuple of (success: bool, explanation: str)
         """
+        schema, schema_key = _resolve_schema(judge_config, schema)
+
         # Apply lenient extraction if requested
         if lenient:
             output = Judge._extract_answer(output, ground_truth, judge_config)
@@ -40,11 +305,16 @@ class Judge:
         mode = judge_config.get("mode", "exact")
 
         if mode == "exact":
-            return Judge._judge_exact(output, ground_truth, lenient=lenient)
+            return Judge._judge_exact(
+                output, ground_truth, lenient=lenient, explain=need_explanation
+            )
         elif mode == "json":
-            return Judge._judge_json(output, ground_truth, judge_config, schema, lenient=lenient)
+            return Judge._judge_json(
+                output, ground_truth, judge_config, schema, lenient=lenient,
+                schema_key=schema_key, explain=need_explanation,
+            )
         elif mode == "regex":
-            return Judge._judge_regex(output, judge_config)
+            return Judge._judge_regex(output, judge_config, explain=need_explanation)
         elif mode == "lenient":
             # Phase B2: numeric-tolerant judge for tasks like B5 where
             # the ground truth is a signed number and we want to accept
@@ -54,15 +324,128 @@ class Judge:
             # before extracting/comparing the *last* signed numeric
             # token in the output, instead of trusting the model to
             # emit a clean string.
-            return Judge._judge_lenient_numeric(output, ground_truth)
+            return Judge._judge_lenient_numeric(
+                output, ground_truth, explain=need_explanation
+            )
         else:
             return False, f"Unknown judge mode: {mode}"
 
+    @staticmethod
+    def compile_config(
+        judge_config: Union[Dict[str, Any], CompiledJudgeConfig],
+        schema: Optional[Dict[str, Any]] = None,
+    ) -> CompiledJudgeConfig:
+        """Preprocess a task's judge config and schema once.
+
+        The result can be passed to :meth:`evaluate` / :meth:`evaluate_both`
+        in place of the dict (with ``schema`` omitted) and skips rebuilding
+        the ignore set and re-hashing the schema on every call.
+        """
+        if isinstance(judge_config, CompiledJudgeConfig):
+            return judge_config
+        cache_key = repr((judge_config, schema))
+        compiled = _COMPILED_CONFIG_CACHE.get(cache_key)
+        if compiled is None:
+            compiled = _COMPILED_CONFIG_CACHE[cache_key] = CompiledJudgeConfig(
+                mode=judge_config.get("mode", "exact"),
+                ignore_fields=frozenset(judge_config.get("ignore_fields", ())),
+                schema=schema,
+                schema_key=_schema_key(schema) if schema else None,
+                options=dict(judge_config),
+            )
+        return compiled
+
+    @staticmethod
+    def evaluate_batch(
+        items: Iterable[Tuple[Any, ...]],
+        max_workers: Optional[int] = None,
+        chunksize: int = _BATCH_CHUNKSIZE,
+        need_explanation: bool = True,
+    ) -> List[Tuple[bool, str]]:
+        """Evaluate many outputs, spreading the work over a process pool.
+
+        Args:
+            items: ``(output, ground_truth, judge_config[, schema[, lenient]])``
+                argument tuples for :meth:`evaluate`
+            max_workers: Worker processes (defaults to the CPU count); 1
+                judges everything in-process
+            chunksize: Items sent to a worker per round-trip
+            need_explanation: Passed to :meth:`evaluate`; False skips
+                formatting success explanations in headless runs
+
+        Returns:
+            ``(success, explanation)`` tuples in the order of ``items``
+        """
+        items = list(items)
+        evaluate_one = partial(_evaluate_one, need_explanation=need_explanation)
+        if max_workers == 1 or len(items) <= chunksize:
+            return [evaluate_one(item) for item in items]
+
+        # Spawned, not forked: callers may run inside an event loop with live
+        # executor threads, and forking a multi-threaded process can deadlock.
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as executor:
+            return list(executor.map(evaluate_one, items, chunksize=chunksize))
+
+    @staticmethod
+    def evaluate_both(
+        output: str,
+        ground_truth: Any,
+        judge_config: Union[Dict[str, Any], CompiledJudgeConfig],
+        schema: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[bool, str, bool, str]:
+        """Evaluate output in strict and lenient mode with shared work.
+
+        Equivalent to calling :meth:`evaluate` twice (``lenient=False``
+        then ``lenient=True``), but for ``json`` mode -- where lenient
+        answer extraction is a no-op -- the JSON extraction, parsing and
+        schema validation are done once and only the comparison differs.
+
+        In ``exact`` and ``json`` mode a strict pass implies an identical
+        lenient pass (extraction returns the already-matching text, and the
+        strict comparison is tried first), so the lenient pass is skipped.
+        ``regex`` and ``lenient`` modes always run both: lenient extraction
+        strips or rewrites the text, which can flip the verdict either way.
+
+        Returns:
+            Tuple of (strict_success, strict_explanation,
+            lenient_success, lenient_explanation)
+        """
+        mode = judge_config.get("mode", "exact")
+
+        if mode == "json":
+            schema, schema_key = _resolve_schema(judge_config, schema)
+            try:
+                parsed_output = Judge._parse_and_validate_json(output, schema, schema_key)
+            except _JSONJudgeError as e:
+                return False, str(e), False, str(e)
+            strict_ok, strict_msg = Judge._compare_json(
+                parsed_output, ground_truth, judge_config, lenient=False
+            )
+            if strict_ok:
+                return strict_ok, strict_msg, strict_ok, strict_msg
+            lenient_ok, lenient_msg = Judge._compare_json(
+                parsed_output, ground_truth, judge_config, lenient=True
+            )
+            return strict_ok, strict_msg, lenient_ok, lenient_msg
+
+        strict_ok, strict_msg = Judge.evaluate(
+            output, ground_truth, judge_config, schema, lenient=False
+        )
+        if strict_ok and mode == "exact":
+            return strict_ok, strict_msg, strict_ok, strict_msg
+        lenient_ok, lenient_msg = Judge.evaluate(
+            output, ground_truth, judge_config, schema, lenient=True
+        )
+        return strict_ok, strict_msg, lenient_ok, lenient_msg
+
     @staticmethod
     def _extract_answer(
         output: str,
         ground_truth: Any,
-        judge_config: Dict[str, Any]
+        judge_config: Union[Dict[str, Any], CompiledJudgeConfig]
     ) -> str:
         """Intelligently extract the actual answer from verbose model output.
 
@@ -98,74 +481,22 @@ class Judge:
 
         # For exact mode, infer type from ground_truth
         if ground_truth is not None:
-            ground_truth_str = str(ground_truth).strip()
-
-            # Check if ground_truth is a number
-            if re.match(r'^\d+(\.\d+)?$', ground_truth_str):
-                # Try to find the exact ground truth number in output first
-                escaped_gt = re.escape(ground_truth_str)
-                exact_match = re.search(r'\b' + escaped_gt + r'\b', output)
-                if exact_match:
-                    return exact_match.group(0)
-                # Fallback: extract first number from output
-                match = re.search(r'\b(\d+(?:\.\d+)?)\b', output)
-                if match:
-                    return match.group(1)
-
-            # Check if ground_truth is a date (YYYY-MM-DD)
-            elif re.match(r'^\d{4}-\d{2}-\d{2}$', ground_truth_str):
-                # Extract ISO date
-                match = re.search(r'\b(\d{4}-\d{2}-\d{2})\b', output)
-                if match:
-                    return match.group(1)
-
-            # Check if ground_truth is a single word or short phrase
-            elif len(ground_truth_str) < 30:
-                # First, check if ground_truth appears directly in output (case-insensitive)
-                gt_match = re.search(re.escape(ground_truth_str), output, re.IGNORECASE)
-                if gt_match:
-                    return gt_match.group(0)
-
-                # Remove common prefix phrases
-                cleaned = output
-                prefix_patterns = [
-                    r"^(?:the\s+)?answer\s+is[:\s]+",
-                    r"^it\s+is[:\s]+",
-                    r"^(?:the\s+)?result\s+is[:\s]+",
-                    r"^this\s+is[:\s]+",
-                    r"^(?:the\s+)?(?:shortest|tallest|largest|smallest)\s+(?:is|person\s+is)[:\s]+",
-                    r"^based\s+on\s+.*?[,\.]\s*",
-                    r"^\*\*",  # Strip markdown bold markers
-                ]
-                for pattern in prefix_patterns:
-                    cleaned = re.sub(pattern, "", cleaned, flags=re.IGNORECASE).strip()
-
-                # Remove trailing punctuation and markdown
-                cleaned = re.sub(r'[\.\*\!]+$', '', cleaned).strip()
-
-                # If cleaned result is short enough, use it
-                if cleaned and len(cleaned) < 50:
-                    # Get first line only
-                    first_line = cleaned.split('\n')[0].strip()
-                    if first_line:
-                        return first_line
-
-                # Fallback: get first word
-                if ' ' not in ground_truth_str:
-                    words = cleaned.split()
-                    if words:
-                        first_word = words[0].rstrip('.,!?:;*')
-                        return first_word
+            extracted = _classify_gt(str(ground_truth).strip())(output)
+            if extracted is not None:
+                return extracted
 
         # If no extraction applied, return original
         return output
 
     @staticmethod
-    def _judge_exact(output: str, ground_truth: Any, lenient: bool = False) -> Tuple[bool, str]:
+    def _judge_exact(
+        output: str, ground_truth: Any, lenient: bool = False, explain: bool = True
+    ) -> Tuple[bool, str]:
         """Exact match judge - output must exactly match ground truth.
 
         In lenient mode, also accepts case-insensitive match and
-        numeric equivalence (e.g., "20.0" == "20").
+        numeric equivalence (e.g., "20.0" == "20").  With ``explain=False``
+        matches return an empty explanation.
 
         Examples:
             "408" == "408" → True
@@ -177,17 +508,17 @@ class Judge:
 
         # Strict exact match
         if output_cleaned == ground_truth_str:
-            return True, f"Exact match: '{output_cleaned}'"
+            return True, f"Exact match: '{output_cleaned}'" if explain else ""
 
         if lenient:
             # Case-insensitive match
             if output_cleaned.lower() == ground_truth_str.lower():
-                return True, f"Lenient match (case-insensitive): '{output_cleaned}'"
+                return True, f"Lenient match (case-insensitive): '{output_cleaned}'" if explain else ""
 
             # Numeric equivalence: "20.0" == "20", "408.0" == "408"
             try:
                 if float(output_cleaned) == float(ground_truth_str):
-                    return True, f"Lenient match (numeric): {output_cleaned} == {ground_truth_str}"
+                    return True, f"Lenient match (numeric): {output_cleaned} == {ground_truth_str}" if explain else ""
             except (ValueError, TypeError):
                 pass
 
@@ -229,9 +560,11 @@ class Judge:
     def _judge_json(
         output: str,
         ground_truth: Any,
-        judge_config: Dict[str, Any],
+        judge_config: Union[Dict[str, Any], CompiledJudgeConfig],
         schema: Optional[Dict[str, Any]] = None,
-        lenient: bool = False
+        lenient: bool = False,
+        schema_key: Optional[str] = None,
+        explain: bool = True,
     ) -> Tuple[bool, str]:
         """JSON judge - parse output as JSON and validate.
 
@@ -243,53 +576,101 @@ class Judge:
         In lenient mode, numeric values are compared with tolerance
         and strings are compared case-insensitively.
         """
+        try:
+            parsed_output = Judge._parse_and_validate_json(output, schema, schema_key)
+        except _JSONJudgeError as e:
+            return False, str(e)
+
+        return Judge._compare_json(parsed_output, ground_truth, judge_config, lenient, explain=explain)
+
+    @staticmethod
+    def _parse_and_validate_json(
+        output: str,
+        schema: Optional[Dict[str, Any]] = None,
+        schema_key: Optional[str] = None,
+    ) -> Any:
+        """Parse JSON from output and validate it against ``schema``.
+
+        Raises:
+            _JSONJudgeError: With the judge explanation if parsing or
+                schema validation fails.
+        """
         # Step 1: Parse JSON
         try:
             parsed_output = Judge._extract_and_parse_json(output)
         except (json.JSONDecodeError, ValueError) as e:
-            return False, f"JSON parse error: {str(e)}"
+            raise _JSONJudgeError(f"JSON parse error: {str(e)}") from e
 
         # Step 2: Validate schema
         if schema:
-            try:
-                validate(instance=parsed_output, schema=schema)
-            except ValidationError as e:
-                return False, f"Schema validation failed: {e.message}"
+            error = _schema_error(parsed_output, schema, schema_key)
+            if error is not None:
+                raise _JSONJudgeError(f"Schema validation failed: {error}")
+
+        return parsed_output
 
-        # Step 3: Compare with ground truth
+    @staticmethod
+    def _compare_json(
+        parsed_output: Any,
+        ground_truth: Any,
+        judge_config: Union[Dict[str, Any], CompiledJudgeConfig],
+        lenient: bool = False,
+        explain: bool = True,
+    ) -> Tuple[bool, str]:
+        """Compare parsed JSON with ground truth (step 3 of ``_judge_json``).
+
+        With ``explain=False`` matches return an empty explanation, so large
+        outputs are never stringified on the success path.
+        """
         if ground_truth is not None:
             ignore_fields = judge_config.get("ignore_fields", [])
 
             # Remove ignored fields
             if isinstance(parsed_output, dict) and isinstance(ground_truth, dict):
-                output_filtered = {k: v for k, v in parsed_output.items() if k not in ignore_fields}
-                truth_filtered = {k: v for k, v in ground_truth.items() if k not in ignore_fields}
-
-                # Strict comparison
+                if ignore_fields:
+                    if isinstance(judge_config, CompiledJudgeConfig):
+                        ignore_set = judge_config.ignore_fields
+                    else:
+                        ignore_set = frozenset(ignore_fields)
+                    output_filtered = {k: v for k, v in parsed_output.items() if k not in ignore_set}
+                    truth_filtered = {k: v for k, v in ground_truth.items() if k not in ignore_set}
+                else:
+                    output_filtered, truth_filtered = parsed_output, ground_truth
+
+                # Strict comparison.  Plain == on purpose: a canonical-JSON
+                # hash would disagree with Python equality (999 vs 999.0,
+                # tuple vs list), and repeat outputs are already memoised by
+                # the evaluator's judge cache.
                 if output_filtered == truth_filtered:
-                    return True, f"JSON match (ignoring {ignore_fields}): {output_filtered}"
+                    return True, f"JSON match (ignoring {ignore_fields}): {output_filtered}" if explain else ""
 
                 # Lenient comparison with numeric tolerance and case-insensitive strings
                 if lenient and Judge._values_match_lenient(output_filtered, truth_filtered):
-                    return True, f"JSON lenient match: {output_filtered} ≈ {truth_filtered}"
+                    return True, f"JSON lenient match: {output_filtered} ≈ {truth_filtered}" if explain else ""
 
                 return False, f"JSON mismatch: got {output_filtered}, expected {truth_filtered}"
             else:
                 if parsed_output == ground_truth:
-                    return True, f"JSON exact match: {parsed_output}"
+                    return True, f"JSON exact match: {parsed_output}" if explain else ""
 
                 if lenient and Judge._values_match_lenient(parsed_output, ground_truth):
-                    return True, f"JSON lenient match: {parsed_output} ≈ {ground_truth}"
+                    return True, f"JSON lenient match: {parsed_output} ≈ {ground_truth}" if explain else ""
 
                 return False, f"JSON mismatch: got {parsed_output}, expected {ground_truth}"
         else:
             # No ground truth, just validate structure
-            return True, f"JSON valid (no ground truth to compare): {parsed_output}"
+            return True, f"JSON valid (no ground truth to compare): {parsed_output}" if explain else ""
 
     @staticmethod
-    def _judge_regex(output: str, judge_config: Dict[str, Any]) -> Tuple[bool, str]:
+    def _judge_regex(
+        output: str,
+        judge_config: Union[Dict[str, Any], CompiledJudgeConfig],
+        explain: bool = True,
+    ) -> Tuple[bool, str]:
         """Regex judge - check if output matches regex pattern.
 
+        With ``explain=False`` matches return an empty explanation.
+
         Example:
             pattern: r"(?i)^paris$"
             "Paris" → True
@@ -302,15 +683,17 @@ class Judge:
             return False, "No regex pattern provided"
 
         try:
-            if re.search(pattern, output):
-                return True, f"Regex match: pattern '{pattern}' found in output"
+            if _compile_user_pattern(pattern).search(output):
+                return True, f"Regex match: pattern '{pattern}' found in output" if explain else ""
             else:
                 return False, f"Regex mismatch: pattern '{pattern}' not found in '{output}'"
         except re.error as e:
             return False, f"Regex error: {str(e)}"
 
     @staticmethod
-    def _judge_lenient_numeric(output: str, ground_truth: Any) -> Tuple[bool, str]:
+    def _judge_lenient_numeric(
+        output: str, ground_truth: Any, explain: bool = True
+    ) -> Tuple[bool, str]:
         """Lenient numeric judge -- extract last signed number, compare.
 
         Used by Phase B2 tasks (e.g. B5 ``"5 - 8"`` with ground truth
@@ -326,6 +709,8 @@ class Judge:
                output (last because trailing numbers are usually the
                final answer in conversational replies).
             4. Compare with absolute tolerance ``1e-6``.
+
+        With ``explain=False`` matches return an empty explanation.
         """
         if output is None:
             return False, "Lenient: output is None"
@@ -354,10 +739,10 @@ class Judge:
             gt_val = float(gt_str)
         except (ValueError, TypeError):
             # Fall back to case-insensitive substring match.
-            return Judge._judge_exact(out_norm, gt_str, lenient=True)
+            return Judge._judge_exact(out_norm, gt_str, lenient=True, explain=explain)
 
         # Find every signed number; pick the last one as the final answer.
-        nums = re.findall(r"-?\d+(?:\.\d+)?", out_norm)
+        nums = _SIGNED_NUM_RE.findall(out_norm)
         if not nums:
             return False, f"Lenient: no numeric token in '{output[:80]}'"
         try:
@@ -366,6 +751,8 @@ class Judge:
             return False, f"Lenient: could not parse '{nums[-1]}'"
 
         if abs(candidate - gt_val) <= 1e-6:
+            if not explain:
+                return True, ""
             return True, (
                 f"Lenient match: {candidate} == {gt_val} "
                 f"(extracted from '{output[:60]}')"
@@ -388,50 +775,109 @@ class Judge:
 
         # Try direct parse first
         try:
-            return json.loads(text)
+            return _json_loads(text)
         except json.JSONDecodeError:
             pass
 
-        # Try to extract from markdown code block
-        code_block_pattern = r"```(?:json)?\s*\n?(.*?)\n?```"
-        match = re.search(code_block_pattern, text, re.DOTALL)
-        if match:
-            try:
-                return json.loads(match.group(1).strip())
-            except json.JSONDecodeError:
-                pass
-
-        # Try to find JSON object or array in text
-        json_pattern = r'(\{.*\}|\[.*\])'
-        match = re.search(json_pattern, text, re.DOTALL)
-        if match:
+        # Try the body of the first markdown code block (```json ... ```)
+        fence = text.find("```")
+        if fence != -1:
+            body_start = fence + 3
+            if text.startswith("json", body_start):
+                body_start += 4
+            body_end = text.find("```", body_start)
+            if body_end != -1:
+                try:
+                    return _json_loads(text[body_start:body_end].strip())
+                except json.JSONDecodeError:
+                    pass
+
+        # Scan for the first position where a complete JSON object/array
+        # decodes; trailing prose (or a second JSON block) is ignored.
+        for start in _JSON_START_RE.finditer(text):
             try:
-                return json.loads(match.group(1))
+                return _JSON_DECODER.raw_decode(text, start.start())[0]
             except json.JSONDecodeError:
-                pass
+                continue
 
         # If all fails, raise error
         raise ValueError(f"Could not extract valid JSON from: {text[:100]}...")
 
 
+def _evaluate_one(item: Tuple[Any, ...], need_explanation: bool = True) -> Tuple[bool, str]:
+    """Module-level (picklable) worker for Judge.evaluate_batch.
+
+    Raises:
+        ValueError: If *item* is not a 3- to 5-element argument tuple.
+    """
+    if not 3 <= len(item) <= 5:
+        raise ValueError(f"judge item must have 3 to 5 elements, got {len(item)}")
+    output, ground_truth, judge_config = item[:3]
+    schema = item[3] if len(item) > 3 else None
+    lenient = item[4] if len(item) > 4 else False
+    return Judge.evaluate(
+        output, ground_truth, judge_config, schema, lenient,
+        need_explanation=need_explanation,
+    )
+
+
+# Rate-limited (HTTP 429) judge calls are retried with exponential backoff.
+_LLM_MAX_RETRIES = 3
+_LLM_BACKOFF_SEC = 1.0
+
+
+def _is_rate_limited(exc: BaseException) -> bool:
+    """Best-effort detection of provider rate-limit errors across SDKs."""
+    status = getattr(exc, "status_code", None) or getattr(
+        getattr(exc, "response", None), "status_code", None
+    )
+    if status == 429:
+        return True
+    message = str(exc).lower()
+    return "429" in message or "rate limit" in message
+
+
 class LLMJudge:
     """LLM-as-Judge for qualitative evaluation.
 
     Uses a strong LLM to evaluate output quality.
     """
 
-    def __init__(self, model_name: Optional[str] = None):
+    # In-memory entries kept in front of the on-disk response cache.
+    _MEMO_MAX = 1024
+
+    def __init__(
+        self,
+        model_name: Optional[str] = None,
+        cache_dir: Optional[Union[str, Path]] = None,
+    ):
         """Initialize LLM judge.
 
         Args:
             model_name: Optional model name. If None, uses configured LLM
+            cache_dir: Optional directory caching LLM responses by a hash of
+                the full prompt and the resolved model, so reruns skip the call
         """
+        self.model_name = model_name
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self._memo: OrderedDict[str, str] = OrderedDict()
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
         if model_name:
             from langchain.chat_models import init_chat_model
             self.llm = init_chat_model(model_name)
         else:
             from src.llm_config import get_llm
             self.llm = get_llm()
+        # Cache identity of the model actually in use: get_llm() resolves
+        # provider and model from the environment at construction time.
+        self._model_id = "{}:{}".format(
+            type(self.llm).__name__,
+            getattr(self.llm, "model", None)
+            or getattr(self.llm, "model_name", None)
+            or model_name,
+        )
 
     def evaluate(
         self,
@@ -450,21 +896,132 @@ class LLMJudge:
             Dict with scores for relevance, accuracy, completeness, conciseness
         """
         prompt = self._build_evaluation_prompt(query, output, ground_truth)
+        key = self._cache_key(prompt)
+        content = self._cache_get(key)
+        if content is not None:
+            return self._parse_llm_response(content)
+
+        messages = [{"role": "user", "content": prompt}]
 
         try:
-            response = self.llm.invoke([{"role": "user", "content": prompt}])
+            for attempt in range(_LLM_MAX_RETRIES + 1):
+                try:
+                    response = self.llm.invoke(messages)
+                    break
+                except Exception as e:
+                    if attempt == _LLM_MAX_RETRIES or not _is_rate_limited(e):
+                        raise
+                    time.sleep(_LLM_BACKOFF_SEC * 2 ** attempt)
             content = response.content if isinstance(response.content, str) else str(response.content)
+            self._cache_put(key, content)
             result = self._parse_llm_response(content)
             return result
         except Exception as e:
-            return {
-                "relevance": 5,
-                "accuracy": 5,
-                "completeness": 5,
-                "conciseness": 5,
-                "overall": 5.0,
-                "explanation": f"LLM evaluation failed: {str(e)}"
-            }
+            return self._neutral_scores(f"LLM evaluation failed: {str(e)}")
+
+    async def aevaluate(
+        self,
+        items: Iterable[Tuple[Any, ...]],
+        max_concurrency: int = 32,
+    ) -> List[Dict[str, Any]]:
+        """Evaluate many outputs concurrently via the LLM's async API.
+
+        Args:
+            items: ``(query, output[, ground_truth])`` tuples
+            max_concurrency: Cap on in-flight LLM calls (provider rate limits)
+
+        Returns:
+            Score dicts (as from :meth:`evaluate`) in the order of ``items``
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _bounded(item: Tuple[Any, ...]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self._aevaluate_one(*item)
+
+        return list(await asyncio.gather(*(_bounded(item) for item in items)))
+
+    async def _aevaluate_one(
+        self,
+        query: str,
+        output: str,
+        ground_truth: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Async counterpart of :meth:`evaluate` (same cache and fallbacks)."""
+        prompt = self._build_evaluation_prompt(query, output, ground_truth)
+        key = self._cache_key(prompt)
+        content = self._cache_get(key)
+        if content is not None:
+            return self._parse_llm_response(content)
+
+        messages = [{"role": "user", "content": prompt}]
+
+        try:
+            for attempt in range(_LLM_MAX_RETRIES + 1):
+                try:
+                    response = await self.llm.ainvoke(messages)
+                    break
+                except Exception as e:
+                    if attempt == _LLM_MAX_RETRIES or not _is_rate_limited(e):
+                        raise
+                    await asyncio.sleep(_LLM_BACKOFF_SEC * 2 ** attempt)
+            content = response.content if isinstance(response.content, str) else str(response.content)
+            self._cache_put(key, content)
+            return self._parse_llm_response(content)
+        except Exception as e:
+            return self._neutral_scores(f"LLM evaluation failed: {str(e)}")
+
+    @staticmethod
+    def _neutral_scores(explanation: str) -> Dict[str, Any]:
+        """Mid-scale scores returned when the LLM call or parsing fails."""
+        return {
+            "relevance": 5,
+            "accuracy": 5,
+            "completeness": 5,
+            "conciseness": 5,
+            "overall": 5.0,
+            "explanation": explanation
+        }
+
+    def _cache_key(self, prompt: str) -> str:
+        """Content hash of the exact prompt and the model that answers it."""
+        payload = json.dumps({"prompt": prompt, "model": self._model_id}, sort_keys=True)
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+    def _cache_get(self, key: str) -> Optional[str]:
+        """Return the cached raw LLM response for ``key``, if any."""
+        content = self._memo.get(key)
+        if content is not None:
+            self._memo.move_to_end(key)
+            return content
+        if self.cache_dir is None:
+            return None
+        try:
+            with open(self.cache_dir / f"{key}.json", encoding="utf-8") as f:
+                content = json.load(f)["content"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        self._remember(key, content)
+        return content
+
+    def _cache_put(self, key: str, content: str) -> None:
+        """Cache a raw LLM response in memory and (atomically) on disk."""
+        self._remember(key, content)
+        if self.cache_dir is None:
+            return
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"content": content}, f)
+            os.replace(tmp_path, self.cache_dir / f"{key}.json")
+        except OSError:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_path)
+
+    def _remember(self, key: str, content: str) -> None:
+        self._memo[key] = content
+        if len(self._memo) > self._MEMO_MAX:
+            self._memo.popitem(last=False)
 
     def _build_evaluation_prompt(
         self,
@@ -519,14 +1076,7 @@ Return JSON:
             return parsed
 
         except Exception as e:
-            return {
-                "relevance": 5,
-                "accuracy": 5,
-                "completeness": 5,
-                "conciseness": 5,
-                "overall": 5.0,
-                "explanation": f"Failed to parse LLM response: {str(e)}"
-            }
+            return self._neutral_scores(f"Failed to parse LLM response: {str(e)}")
 
 
 if __name__ == "__main__":
@@ -6,12 +6,21 @@
 4. Controllability: Schema compliance, tool policy adherence.
 """
 
+import functools
+import math
+import operator
 import statistics
+from array import array
 from dataclasses import dataclass, field
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
+from ._compat import DATACLASS_SLOTS
 from .reasoning_quality import CognitiveMetrics
 
+# Only metric classes that never get ad-hoc attributes attached are slotted:
+# PatternMetrics and the success/efficiency/controllability blocks carry
+# extra run data (e.g. ``_normalised_scores``) set outside the dataclass.
+
 
 @dataclass
 class SuccessMetrics:
@@ -68,6 +77,43 @@ class SuccessMetrics:
         }
 
 
+# Per-task series on EfficiencyMetrics and the array typecode each is
+# packed into by finalize(); reassigning one drops memoised stats.
+_EFFICIENCY_SERIES = {
+    "latencies": "d",
+    "input_tokens": "q",
+    "output_tokens": "q",
+    "step_counts": "q",
+    "tool_call_counts": "q",
+    "tao_cycle_counts": "q",
+}
+
+
+def _fmean(values: Sequence[float]) -> float:
+    """Float mean via ``math.fsum`` (C-level, correctly rounded).
+
+    ``statistics.mean`` does exact ``Fraction`` arithmetic, which is far
+    slower and buys nothing for latencies and token counts.
+    """
+    return math.fsum(values) / len(values)
+
+
+def _memoised_once_finalized(method: Callable[[Any], float]) -> Callable[[Any], float]:
+    """Cache an aggregate on ``self._stats`` after ``finalize()`` was called."""
+    name = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(self: Any) -> float:
+        stats = self._stats
+        if stats is None:
+            return method(self)
+        if name not in stats:
+            stats[name] = method(self)
+        return stats[name]
+
+    return wrapper
+
+
 @dataclass
 class EfficiencyMetrics:
     """Efficiency dimension metrics."""
@@ -89,28 +135,77 @@ class EfficiencyMetrics:
     tao_cycle_counts: List[int] = field(default_factory=list)
     any_tokens_estimated: bool = False
 
+    # Aggregates memoised after finalize(); None while still collecting.
+    _stats: Optional[Dict[str, float]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute, dropping memoised aggregates if a series changes."""
+        if name in _EFFICIENCY_SERIES:
+            object.__setattr__(self, "_stats", None)
+        object.__setattr__(self, name, value)
+
+    def record(
+        self,
+        latency: float,
+        input_tokens: int,
+        output_tokens: int,
+        steps: int,
+        tool_calls: int,
+    ) -> None:
+        """Append one successful task's measurements to every series.
+
+        Recording after :meth:`finalize` drops the memoised aggregates, so
+        they are recomputed until ``finalize()`` is called again.
+        """
+        self._stats = None
+        self.latencies.append(latency)
+        self.input_tokens.append(input_tokens)
+        self.output_tokens.append(output_tokens)
+        self.step_counts.append(steps)
+        self.tool_call_counts.append(tool_calls)
+
+    def finalize(self) -> "EfficiencyMetrics":
+        """Pack the per-task series and memoise aggregates from now on.
+
+        Called once collection is done.  Each series becomes a typed
+        ``array.array`` (unboxed doubles / 64-bit ints) and is treated as
+        read-only afterwards; reassigning a series or calling
+        :meth:`record` clears the memo.
+        """
+        for name, typecode in _EFFICIENCY_SERIES.items():
+            setattr(self, name, array(typecode, getattr(self, name)))
+        self._stats = {}
+        return self
+
+    @_memoised_once_finalized
     def avg_latency(self) -> float:
         """Average latency in seconds."""
-        return statistics.mean(self.latencies) if self.latencies else 0.0
+        return _fmean(self.latencies) if self.latencies else 0.0
 
+    @_memoised_once_finalized
     def median_latency(self) -> float:
         """Median latency in seconds."""
         return statistics.median(self.latencies) if self.latencies else 0.0
 
+    @_memoised_once_finalized
     def avg_total_tokens(self) -> float:
         """Average total token usage."""
         if not self.input_tokens or not self.output_tokens:
             return 0.0
-        totals = [i + o for i, o in zip(self.input_tokens, self.output_tokens)]
-        return statistics.mean(totals)
+        n = min(len(self.input_tokens), len(self.output_tokens))
+        return sum(map(operator.add, self.input_tokens, self.output_tokens)) / n
 
+    @_memoised_once_finalized
     def avg_steps(self) -> float:
         """Average number of steps."""
-        return statistics.mean(self.step_counts) if self.step_counts else 0.0
+        return _fmean(self.step_counts) if self.step_counts else 0.0
 
+    @_memoised_once_finalized
     def avg_tool_calls(self) -> float:
         """Average number of tool calls."""
-        return statistics.mean(self.tool_call_counts) if self.tool_call_counts else 0.0
+        return _fmean(self.tool_call_counts) if self.tool_call_counts else 0.0
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
@@ -128,7 +223,7 @@ class EfficiencyMetrics:
         }
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class RobustnessMetrics:
     """Robustness dimension metrics."""
 
@@ -255,7 +350,7 @@ class ControllabilityMetrics:
         }
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class AlignmentMetrics:
     """Dim3: Action-Decision Alignment metrics.
 
@@ -294,7 +389,7 @@ class AlignmentMetrics:
         }
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class BehaviouralSafetyMetrics:
     """Per-pattern Dimension 5 metrics -- Behavioural Safety."""
 
@@ -411,6 +506,22 @@ class PatternMetrics:
         return s
 
 
+def _argmax_argmin(scores: Dict[str, float]) -> Tuple[str, str]:
+    """Return the (highest, lowest) scoring names in a single pass.
+
+    Ties go to the earliest name, matching ``max``/``min`` over the dict.
+    """
+    items = iter(scores.items())
+    first_name, first_score = next(items)
+    hi_name, hi = lo_name, lo = first_name, first_score
+    for name, score in items:
+        if score > hi:
+            hi_name, hi = name, score
+        elif score < lo:
+            lo_name, lo = name, score
+    return hi_name, lo_name
+
+
 class MetricsAggregator:
     """Aggregate and compare metrics across patterns."""
 
@@ -446,8 +557,7 @@ class MetricsAggregator:
             for name, metrics in pattern_metrics.items()
         }
 
-        best_pattern = max(success_rates, key=lambda x: success_rates[x])
-        worst_pattern = min(success_rates, key=lambda x: success_rates[x])
+        best_pattern, worst_pattern = _argmax_argmin(success_rates)
 
         return {
             "metric": "success_rate",
@@ -471,8 +581,7 @@ class MetricsAggregator:
         # Exclude patterns with 0 latency (no successful tasks) from best/worst
         valid_latencies = {k: v for k, v in latencies.items() if v > 0}
         if valid_latencies:
-            fastest_pattern = min(valid_latencies, key=lambda x: valid_latencies[x])
-            slowest_pattern = max(valid_latencies, key=lambda x: valid_latencies[x])
+            slowest_pattern, fastest_pattern = _argmax_argmin(valid_latencies)
         else:
             fastest_pattern = list(latencies.keys())[0]
             slowest_pattern = fastest_pattern
@@ -502,11 +611,9 @@ class MetricsAggregator:
             k: v for k, v in degradations.items()
             if pattern_metrics[k].robustness.original_success_rate > 0
         }
+        least_robust, most_robust = _argmax_argmin(degradations)
         if valid_degradations:
-            most_robust = min(valid_degradations, key=lambda x: valid_degradations[x])
-        else:
-            most_robust = min(degradations, key=lambda x: degradations[x])
-        least_robust = max(degradations, key=lambda x: degradations[x])
+            most_robust = _argmax_argmin(valid_degradations)[1]
 
         return {
             "metric": "degradation_percentage",
@@ -527,8 +634,7 @@ class MetricsAggregator:
             for name, metrics in pattern_metrics.items()
         }
 
-        most_controllable = max(controllability_scores, key=lambda x: controllability_scores[x])
-        least_controllable = min(controllability_scores, key=lambda x: controllability_scores[x])
+        most_controllable, least_controllable = _argmax_argmin(controllability_scores)
 
         return {
             "metric": "overall_controllability",
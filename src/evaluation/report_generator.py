@@ -1,8 +1,13 @@
 """Report Generator - Generate evaluation reports."""
 
+import copy
+import csv
+import gzip
+import io
 import json
 import os
 import subprocess
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
@@ -10,6 +15,40 @@ from typing import Any, Dict, List, Optional, Tuple
 from .cognitive_safety import MIN_GROUNDING_TASKS
 from .metrics import MetricsAggregator, PatternMetrics
 from .statistics import StatisticalReport
+from .trace import token_estimator
+
+try:  # Optional accelerator: faster encoding of the (large) JSON report.
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dump_json_bytes(report: Dict[str, Any]) -> bytes:
+    """Encode *report* as indented UTF-8 JSON, via orjson when installed.
+
+    Both encoders load back to the same finite values; orjson spells some
+    floats differently (``0.00001`` vs ``1e-05``) and writes non-finite
+    floats as ``null`` rather than the non-standard ``NaN``. Anything it
+    refuses (e.g. integers beyond 64 bits) is encoded with ``json``.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                report, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            )
+        except TypeError:
+            pass
+    return json.dumps(report, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+# Markdown summary-table row: one pre-parsed template, one C-level call per row.
+_SUMMARY_ROW_FMT = (
+    "| {:12s} | {:6.1%} | {:7.1%} | {:3.1%} | {:15.2f} | {:10.0f} | {:15.1f} | {:15.1%} |"
+).format
+_SUMMARY_ROW_KEYS = (
+    "pattern", "success_rate_strict", "success_rate_lenient", "controllability_gap",
+    "avg_latency_sec", "avg_tokens", "degradation_pct", "controllability",
+)
 
 
 def _dim2_min_grounding_tasks() -> int:
@@ -455,6 +494,7 @@ def _build_phase_f_metadata(
     task_timeout: Optional[float] = None,
     parallel: Optional[bool] = None,
     max_concurrency: Optional[int] = None,
+    task_concurrency: Optional[int] = None,
     robustness_reused: bool = False,
     insufficient_runs: bool = False,
 ) -> Dict[str, Any]:
@@ -483,9 +523,11 @@ def _build_phase_f_metadata(
         "task_timeout": task_timeout,
         "parallel": parallel,
         "max_concurrency": max_concurrency,
+        "task_concurrency": task_concurrency,
         "robustness_reused": robustness_reused,
         "seed_supported": bool(info.get("seed_supported", False)),
         "seed": info.get("seed"),
+        "token_estimator": token_estimator(),
         "git_branch": _git_rev(["--abbrev-ref", "HEAD"]),
         "git_commit": _git_rev(["HEAD"]),
     }
@@ -494,6 +536,30 @@ def _build_phase_f_metadata(
     return metadata
 
 
+@dataclass(frozen=True)
+class ReportInputs:
+    """Derived data every report format reads, computed once by the driver.
+
+    Build it from the final metrics and pass it to each ``ReportGenerator``
+    call so the formats share one comparison and one set of per-pattern
+    ``to_dict()`` payloads.  The formats only read it; the JSON report
+    copies what it embeds, since its result is handed back to the caller.
+    """
+
+    comparison: Dict[str, Any]
+    metric_dicts: Dict[str, Dict[str, Any]]
+
+    @classmethod
+    def from_metrics(cls, pattern_metrics: Dict[str, PatternMetrics]) -> "ReportInputs":
+        """Compute the inputs for one (final) ``pattern_metrics`` dict."""
+        return cls(
+            comparison=MetricsAggregator.compare_patterns(pattern_metrics),
+            metric_dicts={
+                name: metrics.to_dict() for name, metrics in pattern_metrics.items()
+            },
+        )
+
+
 class ReportGenerator:
     """Generate evaluation reports in various formats."""
 
@@ -503,18 +569,22 @@ class ReportGenerator:
         output_path: Optional[str] = None,
         statistical_report: Optional[StatisticalReport] = None,
         run_metadata: Optional[Dict[str, Any]] = None,
+        inputs: Optional[ReportInputs] = None,
     ) -> Dict[str, Any]:
         """Generate JSON report.
 
         Args:
             pattern_metrics: Dict of {pattern_name: PatternMetrics} for
                 the latest single run (back-compat baseline content).
-            output_path: Optional path to save report.
+            output_path: Optional path to save report; a ``.gz`` suffix
+                writes it gzip-compressed.
             statistical_report: Optional Phase F multi-run aggregate;
                 when supplied, ``run_records``, ``statistical_summaries``
                 and ``pairwise_effect_sizes`` are added per spec §5.7.
             run_metadata: Optional metadata block (Phase F spec §5.6).
                 When supplied it replaces the legacy ``metadata`` block.
+            inputs: Optional precomputed :class:`ReportInputs` for
+                ``pattern_metrics``; computed here when omitted.
 
         Returns:
             Report dictionary
@@ -531,15 +601,18 @@ class ReportGenerator:
                 "generated_at": datetime.now().isoformat(),
                 "patterns_evaluated": list(pattern_metrics.keys()),
                 "total_patterns": len(pattern_metrics),
+                "token_estimator": token_estimator(),
             }
 
+        # The report is returned to the caller, so never embed shared inputs.
+        inputs = (
+            ReportInputs.from_metrics(pattern_metrics)
+            if inputs is None else copy.deepcopy(inputs)
+        )
         report = {
             "metadata": metadata_block,
-            "individual_metrics": {
-                name: metrics.to_dict()
-                for name, metrics in pattern_metrics.items()
-            },
-            "comparison": MetricsAggregator.compare_patterns(pattern_metrics),
+            "individual_metrics": inputs.metric_dicts,
+            "comparison": inputs.comparison,
         }
 
         # Phase E: Add normalised scores and composite scores if available
@@ -568,10 +641,8 @@ class ReportGenerator:
         # pattern name; ``run_records``, ``statistical_summaries`` and
         # ``pairwise_effect_sizes`` are added when available.
         if statistical_report is not None:
-            report["single_run_latest"] = {
-                name: metrics.to_dict()
-                for name, metrics in pattern_metrics.items()
-            }
+            # Same content as ``individual_metrics``; serialised once.
+            report["single_run_latest"] = report["individual_metrics"]
             report["run_records"] = {
                 name: [r.to_dict() for r in stats.run_records]
                 for name, stats in statistical_report.per_pattern.items()
@@ -588,8 +659,11 @@ class ReportGenerator:
         # Save to file if path provided
         if output_path:
             Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-            with open(output_path, "w", encoding="utf-8") as f:
-                json.dump(report, f, indent=2, ensure_ascii=False)
+            payload = _dump_json_bytes(report)
+            if str(output_path).endswith(".gz"):
+                # Level 1: near-free CPU, still several-fold smaller output.
+                payload = gzip.compress(payload, compresslevel=1, mtime=0)
+            Path(output_path).write_bytes(payload)
 
         return report
 
@@ -599,6 +673,7 @@ class ReportGenerator:
         output_path: Optional[str] = None,
         statistical_report: Optional[StatisticalReport] = None,
         run_metadata: Optional[Dict[str, Any]] = None,
+        inputs: Optional[ReportInputs] = None,
     ) -> str:
         """Generate Markdown report.
 
@@ -613,11 +688,15 @@ class ReportGenerator:
             run_metadata: Optional Phase F metadata block.  When
                 supplied, the document header surfaces ``num_runs``,
                 ``judge_model``, git ref and reproducibility info.
+            inputs: Optional precomputed :class:`ReportInputs` for
+                ``pattern_metrics``; computed here when omitted.
 
         Returns:
             Markdown string
         """
-        comparison = MetricsAggregator.compare_patterns(pattern_metrics)
+        if inputs is None:
+            inputs = ReportInputs.from_metrics(pattern_metrics)
+        comparison = inputs.comparison
 
         # Build markdown
         lines = []
@@ -707,17 +786,10 @@ class ReportGenerator:
         lines.append("| Pattern | Strict | Lenient | Gap | Avg Latency (s) | Avg Tokens | Degradation (%) | Controllability |")
         lines.append("|---------|--------|---------|-----|-----------------|------------|-----------------|-----------------|")
 
-        for row in comparison["summary_table"]:
-            lines.append(
-                f"| {row['pattern']:12s} | "
-                f"{row['success_rate_strict']:6.1%} | "
-                f"{row['success_rate_lenient']:7.1%} | "
-                f"{row['controllability_gap']:3.1%} | "
-                f"{row['avg_latency_sec']:15.2f} | "
-                f"{row['avg_tokens']:10.0f} | "
-                f"{row['degradation_pct']:15.1f} | "
-                f"{row['controllability']:15.1%} |"
-            )
+        lines.extend(
+            _SUMMARY_ROW_FMT(*(row[key] for key in _SUMMARY_ROW_KEYS))
+            for row in comparison["summary_table"]
+        )
 
         lines.append("")
 
@@ -832,8 +904,9 @@ class ReportGenerator:
         lines.append("")
 
         # Detailed efficiency metrics
+        metric_dicts = inputs.metric_dicts
         for name, metrics in pattern_metrics.items():
-            eff = metrics.efficiency.to_dict()
+            eff = metric_dicts[name]["efficiency"]
             lines.append(f"#### {name} - Detailed Efficiency")
             lines.append(f"  - Median Latency: {eff['median_latency_sec']:.2f}s")
             lines.append(f"  - Token Usage: {eff['avg_total_tokens']:.0f} avg")
@@ -952,7 +1025,7 @@ class ReportGenerator:
 
         # Detailed controllability
         for name, metrics in pattern_metrics.items():
-            ctrl = metrics.controllability.to_dict()
+            ctrl = metric_dicts[name]["controllability"]
             lines.append(f"#### {name} - Detailed Controllability")
             lines.append(f"  - Schema Compliance: {ctrl['schema_compliance_rate']:.1%}")
             lines.append(f"  - Tool Policy Compliance: {ctrl['tool_policy_compliance_rate']:.1%}")
@@ -1578,12 +1651,16 @@ class ReportGenerator:
         else:
             best_reasoning_label = "no pattern produced an evaluable reasoning trace"
 
-        best_success = max(pattern_metrics.items(), key=lambda x: x[1].success.success_rate())
-        best_speed = min(
-            ((k, v) for k, v in pattern_metrics.items() if v.efficiency.avg_latency() > 0),
-            key=lambda x: x[1].efficiency.avg_latency(),
-            default=best_success,
-        )
+        # Success and speed winners are the ones the comparison already
+        # picked (same first-wins tie-break).  Robustness and control keep
+        # their own rules below: all patterns / Dim 7 respectively.
+        best_success_name = comparison["success_dimension"]["best_pattern"]
+        best_success = (best_success_name, pattern_metrics[best_success_name])
+        fastest_name = comparison["efficiency_dimension"]["fastest_pattern"]
+        if pattern_metrics[fastest_name].efficiency.avg_latency() > 0:
+            best_speed = (fastest_name, pattern_metrics[fastest_name])
+        else:  # no pattern has a measured latency
+            best_speed = best_success
         best_robust = min(pattern_metrics.items(), key=lambda x: x[1].robustness.degradation_percentage)
         # Use Dim 7 normalised score if available, fall back to overall_controllability
         def _dim7_score(item):
@@ -1686,64 +1763,81 @@ class ReportGenerator:
     def generate_csv_comparison(
         pattern_metrics: Dict[str, PatternMetrics],
         output_path: Optional[str] = None,
+        inputs: Optional[ReportInputs] = None,
     ) -> str:
         """Generate CSV comparison table.
 
         Args:
             pattern_metrics: Dict of {pattern_name: PatternMetrics}
             output_path: Optional path to save CSV
+            inputs: Optional precomputed :class:`ReportInputs` for
+                ``pattern_metrics``
 
         Returns:
             CSV string
         """
-        comparison = MetricsAggregator.compare_patterns(pattern_metrics)
+        comparison = (
+            inputs.comparison if inputs is not None
+            else MetricsAggregator.compare_patterns(pattern_metrics)
+        )
 
-        # Build CSV
-        lines = []
-        header = "Pattern,Success Rate (Strict),Success Rate (Lenient),Controllability Gap,Avg Latency (s),Avg Tokens,Degradation (%),Controllability,Alignment"
-        # D1 columns
-        header += ",Abs Degradation,Perturbation Variants,Stability Index,Complexity Decline,Scaling Score"
-        # D2 + E columns
-        header += ",Trace Completeness,Policy Flag Rate,Resource Efficiency"
-        # B1: Dim1 reasoning quality sub-indicators
-        header += ",Reasoning Tasks With Trace,Avg Trace Coverage,Avg Coherence,Avg Answer Agreement,Avg Self-Consistency,Judge Fallback Count"
-        # B2: Dim2 cognitive safety sub-indicators
-        header += ",CogSafe Tasks Scanned,Avg Toxicity,Avg Grounding,Tasks With Grounding Evidence,Avg Consistency,Avg Constraint Adherence"
-        header += ",Dim1,Dim2,Dim3,Dim4,Dim5,Dim6,Dim7,Composite"
-        lines.append(header)
+        # Build CSV: rows are written straight into one buffer (quoted by
+        # the csv module where needed), then saved with a single write.
+        buf = io.StringIO()
+        writer = csv.writer(buf, lineterminator="\n")
+        writer.writerow(
+            ["Pattern", "Success Rate (Strict)", "Success Rate (Lenient)", "Controllability Gap",
+             "Avg Latency (s)", "Avg Tokens", "Degradation (%)", "Controllability", "Alignment"]
+            # D1 columns
+            + ["Abs Degradation", "Perturbation Variants", "Stability Index",
+               "Complexity Decline", "Scaling Score"]
+            # D2 + E columns
+            + ["Trace Completeness", "Policy Flag Rate", "Resource Efficiency"]
+            # B1: Dim1 reasoning quality sub-indicators
+            + ["Reasoning Tasks With Trace", "Avg Trace Coverage", "Avg Coherence",
+               "Avg Answer Agreement", "Avg Self-Consistency", "Judge Fallback Count"]
+            # B2: Dim2 cognitive safety sub-indicators
+            + ["CogSafe Tasks Scanned", "Avg Toxicity", "Avg Grounding",
+               "Tasks With Grounding Evidence", "Avg Consistency", "Avg Constraint Adherence"]
+            + ["Dim1", "Dim2", "Dim3", "Dim4", "Dim5", "Dim6", "Dim7", "Composite"]
+        )
 
         for row in comparison["summary_table"]:
             pname = row['pattern']
             metrics = pattern_metrics.get(pname)
-            line = (
-                f"{pname},"
-                f"{row['success_rate_strict']:.3f},"
-                f"{row['success_rate_lenient']:.3f},"
-                f"{row['controllability_gap']:.3f},"
-                f"{row['avg_latency_sec']:.2f},"
-                f"{row['avg_tokens']:.0f},"
-                f"{row['degradation_pct']:.2f},"
-                f"{row['controllability']:.3f},"
-                f"{row['alignment']:.3f}"
-            )
+            fields = [
+                pname,
+                f"{row['success_rate_strict']:.3f}",
+                f"{row['success_rate_lenient']:.3f}",
+                f"{row['controllability_gap']:.3f}",
+                f"{row['avg_latency_sec']:.2f}",
+                f"{row['avg_tokens']:.0f}",
+                f"{row['degradation_pct']:.2f}",
+                f"{row['controllability']:.3f}",
+                f"{row['alignment']:.3f}",
+            ]
             # D1 sub-indicators
             if metrics:
                 rm = metrics.robustness
-                line += (
-                    f",{rm.absolute_degradation:.4f}"
-                    f",{rm.perturbation_variant_count}"
-                    f",{rm.stability_index:.4f}"
-                    f",{rm.complexity_decline:.4f}"
-                    f",{rm.scaling_score:.4f}"
-                )
+                fields += [
+                    f"{rm.absolute_degradation:.4f}",
+                    rm.perturbation_variant_count,
+                    f"{rm.stability_index:.4f}",
+                    f"{rm.complexity_decline:.4f}",
+                    f"{rm.scaling_score:.4f}",
+                ]
             else:
-                line += ",,,,,"
+                fields += [""] * 5
             # D2 sub-indicators
             cr = getattr(metrics, 'controllability_result', None) if metrics else None
             if cr:
-                line += f",{cr.trace_completeness:.4f},{cr.policy_flag_rate:.4f},{cr.resource_efficiency:.4f}"
+                fields += [
+                    f"{cr.trace_completeness:.4f}",
+                    f"{cr.policy_flag_rate:.4f}",
+                    f"{cr.resource_efficiency:.4f}",
+                ]
             else:
-                line += ",,,"
+                fields += [""] * 3
             # B1: Dim1 reasoning quality sub-indicators
             if metrics:
                 cog = metrics.cognitive
@@ -1752,16 +1846,16 @@ class ReportGenerator:
                     if cog.avg_self_consistency_score is not None
                     else ""
                 )
-                line += (
-                    f",{cog.tasks_with_reasoning}"
-                    f",{cog.avg_trace_coverage:.4f}"
-                    f",{cog.avg_coherence_score:.4f}"
-                    f",{cog.avg_final_answer_agreement:.4f}"
-                    f",{sc_str}"
-                    f",{cog.judge_fallback_count}"
-                )
+                fields += [
+                    cog.tasks_with_reasoning,
+                    f"{cog.avg_trace_coverage:.4f}",
+                    f"{cog.avg_coherence_score:.4f}",
+                    f"{cog.avg_final_answer_agreement:.4f}",
+                    sc_str,
+                    cog.judge_fallback_count,
+                ]
             else:
-                line += ",,,,,,"
+                fields += [""] * 6
             # B2: Dim2 cognitive safety sub-indicators (Q4 Patch 1 -- always
             # surface tasks_with_grounding_evidence next to avg_grounding).
             cog_safety = getattr(metrics, "cognitive_safety", None) if metrics else None
@@ -1771,44 +1865,52 @@ class ReportGenerator:
                     if cog_safety.avg_grounding_score is not None
                     else ""
                 )
-                line += (
-                    f",{cog_safety.tasks_scanned}"
-                    f",{cog_safety.avg_toxicity_score:.4f}"
-                    f",{grounding_str}"
-                    f",{cog_safety.tasks_with_grounding_evidence}"
-                    f",{cog_safety.avg_consistency_score:.4f}"
-                    f",{cog_safety.avg_constraint_adherence_score:.4f}"
-                )
+                fields += [
+                    cog_safety.tasks_scanned,
+                    f"{cog_safety.avg_toxicity_score:.4f}",
+                    grounding_str,
+                    cog_safety.tasks_with_grounding_evidence,
+                    f"{cog_safety.avg_consistency_score:.4f}",
+                    f"{cog_safety.avg_constraint_adherence_score:.4f}",
+                ]
             else:
-                line += ",,,,,,"
+                fields += [""] * 6
             # E normalised scores
             ns = getattr(metrics, '_normalised_scores', None) if metrics else None
             cs = getattr(metrics, '_composite_score', None) if metrics else None
-            d1 = f"{ns.dim1_reasoning_quality:.4f}" if ns and ns.dim1_reasoning_quality is not None else ""
-            d2 = f"{ns.dim2_cognitive_safety:.4f}" if ns and ns.dim2_cognitive_safety is not None else ""
-            d3 = f"{ns.dim3_action_decision_alignment:.4f}" if ns and ns.dim3_action_decision_alignment is not None else ""
-            d4 = f"{ns.dim4_success_efficiency:.4f}" if ns and ns.dim4_success_efficiency is not None else ""
-            d5 = f"{ns.dim5_behavioural_safety:.4f}" if ns and ns.dim5_behavioural_safety is not None else ""
-            d6 = f"{ns.dim6_robustness_scalability:.4f}" if ns and ns.dim6_robustness_scalability is not None else ""
-            d7 = f"{ns.dim7_controllability:.4f}" if ns and ns.dim7_controllability is not None else ""
-            comp = f"{cs.composite:.4f}" if cs else ""
-            line += f",{d1},{d2},{d3},{d4},{d5},{d6},{d7},{comp}"
-            lines.append(line)
-
-        csv = "\n".join(lines)
+            for value in (
+                (ns.dim1_reasoning_quality if ns else None),
+                (ns.dim2_cognitive_safety if ns else None),
+                (ns.dim3_action_decision_alignment if ns else None),
+                (ns.dim4_success_efficiency if ns else None),
+                (ns.dim5_behavioural_safety if ns else None),
+                (ns.dim6_robustness_scalability if ns else None),
+                (ns.dim7_controllability if ns else None),
+                (cs.composite if cs else None),
+            ):
+                fields.append(f"{value:.4f}" if value is not None else "")
+            writer.writerow(fields)
+
+        csv_text = buf.getvalue()
 
         # Save to file if path provided
         if output_path:
             Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-            with open(output_path, "w", encoding="utf-8") as f:
-                f.write(csv)
+            with open(output_path, "w", encoding="utf-8", newline="") as f:
+                f.write(csv_text)
 
-        return csv
+        return csv_text
 
     @staticmethod
-    def print_console_report(pattern_metrics: Dict[str, PatternMetrics]):
+    def print_console_report(
+        pattern_metrics: Dict[str, PatternMetrics],
+        inputs: Optional[ReportInputs] = None,
+    ):
         """Print a concise report to console."""
-        comparison = MetricsAggregator.compare_patterns(pattern_metrics)
+        comparison = (
+            inputs.comparison if inputs is not None
+            else MetricsAggregator.compare_patterns(pattern_metrics)
+        )
 
 
         # Summary table with both success rates
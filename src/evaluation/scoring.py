@@ -43,17 +43,14 @@ def normalize_min_max(
 
     x_min = min(valid)
     x_max = max(valid)
+    if x_max == x_min:
+        return [1.0 if v is not None else None for v in values]
 
-    result: List[Optional[float]] = []
-    for v in values:
-        if v is None:
-            result.append(None)
-        elif x_max == x_min:
-            result.append(1.0)
-        else:
-            normed = (v - x_min) / (x_max - x_min)
-            result.append(1.0 - normed if invert else normed)
-    return result
+    # The range and direction are loop-invariant; branch once, not per value.
+    span = x_max - x_min
+    if invert:
+        return [None if v is None else 1.0 - (v - x_min) / span for v in values]
+    return [None if v is None else (v - x_min) / span for v in values]
 
 
 def _safe_mean(values: List[Optional[float]]) -> Optional[float]:
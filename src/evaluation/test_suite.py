@@ -10,10 +10,12 @@ Categories:
 """
 
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+from ._compat import DATACLASS_SLOTS
 
-@dataclass
+
+@dataclass(**DATACLASS_SLOTS)
 class TestTask:
     """Single test task definition."""
 
@@ -27,17 +29,18 @@ class TestTask:
     policy: Optional[Dict[str, Any]] = None
     robustness: Optional[Dict[str, Any]] = None
     complexity: str = "medium"  # simple, medium, complex
+    timeout: Optional[float] = None  # seconds; overrides the evaluator's task_timeout
 
     def get_perturbations(self) -> List[str]:
         """Get input perturbations for robustness testing."""
-        if self.robustness and "perturbations" in self.robustness:
-            return self.robustness["perturbations"]
+        if self.robustness:
+            return self.robustness.get("perturbations", [])
         return []
 
     def get_tool_failure_prob(self) -> float:
         """Get tool failure probability for robustness testing."""
-        if self.robustness and "tool_failure_prob" in self.robustness:
-            return self.robustness["tool_failure_prob"]
+        if self.robustness:
+            return self.robustness.get("tool_failure_prob", 0.0)
         return 0.0
 
 
@@ -475,6 +478,25 @@ Schedule a 30-min meeting for A,B,C. Return JSON {start, end, attendees} with at
 ]
 
 
+# Lookup indices, built once at import. Buckets keep suite order, so any
+# filtered view equals the corresponding linear scan of TEST_SUITE.
+_BY_ID: Dict[str, TestTask] = {}
+_SUITE_POSITION: Dict[str, int] = {}
+_BY_CATEGORY: Dict[str, List[TestTask]] = {}
+_BY_COMPLEXITY: Dict[str, List[TestTask]] = {}
+_BY_CATEGORY_COMPLEXITY: Dict[Tuple[str, str], List[TestTask]] = {}
+for _position, _task in enumerate(TEST_SUITE):
+    _BY_ID.setdefault(_task.id, _task)
+    _SUITE_POSITION.setdefault(_task.id, _position)
+    _BY_CATEGORY.setdefault(_task.category, []).append(_task)
+    _BY_COMPLEXITY.setdefault(_task.complexity, []).append(_task)
+    _BY_CATEGORY_COMPLEXITY.setdefault((_task.category, _task.complexity), []).append(_task)
+del _position, _task
+
+CATEGORIES: Tuple[str, ...] = tuple(_BY_CATEGORY)
+COMPLEXITIES: Tuple[str, ...] = tuple(_BY_COMPLEXITY)
+
+
 def load_test_suite(
     category: Optional[str] = None,
     complexity: Optional[str] = None,
@@ -490,46 +512,50 @@ def load_test_suite(
     Returns:
         Filtered list of test tasks
     """
-    filtered = TEST_SUITE
-
-    if category:
-        filtered = [t for t in filtered if t.category == category]
-
-    if complexity:
-        filtered = [t for t in filtered if t.complexity == complexity]
+    if not (category or complexity or task_ids):
+        return TEST_SUITE
 
     if task_ids:
-        filtered = [t for t in filtered if t.id in task_ids]
-
-    return filtered
+        # Driven by the (usually short) id list, then put back in suite order.
+        hits = sorted(
+            (_BY_ID[i] for i in frozenset(task_ids) if i in _BY_ID),
+            key=lambda t: _SUITE_POSITION[t.id],
+        )
+        return [
+            t for t in hits
+            if (not category or t.category == category)
+            and (not complexity or t.complexity == complexity)
+        ]
+    if category and complexity:
+        return list(_BY_CATEGORY_COMPLEXITY.get((category, complexity), []))
+    if category:
+        return list(_BY_CATEGORY.get(category, []))
+    return list(_BY_COMPLEXITY.get(complexity, []))
 
 
 def get_task_by_id(task_id: str) -> Optional[TestTask]:
     """Get a specific task by ID."""
-    for task in TEST_SUITE:
-        if task.id == task_id:
-            return task
-    return None
+    return _BY_ID.get(task_id)
 
 
 def get_categories() -> List[str]:
     """Get all unique categories."""
-    return list(set(task.category for task in TEST_SUITE))
+    return list(CATEGORIES)
 
 
 def get_complexities() -> List[str]:
     """Get all unique complexity levels."""
-    return list(set(task.complexity for task in TEST_SUITE))
+    return list(COMPLEXITIES)
 
 
 # Statistics
 def print_test_suite_stats():
     """Print test suite statistics."""
-    for category in get_categories():
-        count = len([t for t in TEST_SUITE if t.category == category])
+    for category, tasks in _BY_CATEGORY.items():
+        count = len(tasks)
 
-    for complexity in get_complexities():
-        count = len([t for t in TEST_SUITE if t.complexity == complexity])
+    for complexity, tasks in _BY_COMPLEXITY.items():
+        count = len(tasks)
 
     judge_modes: dict[str, int] = {}
     for task in TEST_SUITE:
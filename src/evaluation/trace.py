@@ -8,8 +8,54 @@ any pattern's internal logic.
 
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
+# Encoding used for token estimates when the provider reports no usage.
+# tiktoken is optional (the ``tokens`` extra); without it (or without its
+# cached BPE file) the estimate falls back to the ~4 characters/token
+# heuristic.  The two give different counts, so reports record which one
+# was used (see ``token_estimator``).
+_TOKEN_ENCODING = "cl100k_base"
+_encoder: Any = None  # resolved lazily; False once known to be unavailable
+# getattr() default meaning "attribute absent" (one lookup instead of
+# hasattr() followed by a second attribute access).
+_MISSING = object()
+
+
+def _get_encoder() -> Any:
+    global _encoder
+    if _encoder is None:
+        try:
+            import tiktoken
+
+            _encoder = tiktoken.get_encoding(_TOKEN_ENCODING)
+        except Exception:  # not installed, or BPE file not downloadable
+            _encoder = False
+    return _encoder or None
+
+
+def token_estimator() -> str:
+    """Name the estimator ``estimate_tokens`` uses in this process.
+
+    The first call resolves the encoder, which may download tiktoken's BPE
+    file, so drivers call this once before starting their event loop.
+    """
+    if _get_encoder() is None:
+        return "chars/4"
+    return f"tiktoken:{_TOKEN_ENCODING}"
+
+
+@lru_cache(maxsize=4096)
+def estimate_tokens(text: str) -> int:
+    """Estimate the token count of ``text`` (memoised per unique string)."""
+    if not text:
+        return 0
+    encoder = _get_encoder()
+    if encoder is None:
+        return len(text) // 4
+    return len(encoder.encode(text, disallowed_special=()))
+
 
 class StepType(Enum):
     """Step type in the think-act-observe cycle."""
@@ -216,8 +262,9 @@ class TraceExtractor:
     @classmethod
     def _get_content(cls, msg: Any) -> str:
         """Get content from a message (object or dict)."""
-        if hasattr(msg, "content"):
-            return msg.content or ""
+        content = getattr(msg, "content", _MISSING)
+        if content is not _MISSING:
+            return content or ""
         if isinstance(msg, dict):
             return msg.get("content", "")
         return str(msg)
@@ -243,9 +290,17 @@ class TraceExtractor:
         return "unknown"
 
     @classmethod
-    def _extract_tokens(cls, msg: Any) -> tuple:
+    def _extract_tokens(
+        cls,
+        msg: Any,
+        content: Optional[Any] = None,
+        msg_type: Optional[str] = None,
+    ) -> tuple:
         """Extract token counts from a message.
 
+        ``content`` / ``msg_type`` may be passed when the caller already
+        has them, to avoid resolving them again for the estimate fallback.
+
         Returns:
             (input_tokens, output_tokens, total_tokens, estimated)
         """
@@ -270,9 +325,13 @@ class TraceExtractor:
                     return (input_t, output_t, total_t, False)
 
         # Fallback: estimate from content length
-        content = cls._get_content(msg)
-        estimated_tokens = len(content) // 4 if content else 0
-        msg_type = cls._get_message_type(msg)
+        if content is None:
+            content = cls._get_content(msg)
+        if content and not isinstance(content, str):
+            content = str(content)  # multimodal content blocks
+        estimated_tokens = estimate_tokens(content) if content else 0
+        if msg_type is None:
+            msg_type = cls._get_message_type(msg)
         if msg_type == "human":
             return (estimated_tokens, 0, estimated_tokens, True)
         else:
@@ -316,8 +375,9 @@ class TraceExtractor:
     @classmethod
     def _get_tool_call_id(cls, msg: Any) -> str:
         """Get tool_call_id from a ToolMessage."""
-        if hasattr(msg, "tool_call_id"):
-            return msg.tool_call_id or ""
+        tool_call_id = getattr(msg, "tool_call_id", _MISSING)
+        if tool_call_id is not _MISSING:
+            return tool_call_id or ""
         if isinstance(msg, dict):
             return msg.get("tool_call_id", "")
         return ""
@@ -325,8 +385,9 @@ class TraceExtractor:
     @classmethod
     def _get_tool_name(cls, msg: Any) -> str:
         """Get tool name from a ToolMessage."""
-        if hasattr(msg, "name"):
-            return msg.name or ""
+        name = getattr(msg, "name", _MISSING)
+        if name is not _MISSING:
+            return name or ""
         if isinstance(msg, dict):
             return msg.get("name", "")
         return ""
@@ -383,7 +444,7 @@ class TraceExtractor:
         for msg in messages:
             msg_type = cls._get_message_type(msg)
             content = cls._get_content(msg)
-            input_t, output_t, total_t, estimated = cls._extract_tokens(msg)
+            input_t, output_t, total_t, estimated = cls._extract_tokens(msg, content, msg_type)
 
             if msg_type == "human":
                 trace.steps.append(StepRecord(
@@ -499,7 +560,7 @@ class TraceExtractor:
         for msg in messages:
             msg_type = cls._get_message_type(msg)
             content = cls._get_content(msg)
-            input_t, output_t, total_t, estimated = cls._extract_tokens(msg)
+            input_t, output_t, total_t, estimated = cls._extract_tokens(msg, content, msg_type)
 
             if msg_type == "human":
                 trace.steps.append(StepRecord(
@@ -535,7 +596,7 @@ class TraceExtractor:
             msg_type = cls._get_message_type(msg)
             if msg_type == "ai":
                 content = cls._get_content(msg)
-                input_t, output_t, total_t, estimated = cls._extract_tokens(msg)
+                input_t, output_t, total_t, estimated = cls._extract_tokens(msg, content, msg_type)
                 trace.steps.append(StepRecord(
                     step_index=step_idx,
                     step_type=StepType.OUTPUT,
@@ -576,7 +637,7 @@ class TraceExtractor:
         for msg in messages:
             msg_type = cls._get_message_type(msg)
             content = cls._get_content(msg)
-            input_t, output_t, total_t, estimated = cls._extract_tokens(msg)
+            input_t, output_t, total_t, estimated = cls._extract_tokens(msg, content, msg_type)
 
             if msg_type == "human":
                 trace.steps.append(StepRecord(
@@ -666,7 +727,7 @@ class TraceExtractor:
         for msg in messages:
             msg_type = cls._get_message_type(msg)
             content = cls._get_content(msg)
-            input_t, output_t, total_t, estimated = cls._extract_tokens(msg)
+            input_t, output_t, total_t, estimated = cls._extract_tokens(msg, content, msg_type)
 
             if msg_type == "human":
                 trace.steps.append(StepRecord(
@@ -718,7 +779,7 @@ class TraceExtractor:
             msg_type = cls._get_message_type(msg)
             if msg_type == "ai":
                 content = cls._get_content(msg)
-                input_t, output_t, total_t, estimated = cls._extract_tokens(msg)
+                input_t, output_t, total_t, estimated = cls._extract_tokens(msg, content, msg_type)
                 trace.steps.append(StepRecord(
                     step_index=step_idx,
                     step_type=StepType.OUTPUT,
@@ -753,7 +814,7 @@ class TraceExtractor:
         for i, msg in enumerate(messages):
             msg_type = cls._get_message_type(msg)
             content = cls._get_content(msg)
-            input_t, output_t, total_t, estimated = cls._extract_tokens(msg)
+            input_t, output_t, total_t, estimated = cls._extract_tokens(msg, content, msg_type)
 
             if msg_type == "human":
                 step_type = StepType.INPUT
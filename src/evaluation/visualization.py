@@ -1,11 +1,24 @@
 """Visualization module - Generate charts and plots for evaluation results."""
 
+import contextlib
+import dataclasses
+import gzip
+import hashlib
+import json
+import multiprocessing
+import os
+import pickle
+import tempfile
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from enum import Enum
+
 import matplotlib
 import matplotlib.pyplot as plt
 
 matplotlib.use('Agg')  # Use non-interactive backend
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 
@@ -13,6 +26,145 @@ from .metrics import PatternMetrics
 from .scoring import NormalizedDimensionScores
 from .statistics import StatisticalReport
 
+# Report figures are viewed on screen; layout is resolved once at draw time
+# by constrained_layout, so savefig needs no extra bbox_inches='tight' pass.
+_FIGURE_DPI = 150
+# zlib level 1 instead of PIL's default 6: roughly 10% faster savefig on
+# these charts for about twice the PNG size.
+_PNG_COMPRESS_LEVEL = 1
+
+# generate_all_plots records the inputs' fingerprint next to the figures and
+# skips rendering when a later call sees the same inputs and all files exist.
+_PLOTS_MANIFEST = ".plots_fingerprint.json"
+
+# Spawned workers each pay a fresh matplotlib import, so parallel rendering
+# is opt-in and only a few processes are worth starting.
+_MAX_PLOT_WORKERS = 4
+
+# Dimension axis labels, keyed by NormalizedDimensionScores field.
+_RADAR_DIM_LABELS: Dict[str, str] = {
+    'dim1_reasoning_quality': 'Dim1\nReasoning',
+    'dim2_cognitive_safety': 'Dim2\nCog Safety',
+    'dim3_action_decision_alignment': 'Dim3\nAlignment',
+    'dim4_success_efficiency': 'Dim4\nSuccess',
+    'dim5_behavioural_safety': 'Dim5\nBeh Safety',
+    'dim6_robustness_scalability': 'Dim6\nRobustness',
+    'dim7_controllability': 'Dim7\nControl',
+}
+_HEATMAP_DIM_KEYS: Tuple[Tuple[str, str], ...] = (
+    ('dim1_reasoning_quality', 'Dim 1\nReasoning'),
+    ('dim2_cognitive_safety', 'Dim 2\nCog Safety'),
+    ('dim3_action_decision_alignment', 'Dim 3\nAlignment'),
+    ('dim4_success_efficiency', 'Dim 4\nSuccess'),
+    ('dim5_behavioural_safety', 'Dim 5\nSafety'),
+    ('dim6_robustness_scalability', 'Dim 6\nRobustness'),
+    ('dim7_controllability', 'Dim 7\nControl'),
+)
+_HEATMAP_DIM_LABELS: Tuple[str, ...] = tuple(label for _, label in _HEATMAP_DIM_KEYS)
+
+
+def _save_figure(output_path: Path) -> None:
+    """Save the current figure as a report PNG."""
+    plt.savefig(
+        output_path, dpi=_FIGURE_DPI, pil_kwargs={"compress_level": _PNG_COMPRESS_LEVEL}
+    )
+
+
+def _picklable(obj: Any) -> bool:
+    """Whether *obj* can be sent to a worker process."""
+    try:
+        pickle.dumps(obj, protocol=4)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return False
+    return True
+
+
+def _style_rc() -> Dict[str, Any]:
+    """Snapshot of the active rcParams, minus the backend selection."""
+    return {k: v for k, v in plt.rcParams.items() if k != "backend"}
+
+
+def _render_plot(job: Tuple["EvaluationVisualizer", Dict[str, Any], str, tuple]) -> str:
+    """Process-pool worker: run one ``plot_*`` method and return its path.
+
+    Spawned workers unpickle the visualizer without running ``__init__``, so
+    the parent's rcParams travel with the job and are applied here.
+    """
+    visualizer, rc, name, args = job
+    with plt.rc_context(rc):  # type: ignore[arg-type]
+        path: str = getattr(visualizer, name)(*args)
+    return path
+
+
+def _canonical(obj: Any) -> Any:
+    """JSON-ready form of *obj* whose serialisation is stable across processes.
+
+    Object state (dataclass fields plus ad-hoc attributes such as
+    ``_normalised_scores``) is keyed by attribute name and sets are sorted;
+    dict order is kept because plots follow it.  Floats go through ``repr``
+    so they stay exact.  Memo fields (``compare=False``) are skipped.
+
+    Raises:
+        TypeError: For values with no known canonical form.
+    """
+    if obj is None or isinstance(obj, (bool, int, str)):
+        return obj
+    if isinstance(obj, float):
+        return repr(obj)
+    if isinstance(obj, Enum):
+        return _canonical(obj.value)
+    if isinstance(obj, dict):
+        return [[_canonical(k), _canonical(v)] for k, v in obj.items()]
+    if isinstance(obj, (list, tuple)):
+        return [_canonical(v) for v in obj]
+    if isinstance(obj, (set, frozenset)):
+        return sorted((_canonical(v) for v in obj), key=json.dumps)
+    if isinstance(obj, (array, np.ndarray)):
+        return _canonical(obj.tolist())
+    if dataclasses.is_dataclass(obj):
+        skip = {f.name for f in dataclasses.fields(obj) if not f.compare}
+        state = {
+            f.name: getattr(obj, f.name)
+            for f in dataclasses.fields(obj) if f.name not in skip
+        }
+        state.update(
+            (k, v) for k, v in getattr(obj, "__dict__", {}).items() if k not in skip
+        )
+    elif hasattr(obj, "__dict__"):
+        state = vars(obj)
+    else:
+        raise TypeError(f"no canonical form for {type(obj).__name__}")
+    return {
+        "__type__": type(obj).__qualname__,
+        "state": {k: _canonical(v) for k, v in state.items()},
+    }
+
+
+def _plots_fingerprint(
+    pattern_metrics: Dict[str, PatternMetrics],
+    statistical_report: Optional[StatisticalReport],
+    style: Dict[str, Any],
+) -> Optional[str]:
+    """Digest of everything the plots read, or None if it cannot be serialised.
+
+    Covers the inputs and the visualizer's styling (instance attributes and
+    the active matplotlib rcParams) as canonical sorted JSON; this module's
+    source and the matplotlib version are mixed in so code changes also
+    invalidate cached figures.
+    """
+    try:
+        payload = json.dumps(
+            _canonical((pattern_metrics, statistical_report, style)),
+            sort_keys=True, separators=(",", ":"),
+        )
+    except (TypeError, ValueError, RecursionError):
+        return None
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(Path(__file__).read_bytes())
+    digest.update(matplotlib.__version__.encode("ascii"))
+    digest.update(payload.encode("utf-8"))
+    return digest.hexdigest()
+
 
 class EvaluationVisualizer:
     """Generate visualizations for pattern evaluation results."""
@@ -35,6 +187,7 @@ class EvaluationVisualizer:
         self,
         pattern_metrics: Dict[str, PatternMetrics],
         statistical_report: Optional[StatisticalReport] = None,
+        max_workers: int = 1,
     ) -> List[str]:
         """Generate all visualization plots.
 
@@ -44,36 +197,41 @@ class EvaluationVisualizer:
                 When supplied, ``plot_success_rates`` overlays 95 % CI
                 error bars and an additional composite-score CI bar
                 plot is emitted.  No-op for single-run.
+            max_workers: Worker processes rendering plots in parallel,
+                capped at ``_MAX_PLOT_WORKERS`` and the plot count.  The
+                default, ``1``, renders in-process.
 
         Returns:
             List of generated file paths
         """
-        generated_files = []
-
-
-        # 1. Success rate comparison (with CI error bars when available)
-        path = self.plot_success_rates(pattern_metrics, statistical_report)
-        generated_files.append(path)
-
-        # 2. Efficiency comparison (with CI error bars when available)
-        path = self.plot_efficiency_comparison(pattern_metrics, statistical_report)
-        generated_files.append(path)
-
-        # 3. Robustness comparison
-        path = self.plot_robustness(pattern_metrics)
-        generated_files.append(path)
-
-        # 4. Controllability comparison
-        path = self.plot_controllability(pattern_metrics)
-        generated_files.append(path)
-
-        # 5. Multi-dimension radar chart
-        path = self.plot_radar_comparison(pattern_metrics)
-        generated_files.append(path)
-
-        # 6. Success by category
-        path = self.plot_success_by_category(pattern_metrics)
-        generated_files.append(path)
+        # One snapshot drives both the fingerprint and every render, so the
+        # cached style is the style the figures were drawn with.
+        rc = _style_rc()
+        fingerprint = _plots_fingerprint(
+            pattern_metrics, statistical_report, self._style_state(rc)
+        )
+        cached = self._cached_plots(fingerprint)
+        if cached is not None:
+            return cached
+        # Files are about to be overwritten; the old manifest no longer holds.
+        with contextlib.suppress(OSError):
+            (self.output_dir / _PLOTS_MANIFEST).unlink()
+
+        # Each job is (plot method name, args); the plots are independent.
+        jobs: List[Tuple[str, tuple]] = [
+            # 1. Success rate comparison (with CI error bars when available)
+            ("plot_success_rates", (pattern_metrics, statistical_report)),
+            # 2. Efficiency comparison (with CI error bars when available)
+            ("plot_efficiency_comparison", (pattern_metrics, statistical_report)),
+            # 3. Robustness comparison
+            ("plot_robustness", (pattern_metrics,)),
+            # 4. Controllability comparison
+            ("plot_controllability", (pattern_metrics,)),
+            # 5. Multi-dimension radar chart
+            ("plot_radar_comparison", (pattern_metrics,)),
+            # 6. Success by category
+            ("plot_success_by_category", (pattern_metrics,)),
+        ]
 
         # 7. Normalised dimension heatmap (Phase E)
         has_normalised = any(
@@ -81,26 +239,75 @@ class EvaluationVisualizer:
             for m in pattern_metrics.values()
         )
         if has_normalised:
-            path = self.plot_normalised_heatmap(pattern_metrics)
-            generated_files.append(path)
+            jobs.append(("plot_normalised_heatmap", (pattern_metrics,)))
 
         # 8. Composite-score CI bar plot (Phase F, multi-run only)
         if statistical_report is not None and statistical_report.num_runs > 1:
-            path = self.plot_composite_ci(statistical_report)
-            generated_files.append(path)
+            jobs.append(("plot_composite_ci", (statistical_report,)))
 
         # 9. Trade-off scatter: reasoning quality (Dim 1) vs avg latency.
         #    Phase G P3 deliverable -- pairs with the radar / heatmap to
         #    expose cross-dimension trade-offs without re-reading tables.
-        path = self.plot_tradeoff_reasoning_vs_efficiency(pattern_metrics)
-        generated_files.append(path)
+        jobs.append(("plot_tradeoff_reasoning_vs_efficiency", (pattern_metrics,)))
 
         # 10. Trade-off scatter: robustness (Dim 6) vs raw strict success.
-        path = self.plot_tradeoff_robustness_vs_success(pattern_metrics)
-        generated_files.append(path)
+        jobs.append(("plot_tradeoff_robustness_vs_success", (pattern_metrics,)))
 
+        max_workers = min(max_workers, len(jobs), _MAX_PLOT_WORKERS)
+        if max_workers > 1 and not _picklable((self, rc, jobs)):
+            max_workers = 1  # inputs cannot be shipped to worker processes
+        if max_workers <= 1:
+            generated_files = [getattr(self, name)(*args) for name, args in jobs]
+        else:
+            # Spawned, not forked: callers run inside an event loop with live
+            # executor (and possibly timed-out graph) threads, and forking a
+            # multi-threaded process can deadlock the child.
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            ) as pool:
+                generated_files = list(pool.map(
+                    _render_plot, [(self, rc, name, args) for name, args in jobs]
+                ))
+
+        self._save_plots_manifest(fingerprint, generated_files)
         return generated_files
 
+    def _style_state(self, rc: Dict[str, Any]) -> Dict[str, Any]:
+        """Instance styling plus the rcParams snapshot *rc* the plots use."""
+        return {
+            "instance": {k: v for k, v in vars(self).items() if k != "output_dir"},
+            "rc": {k: repr(v) for k, v in rc.items()},
+        }
+
+    def _cached_plots(self, fingerprint: Optional[str]) -> Optional[List[str]]:
+        """Return the files from a previous identical call, if all still exist."""
+        if fingerprint is None:
+            return None
+        try:
+            manifest = json.loads((self.output_dir / _PLOTS_MANIFEST).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(manifest, dict) or manifest.get("fingerprint") != fingerprint:
+            return None
+        files = manifest.get("files")
+        if not isinstance(files, list) or not all(Path(f).is_file() for f in files):
+            return None
+        return files
+
+    def _save_plots_manifest(self, fingerprint: Optional[str], files: List[str]) -> None:
+        """Atomically record which inputs produced *files*."""
+        if fingerprint is None:
+            return
+        fd, tmp_path = tempfile.mkstemp(dir=self.output_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"fingerprint": fingerprint, "files": files}, f)
+            os.replace(tmp_path, self.output_dir / _PLOTS_MANIFEST)
+        except OSError:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_path)
+
     def plot_success_rates(
         self,
         pattern_metrics: Dict[str, PatternMetrics],
@@ -131,7 +338,7 @@ class EvaluationVisualizer:
                     err_vals.append((summary.ci95_high - summary.mean) * 100)
             yerr = err_vals
 
-        fig, ax = plt.subplots(figsize=(10, 6))
+        fig, ax = plt.subplots(figsize=(10, 6), constrained_layout=True)
 
         bars = ax.bar(
             patterns,
@@ -143,13 +350,7 @@ class EvaluationVisualizer:
         )
 
         # Add value labels on bars
-        for bar in bars:
-            height = bar.get_height()
-            ax.text(
-                bar.get_x() + bar.get_width() / 2., height,
-                f'{height:.1f}%',
-                ha='center', va='bottom', fontsize=10, fontweight='bold'
-            )
+        ax.bar_label(bars, fmt='%.1f%%', fontsize=10, fontweight='bold')
 
         ax.set_ylabel('Success Rate (%)', fontsize=12, fontweight='bold')
         title = 'Pattern Success Rate Comparison'
@@ -159,9 +360,8 @@ class EvaluationVisualizer:
         ax.set_ylim(0, 110)
         ax.grid(axis='y', alpha=0.3)
 
-        plt.tight_layout()
         output_path = self.output_dir / "success_rate_comparison.png"
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
+        _save_figure(output_path)
         plt.close()
 
         return str(output_path)
@@ -193,7 +393,7 @@ class EvaluationVisualizer:
                 yerr_lat.append((lat_s.ci95_high - lat_s.mean) if lat_s else 0.0)
                 yerr_tok.append((tok_s.ci95_high - tok_s.mean) if tok_s else 0.0)
 
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
+        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6), constrained_layout=True)
 
         # Latency plot
         bars1 = ax1.bar(
@@ -204,13 +404,7 @@ class EvaluationVisualizer:
             capsize=6 if yerr_lat else 0,
             ecolor='black',
         )
-        for bar in bars1:
-            height = bar.get_height()
-            ax1.text(
-                bar.get_x() + bar.get_width() / 2., height,
-                f'{height:.2f}s',
-                ha='center', va='bottom', fontsize=9
-            )
+        ax1.bar_label(bars1, fmt='%.2fs', fontsize=9)
         ax1.set_ylabel('Average Latency (seconds)', fontsize=11, fontweight='bold')
         title = 'Average Response Latency'
         if yerr_lat:
@@ -227,13 +421,7 @@ class EvaluationVisualizer:
             capsize=6 if yerr_tok else 0,
             ecolor='black',
         )
-        for bar in bars2:
-            height = bar.get_height()
-            ax2.text(
-                bar.get_x() + bar.get_width() / 2., height,
-                f'{height:.0f}',
-                ha='center', va='bottom', fontsize=9
-            )
+        ax2.bar_label(bars2, fmt='%.0f', fontsize=9)
         ax2.set_ylabel('Average Token Count', fontsize=11, fontweight='bold')
         title2 = 'Average Token Usage'
         if yerr_tok:
@@ -241,9 +429,8 @@ class EvaluationVisualizer:
         ax2.set_title(title2, fontsize=12, fontweight='bold')
         ax2.grid(axis='y', alpha=0.3)
 
-        plt.tight_layout()
         output_path = self.output_dir / "efficiency_comparison.png"
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
+        _save_figure(output_path)
         plt.close()
 
         return str(output_path)
@@ -271,14 +458,14 @@ class EvaluationVisualizer:
             # Defensive: still produce a placeholder file so callers can
             # depend on a stable output path.
             output_path = self.output_dir / "composite_ci.png"
-            fig, ax = plt.subplots(figsize=(8, 4))
+            fig, ax = plt.subplots(figsize=(8, 4), constrained_layout=True)
             ax.text(0.5, 0.5, "No composite data", ha='center', va='center')
             ax.set_axis_off()
-            plt.savefig(output_path, dpi=300, bbox_inches='tight')
+            _save_figure(output_path)
             plt.close()
             return str(output_path)
 
-        fig, ax = plt.subplots(figsize=(10, 6))
+        fig, ax = plt.subplots(figsize=(10, 6), constrained_layout=True)
         bars = ax.bar(
             patterns,
             means,
@@ -301,9 +488,8 @@ class EvaluationVisualizer:
         ax.set_ylim(0, 1.05)
         ax.grid(axis='y', alpha=0.3)
 
-        plt.tight_layout()
         output_path = self.output_dir / "composite_ci.png"
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
+        _save_figure(output_path)
         plt.close()
 
         return str(output_path)
@@ -324,9 +510,9 @@ class EvaluationVisualizer:
         )
 
         if has_d1:
-            fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 6))
+            fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 6), constrained_layout=True)
         else:
-            fig, ax1 = plt.subplots(figsize=(10, 6))
+            fig, ax1 = plt.subplots(figsize=(10, 6), constrained_layout=True)
 
         x = np.arange(len(patterns))
         width = 0.35
@@ -336,13 +522,7 @@ class EvaluationVisualizer:
 
         # Add value labels
         for bars in [bars1, bars2]:
-            for bar in bars:
-                height = bar.get_height()
-                ax1.text(
-                    bar.get_x() + bar.get_width() / 2., height,
-                    f'{height:.1f}%',
-                    ha='center', va='bottom', fontsize=8
-                )
+            ax1.bar_label(bars, fmt='%.1f%%', fontsize=8)
 
         ax1.set_ylabel('Success Rate (%)', fontsize=12, fontweight='bold')
         ax1.set_title('Original vs Perturbed Performance', fontsize=12, fontweight='bold')
@@ -362,13 +542,7 @@ class EvaluationVisualizer:
             bars4 = ax2.bar(x + bar_width/2, scaling, bar_width, label='Scaling Score', color=self.colors[3])
 
             for bars in [bars3, bars4]:
-                for bar in bars:
-                    height = bar.get_height()
-                    ax2.text(
-                        bar.get_x() + bar.get_width() / 2., height,
-                        f'{height:.1f}%',
-                        ha='center', va='bottom', fontsize=8
-                    )
+                ax2.bar_label(bars, fmt='%.1f%%', fontsize=8)
 
             ax2.set_ylabel('Score (%)', fontsize=12, fontweight='bold')
             ax2.set_title('D1: Stability & Scaling', fontsize=12, fontweight='bold')
@@ -378,10 +552,9 @@ class EvaluationVisualizer:
             ax2.set_ylim(0, 110)
             ax2.grid(axis='y', alpha=0.3)
 
-        fig.suptitle('Robustness & Scalability (Dim 6)', fontsize=14, fontweight='bold', y=1.02)
-        plt.tight_layout()
+        fig.suptitle('Robustness & Scalability (Dim 6)', fontsize=14, fontweight='bold')
         output_path = self.output_dir / "robustness_comparison.png"
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
+        _save_figure(output_path)
         plt.close()
 
         return str(output_path)
@@ -404,21 +577,16 @@ class EvaluationVisualizer:
         x = np.arange(len(patterns))
         width = 0.35
 
-        fig, ax = plt.subplots(figsize=(10, 6))
+        fig, ax = plt.subplots(figsize=(10, 6), constrained_layout=True)
 
         bars1 = ax.bar(x - width/2, schema_compliance, width, label='Schema Compliance', color=self.colors[2])
         bars2 = ax.bar(x + width/2, overall_controllability, width, label='Overall Controllability', color=self.colors[3])
 
-        # Add value labels
-        for bars in [bars1, bars2]:
-            for bar in bars:
-                height = bar.get_height()
-                if height > 0:
-                    ax.text(
-                        bar.get_x() + bar.get_width() / 2., height,
-                        f'{height:.1f}%',
-                        ha='center', va='bottom', fontsize=8
-                    )
+        # Add value labels (zero-height bars stay unlabelled)
+        for bars, values in [(bars1, schema_compliance), (bars2, overall_controllability)]:
+            ax.bar_label(
+                bars, labels=[f'{v:.1f}%' if v > 0 else '' for v in values], fontsize=8
+            )
 
         ax.set_ylabel('Compliance Rate (%)', fontsize=12, fontweight='bold')
         ax.set_title('Controllability Metrics', fontsize=14, fontweight='bold')
@@ -428,9 +596,8 @@ class EvaluationVisualizer:
         ax.set_ylim(0, 110)
         ax.grid(axis='y', alpha=0.3)
 
-        plt.tight_layout()
         output_path = self.output_dir / "controllability_comparison.png"
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
+        _save_figure(output_path)
         plt.close()
 
         return str(output_path)
@@ -454,15 +621,7 @@ class EvaluationVisualizer:
 
         if has_normalised:
             # 7-dimension radar (show available dims)
-            dim_labels = {
-                'dim1_reasoning_quality': 'Dim1\nReasoning',
-                'dim2_cognitive_safety': 'Dim2\nCog Safety',
-                'dim3_action_decision_alignment': 'Dim3\nAlignment',
-                'dim4_success_efficiency': 'Dim4\nSuccess',
-                'dim5_behavioural_safety': 'Dim5\nBeh Safety',
-                'dim6_robustness_scalability': 'Dim6\nRobustness',
-                'dim7_controllability': 'Dim7\nControl',
-            }
+            dim_labels = _RADAR_DIM_LABELS
 
             # Determine which dims have data across any pattern
             active_dims = []
@@ -501,17 +660,17 @@ class EvaluationVisualizer:
                 controllability = metrics.controllability.overall_controllability() * 100
                 data.append([success, efficiency, robustness, controllability])
 
-        # Radar chart
-        angles = [n / float(N) * 2 * np.pi for n in range(N)]
-        data_np = np.array(data)
-
-        fig, ax = plt.subplots(figsize=(8, 8), subplot_kw=dict(projection='polar'))
+        # Radar chart; every polygon is closed at once by repeating column 0.
+        angles = np.arange(N) / float(N) * 2 * np.pi
+        angles_plot = np.append(angles, angles[0])
+        data_np = np.array(data, dtype=float).reshape(len(patterns), N)
+        closed = np.concatenate([data_np, data_np[:, :1]], axis=1)
 
-        for i, (pattern, pattern_data) in enumerate(zip(patterns, data_np)):
-            values = pattern_data.tolist()
-            values += values[:1]  # Close the loop
-            angles_plot = angles + angles[:1]
+        fig, ax = plt.subplots(
+            figsize=(8, 8), subplot_kw=dict(projection='polar'), constrained_layout=True
+        )
 
+        for i, (pattern, values) in enumerate(zip(patterns, closed)):
             ax.plot(angles_plot, values, 'o-', linewidth=2, label=pattern, color=self.colors[i])
             ax.fill(angles_plot, values, alpha=0.15, color=self.colors[i])
 
@@ -524,9 +683,8 @@ class EvaluationVisualizer:
         ax.legend(loc='upper right', bbox_to_anchor=(1.3, 1.1), fontsize=10)
         ax.set_title('Multi-Dimension Pattern Comparison', fontsize=14, fontweight='bold', pad=20)
 
-        plt.tight_layout()
         output_path = self.output_dir / "radar_comparison.png"
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
+        _save_figure(output_path)
         plt.close()
 
         return str(output_path)
@@ -538,30 +696,20 @@ class EvaluationVisualizer:
         """Plot normalised dimension scores as a heatmap."""
         patterns = list(pattern_metrics.keys())
 
-        dim_keys = [
-            ('dim1_reasoning_quality', 'Dim 1\nReasoning'),
-            ('dim2_cognitive_safety', 'Dim 2\nCog Safety'),
-            ('dim3_action_decision_alignment', 'Dim 3\nAlignment'),
-            ('dim4_success_efficiency', 'Dim 4\nSuccess'),
-            ('dim5_behavioural_safety', 'Dim 5\nSafety'),
-            ('dim6_robustness_scalability', 'Dim 6\nRobustness'),
-            ('dim7_controllability', 'Dim 7\nControl'),
-        ]
-
         # Build data matrix
         data = []
         for metrics in pattern_metrics.values():
             ns = getattr(metrics, '_normalised_scores', None)
             row = []
-            for key, _ in dim_keys:
+            for key, _ in _HEATMAP_DIM_KEYS:
                 val = getattr(ns, key, None) if ns else None
                 row.append(val if val is not None else 0.0)
             data.append(row)
 
         data_np = np.array(data)
-        dim_labels = [label for _, label in dim_keys]
+        dim_labels = _HEATMAP_DIM_LABELS
 
-        fig, ax = plt.subplots(figsize=(10, max(4, len(patterns) * 0.8)))
+        fig, ax = plt.subplots(figsize=(10, max(4, len(patterns) * 0.8)), constrained_layout=True)
 
         im = ax.imshow(data_np, cmap='RdYlGn', aspect='auto', vmin=0, vmax=1)
 
@@ -581,9 +729,8 @@ class EvaluationVisualizer:
 
         fig.colorbar(im, ax=ax, label='Score (0–1)', shrink=0.8)
 
-        plt.tight_layout()
         output_path = self.output_dir / "normalised_heatmap.png"
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
+        _save_figure(output_path)
         plt.close()
 
         return str(output_path)
@@ -596,40 +743,32 @@ class EvaluationVisualizer:
         patterns = list(pattern_metrics.keys())
 
         # Get all categories
-        all_categories: set[str] = set()
-        for metrics in pattern_metrics.values():
-            all_categories.update(metrics.success.success_by_category.keys())
-
-        categories = sorted(list(all_categories))
+        categories = sorted({
+            cat
+            for metrics in pattern_metrics.values()
+            for cat in metrics.success.success_by_category
+        })
 
-        # Prepare data
-        data = []
-        for metrics in pattern_metrics.values():
-            category_rates = [
-                metrics.success.success_by_category.get(cat, 0) * 100
-                for cat in categories
-            ]
-            data.append(category_rates)
+        # Prepare data: one row of category rates (%) per pattern
+        data = [
+            [metrics.success.success_by_category.get(cat, 0) * 100 for cat in categories]
+            for metrics in pattern_metrics.values()
+        ]
 
         # Plot grouped bar chart
         x = np.arange(len(categories))
         width = 0.8 / len(patterns)
 
-        fig, ax = plt.subplots(figsize=(12, 6))
+        fig, ax = plt.subplots(figsize=(12, 6), constrained_layout=True)
 
         for i, (pattern, pattern_data) in enumerate(zip(patterns, data)):
             offset = (i - len(patterns)/2 + 0.5) * width
             bars = ax.bar(x + offset, pattern_data, width, label=pattern, color=self.colors[i])
 
             # Add value labels (only if height > 5%)
-            for bar in bars:
-                height = bar.get_height()
-                if height > 5:
-                    ax.text(
-                        bar.get_x() + bar.get_width() / 2., height,
-                        f'{height:.0f}',
-                        ha='center', va='bottom', fontsize=7
-                    )
+            ax.bar_label(
+                bars, labels=[f'{h:.0f}' if h > 5 else '' for h in pattern_data], fontsize=7
+            )
 
         ax.set_ylabel('Success Rate (%)', fontsize=12, fontweight='bold')
         ax.set_title('Success Rate by Task Category', fontsize=14, fontweight='bold')
@@ -639,9 +778,8 @@ class EvaluationVisualizer:
         ax.set_ylim(0, 110)
         ax.grid(axis='y', alpha=0.3)
 
-        plt.tight_layout()
         output_path = self.output_dir / "success_by_category.png"
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
+        _save_figure(output_path)
         plt.close()
 
         return str(output_path)
@@ -845,7 +983,7 @@ class EvaluationVisualizer:
                 eval_labels.append(name)
                 eval_colors.append(colour)
 
-        fig, ax = plt.subplots(figsize=(10, 6))
+        fig, ax = plt.subplots(figsize=(10, 6), constrained_layout=True)
 
         if eval_x:
             ax.scatter(
@@ -907,9 +1045,8 @@ class EvaluationVisualizer:
         ax.grid(True, which='both', alpha=0.3)
         ax.legend(loc='lower right', fontsize=9, framealpha=0.9)
 
-        plt.tight_layout()
         output_path = self.output_dir / "tradeoff_reasoning_vs_efficiency.png"
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
+        _save_figure(output_path)
         plt.close()
 
         return str(output_path)
@@ -947,7 +1084,7 @@ class EvaluationVisualizer:
         # visible; ceiling implicit in the data (worst case ~60%).
         sizes = [80.0 + 8.0 * d for d in degradations]
 
-        fig, ax = plt.subplots(figsize=(10, 6))
+        fig, ax = plt.subplots(figsize=(10, 6), constrained_layout=True)
 
         ax.scatter(
             successes,
@@ -1002,9 +1139,8 @@ class EvaluationVisualizer:
             title='Bubble size',
         )
 
-        plt.tight_layout()
         output_path = self.output_dir / "tradeoff_robustness_vs_success.png"
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
+        _save_figure(output_path)
         plt.close()
 
         return str(output_path)
@@ -1016,8 +1152,8 @@ def _regenerate_from_json(
 ) -> List[str]:
     """Regenerate the figure set from a saved evaluation JSON (CLI helper).
 
-    Reads ``evaluation_results.json`` (the schema written by
-    ``ReportGenerator.generate_json_report``), hydrates ``PatternMetrics``
+    Reads ``evaluation_results.json`` or its ``.json.gz`` form (the schema
+    written by ``ReportGenerator.generate_json_report``), hydrates ``PatternMetrics``
     and writes every figure ``EvaluationVisualizer.generate_all_plots``
     knows how to emit into ``output_dir``.
 
@@ -1027,9 +1163,8 @@ def _regenerate_from_json(
     this path. Single-run callers re-running ``run_evaluation.py`` still
     get the full Phase F treatment via the in-memory pipeline.
     """
-    import json
-
-    with open(json_path, encoding='utf-8') as fh:
+    opener = gzip.open if str(json_path).endswith('.gz') else open
+    with opener(json_path, 'rt', encoding='utf-8') as fh:
         data = json.load(fh)
 
     pattern_metrics = EvaluationVisualizer.hydrate_pattern_metrics_from_json(data)
@@ -5,7 +5,9 @@ Supports: Ollama, Groq, Cerebras, Google Gemini.
 
 import logging
 import os
-from typing import Optional
+import time
+from functools import cache
+from typing import Dict, Optional
 
 from langchain.chat_models import init_chat_model
 
@@ -21,13 +23,15 @@ _JUDGE_FALLBACK_WARNED = False
 # Phase F — Reproducibility helpers
 # ---------------------------------------------------------------------------
 
+@cache
 def _ollama_supports_seed() -> bool:
     """Check whether the installed ``langchain_ollama`` exposes ``seed``.
 
     Phase F spec section 5.6 requires that we honestly report whether
     determinism is available.  The current ``ChatOllama`` lists ``seed``
-    in its pydantic model fields; older versions did not.  We probe
-    once and cache the result in :data:`_OLLAMA_SEED_SUPPORTED`.
+    in its pydantic model fields; older versions did not.  We probe on
+    first use and cache the result, so processes that never touch the
+    Ollama provider do not import ``langchain_ollama`` at all.
     """
     try:
         from langchain_ollama import ChatOllama
@@ -39,7 +43,35 @@ def _ollama_supports_seed() -> bool:
     return "seed" in fields
 
 
-_OLLAMA_SEED_SUPPORTED: bool = _ollama_supports_seed()
+# Connection-pool sizing for the Ollama HTTP clients.  httpx defaults to
+# 100 connections / 20 keep-alive; we keep the connection cap and raise the
+# keep-alive pool so concurrent ``abatch`` / parallel task runs reuse warm
+# sockets instead of reconnecting.  (Passing ``httpx.Limits`` without
+# ``max_connections`` would mean no cap at all.)
+_OLLAMA_POOL_LIMITS = {"max_connections": 100, "max_keepalive_connections": 64}
+_OLLAMA_TIMEOUT_S = 120.0
+
+
+# check_setup() remembers when each Ollama base URL last answered, and skips
+# the HTTP probe within the TTL. Failures are not cached, so a server that
+# has just been started is seen on the next check.
+_OLLAMA_PROBE_TTL_S = 30.0
+_OLLAMA_PROBE_OK: Dict[str, float] = {}
+
+
+def _ollama_client_kwargs() -> dict:
+    """Build ``client_kwargs`` for ``ChatOllama`` (timeout + pool limits).
+
+    A fresh dict is returned on every call because ``ChatOllama`` merges
+    auth headers into the mapping it is given.
+    """
+    kwargs: dict = {"timeout": _OLLAMA_TIMEOUT_S}
+    try:
+        import httpx
+    except ImportError:
+        return kwargs
+    kwargs["limits"] = httpx.Limits(**_OLLAMA_POOL_LIMITS)
+    return kwargs
 
 
 def _resolve_seed(explicit: Optional[int]) -> Optional[int]:
@@ -58,37 +90,100 @@ def _resolve_seed(explicit: Optional[int]) -> Optional[int]:
         return None
 
 
+# Chat models are built once per resolved configuration: every pattern module
+# and judge calls ``get_llm()`` and would otherwise get its own client (and
+# HTTP connection pool) for the same model.
+@cache
+def _build_chat_model(
+    provider: str,
+    model_name: str,
+    model_string: str,
+    base_url: Optional[str],
+    seed: Optional[int],
+):
+    # Special handling for Ollama
+    if provider == "ollama":
+        # Use ChatOllama directly for better tool support
+        try:
+            from langchain_ollama import ChatOllama
+            kwargs = dict(
+                model=model_name,
+                base_url=base_url,
+                temperature=0,
+                num_ctx=16384,
+                num_predict=2048,
+                client_kwargs=_ollama_client_kwargs(),
+            )
+            # Only set seed when the installed ChatOllama actually
+            # supports it; older versions silently ignore unknown
+            # kwargs in pydantic, but here we want a hard guarantee.
+            if seed is not None and _ollama_supports_seed():
+                kwargs["seed"] = seed
+            return ChatOllama(**kwargs)
+        except ImportError:
+            # Fallback to init_chat_model
+            return init_chat_model(
+                model_string,
+                model_provider="ollama",
+                base_url=base_url,
+            )
+    return init_chat_model(model_string)
+
+
 class LLMConfig:
     """Configuration for LLM providers."""
 
-    # Provider configurations
+    # Provider configurations.  ``model``/``base_url`` are defaults; the
+    # ``*_env`` variables override them at call time (see provider_config).
     PROVIDERS = {
         "ollama": {
-            "model": os.getenv("OLLAMA_MODEL", "llama3.2"),
-            "base_url": os.getenv("OLLAMA_BASE_URL", "http://localhost:11434"),
+            "model": "llama3.2",
+            "model_env": "OLLAMA_MODEL",
+            "base_url": "http://localhost:11434",
+            "base_url_env": "OLLAMA_BASE_URL",
             "model_string": "ollama:{model}",
             "requires_api_key": False,
         },
         "groq": {
-            "model": os.getenv("GROQ_MODEL", "llama-3.1-8b-instant"),
+            "model": "llama-3.1-8b-instant",
+            "model_env": "GROQ_MODEL",
             "api_key_env": "GROQ_API_KEY",
             "model_string": "groq:{model}",
             "requires_api_key": True,
         },
         "cerebras": {
-            "model": os.getenv("CEREBRAS_MODEL", "llama3.1-8b"),
+            "model": "llama3.1-8b",
+            "model_env": "CEREBRAS_MODEL",
             "api_key_env": "CEREBRAS_API_KEY",
             "model_string": "cerebras:{model}",
             "requires_api_key": True,
         },
         "google_genai": {
-            "model": os.getenv("GEMINI_MODEL", "gemini-2.0-flash"),
+            "model": "gemini-2.0-flash",
+            "model_env": "GEMINI_MODEL",
             "api_key_env": "GOOGLE_API_KEY",
             "model_string": "google_genai:{model}",
             "requires_api_key": True,
         },
     }
 
+    @staticmethod
+    def provider_config(provider: str) -> dict:
+        """Return *provider*'s configuration with env overrides applied.
+
+        The environment is read on every call, so a ``.env`` loaded after
+        this module was imported (or a changed variable) is honoured.
+
+        Raises:
+            KeyError: If *provider* is not in ``PROVIDERS``
+        """
+        config = dict(LLMConfig.PROVIDERS[provider])
+        for key in ("model", "base_url"):
+            env_var = config.get(f"{key}_env")
+            if env_var:
+                config[key] = os.getenv(str(env_var), config[key])
+        return config
+
     @staticmethod
     def get_model(provider: Optional[str] = None, seed: Optional[int] = None):
         """Get initialized chat model for specified provider.
@@ -103,7 +198,8 @@ class LLMConfig:
                 fallback.
 
         Returns:
-            Initialized chat model
+            Initialized chat model, shared by all calls that resolve to the
+            same provider, model, base URL and seed
 
         Raises:
             ValueError: If provider is invalid or API key is missing
@@ -120,7 +216,7 @@ class LLMConfig:
                 f"Available: {list(LLMConfig.PROVIDERS.keys())}"
             )
 
-        config = LLMConfig.PROVIDERS[provider]
+        config = LLMConfig.provider_config(provider)
 
         # Check API key if required
         if config["requires_api_key"]:
@@ -140,36 +236,10 @@ class LLMConfig:
         # Resolve seed (explicit arg > EVAL_SEED env var > None).
         resolved_seed = _resolve_seed(seed)
 
-        # Special handling for Ollama
-        if provider == "ollama":
-            base_url = str(config["base_url"])
-
-            # Use ChatOllama directly for better tool support
-            try:
-                from langchain_ollama import ChatOllama
-                kwargs = dict(
-                    model=model_name,
-                    base_url=base_url,
-                    temperature=0,
-                    num_ctx=16384,
-                    num_predict=2048,
-                    client_kwargs={"timeout": 120.0},
-                )
-                # Only set seed when the installed ChatOllama actually
-                # supports it; older versions silently ignore unknown
-                # kwargs in pydantic, but here we want a hard guarantee.
-                if resolved_seed is not None and _OLLAMA_SEED_SUPPORTED:
-                    kwargs["seed"] = resolved_seed
-                return ChatOllama(**kwargs)
-            except ImportError:
-                # Fallback to init_chat_model
-                return init_chat_model(
-                    model_string,
-                    model_provider="ollama",
-                    base_url=base_url,
-                )
-        else:
-            return init_chat_model(model_string)
+        base_url = str(config["base_url"]) if provider == "ollama" else None
+        return _build_chat_model(
+            provider, model_name, model_string, base_url, resolved_seed
+        )
 
     @staticmethod
     def get_model_info(provider: Optional[str] = None) -> dict:
@@ -193,11 +263,11 @@ class LLMConfig:
         if provider not in LLMConfig.PROVIDERS:
             return {"error": f"Unknown provider: {provider}"}
 
-        config = LLMConfig.PROVIDERS[provider]
+        config = LLMConfig.provider_config(provider)
 
         seed_value = _resolve_seed(None)
         # Only Ollama exposes seed today via ChatOllama.model_fields.
-        seed_supported = provider == "ollama" and _OLLAMA_SEED_SUPPORTED
+        seed_supported = provider == "ollama" and _ollama_supports_seed()
 
         return {
             "provider": provider,
@@ -217,7 +287,7 @@ class LLMConfig:
         - If ``JUDGE_OLLAMA_MODEL`` env var is set, build a ``ChatOllama``
           using that model name with the same Ollama base URL / determinism
           settings as ``get_model()`` (temperature=0, num_ctx=16384,
-          num_predict=2048, 120 s timeout).
+          num_predict=2048, 120 s timeout, shared pool limits).
         - Otherwise, log a one-time warning and fall back to
           ``LLMConfig.get_model()`` so the code still runs end-to-end on
           machines that have not pulled a second model.
@@ -230,10 +300,7 @@ class LLMConfig:
         judge_model = os.getenv("JUDGE_OLLAMA_MODEL")
 
         if judge_model:
-            base_url = os.getenv(
-                "OLLAMA_BASE_URL",
-                str(LLMConfig.PROVIDERS["ollama"]["base_url"]),
-            )
+            base_url = str(LLMConfig.provider_config("ollama")["base_url"])
             try:
                 from langchain_ollama import ChatOllama
                 return ChatOllama(
@@ -242,7 +309,7 @@ class LLMConfig:
                     temperature=0,
                     num_ctx=16384,
                     num_predict=2048,
-                    client_kwargs={"timeout": 120.0},
+                    client_kwargs=_ollama_client_kwargs(),
                 )
             except ImportError:
                 # Fallback: use init_chat_model with the ollama provider.
@@ -288,7 +355,7 @@ class LLMConfig:
                 "message": f"Unknown provider: {provider}",
             }
 
-        config = LLMConfig.PROVIDERS[provider]
+        config = LLMConfig.provider_config(provider)
 
         # Check API key if required
         if config["requires_api_key"]:
@@ -305,15 +372,20 @@ class LLMConfig:
         if provider == "ollama":
             import requests
             base_url = str(config["base_url"])
+            ok_result = {
+                "status": "ok",
+                "provider": provider,
+                "model": config["model"],
+                "message": "Ollama is running",
+            }
+            probed_at = _OLLAMA_PROBE_OK.get(base_url)
+            if probed_at is not None and time.monotonic() - probed_at < _OLLAMA_PROBE_TTL_S:
+                return ok_result
             try:
                 response = requests.get(f"{base_url}/api/tags", timeout=5)
                 if response.status_code == 200:
-                    return {
-                        "status": "ok",
-                        "provider": provider,
-                        "model": config["model"],
-                        "message": "Ollama is running",
-                    }
+                    _OLLAMA_PROBE_OK[base_url] = time.monotonic()
+                    return ok_result
                 else:
                     return {
                         "status": "error",
@@ -15,4 +15,4 @@ def get_current_date() -> str:
     Returns:
         the current date, format as YYYY-MM-DD
     """
-    return datetime.datetime.today().strftime("%Y-%m-%d")
+    return datetime.date.today().isoformat()
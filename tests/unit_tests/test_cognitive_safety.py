@@ -606,6 +606,25 @@ class TestEdgeCases:
         out = CognitiveSafetyScreener().screen_task(task, result)
         assert out.consistency_score == pytest.approx(1.0)
 
+    @pytest.mark.parametrize("output,flagged", [
+        ("DEFINITELY London.", True),
+        ("It's 100% London", True),
+        ("Without A Doubt: London", True),
+        ("I am fairly sure it is London", False),
+        ("London, I think.", False),
+    ])
+    def test_confidence_phrases_match_case_insensitively(self, output, flagged):
+        """Any CONFIDENCE_PHRASES entry, in any case, triggers the branch."""
+        task = _FakeTask(id="C", prompt="x", ground_truth="Paris")
+        result = _FakeResult(
+            task_id="C", output=output, judge_success=False,
+            trace=_trace([_think(0, "Hmm.")]),
+        )
+        out = CognitiveSafetyScreener().screen_task(task, result)
+        assert any(
+            s.pattern == "confident_but_wrong" for s in out.flagged_segments
+        ) is flagged
+
     def test_no_policy_means_no_constraint_violation(self):
         """policy=None -> constraint_adherence_score = 1.0, no flags."""
         task = _FakeTask(id="P", prompt="x", ground_truth=None, policy=None)
@@ -0,0 +1,593 @@
+"""Unit tests for the PatternEvaluator task runner.
+
+Drives ``_run_tasks`` / ``_run_robustness_tests`` with an in-process fake
+graph so no LLM backend is required.
+"""
+
+import asyncio
+import sys
+import threading
+import time
+
+import pytest
+from langchain_core.messages import AIMessage
+
+from src.evaluation.evaluator import PatternEvaluator
+from src.evaluation.test_suite import TestTask
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+class _FakeGraph:
+    """Synchronous graph stub that answers with the task's ground truth."""
+
+    def __init__(self, answers, sleep: float = 0.0):
+        self.answers = answers
+        self.sleep = sleep
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def invoke(self, payload):
+        prompt = payload["messages"][0]["content"]
+        with self._lock:
+            self.calls.append(prompt)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self.sleep:
+                time.sleep(self.sleep)
+            answer = next(
+                (a for key, a in self.answers.items() if key in prompt), "nope"
+            )
+            return {"messages": [AIMessage(content=answer)]}
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+class _AsyncFakeGraph(_FakeGraph):
+    """Graph stub exposing the native ``ainvoke`` coroutine."""
+
+    async def ainvoke(self, payload):
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self.sleep:
+                await asyncio.sleep(self.sleep)
+            prompt = payload["messages"][0]["content"]
+            self.calls.append(prompt)
+            answer = next(
+                (a for key, a in self.answers.items() if key in prompt), "nope"
+            )
+            return {"messages": [AIMessage(content=answer)]}
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+    def invoke(self, payload):
+        raise AssertionError("sync invoke should not be used when ainvoke exists")
+
+
+def _make_task(task_id: str, ground_truth: str = "42", perturbations=None) -> TestTask:
+    return TestTask(
+        id=task_id,
+        category="baseline",
+        complexity="simple",
+        prompt=f"prompt for {task_id}",
+        ground_truth=ground_truth,
+        judge={"mode": "exact"},
+        robustness={"perturbations": perturbations} if perturbations else None,
+    )
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+# ---------------------------------------------------------------------------
+# Concurrency
+# ---------------------------------------------------------------------------
+
+
+class TestRunTasks:
+    def test_results_preserve_task_order(self):
+        tasks = [_make_task(f"T{i}", ground_truth=str(i)) for i in range(6)]
+        graph = _FakeGraph({f"prompt for T{i}": str(i) for i in range(6)}, sleep=0.01)
+        evaluator = PatternEvaluator(delay_between_tasks=0, task_concurrency=3)
+
+        results = _run(evaluator._run_tasks("Fake", graph, tasks))
+
+        assert [r.task_id for r in results] == [t.id for t in tasks]
+        assert all(r.judge_success for r in results)
+
+    def test_concurrency_is_bounded(self):
+        tasks = [_make_task(f"T{i}") for i in range(8)]
+        graph = _FakeGraph({"prompt": "42"}, sleep=0.05)
+        evaluator = PatternEvaluator(delay_between_tasks=0, task_concurrency=2)
+
+        _run(evaluator._run_tasks("Fake", graph, tasks))
+
+        assert graph.max_in_flight == 2
+
+    def test_default_is_sequential(self):
+        tasks = [_make_task(f"T{i}") for i in range(4)]
+        graph = _FakeGraph({"prompt": "42"}, sleep=0.01)
+        evaluator = PatternEvaluator(delay_between_tasks=0)
+
+        _run(evaluator._run_tasks("Fake", graph, tasks))
+
+        assert graph.max_in_flight == 1
+
+    def test_explicit_prompts_replace_task_prompts(self):
+        tasks = [_make_task("T1"), _make_task("T2")]
+        graph = _FakeGraph({"alt": "42"})
+        evaluator = PatternEvaluator(delay_between_tasks=0)
+
+        results = _run(
+            evaluator._run_tasks("Fake", graph, tasks, ["alt one", "alt two"])
+        )
+
+        assert all(r.judge_success for r in results)
+        assert [c.split("\n")[0] for c in graph.calls] == ["alt one", "alt two"]
+
+    def test_per_task_progress_is_logged_not_printed(self, caplog, capsys):
+        tasks = [_make_task("T1"), _make_task("T2")]
+        evaluator = PatternEvaluator(delay_between_tasks=0)
+
+        with caplog.at_level("DEBUG", logger="src.evaluation.evaluator"):
+            _run(evaluator._run_tasks("Fake", _FakeGraph({"prompt": "42"}), tasks))
+
+        assert [r.getMessage().split(":")[0] for r in caplog.records] == [
+            "Fake T1",
+            "Fake T2",
+        ]
+        assert capsys.readouterr().out == ""
+
+    def test_large_suite_uses_fixed_worker_pool(self):
+        tasks = [_make_task(f"T{i}") for i in range(50)]
+        graph = _AsyncFakeGraph({"prompt": "42"})
+        evaluator = PatternEvaluator(delay_between_tasks=0, task_concurrency=3)
+
+        async def _count_tasks():
+            seen = []
+            real = evaluator._run_single_task
+
+            async def _spy(*args):
+                seen.append(len(asyncio.all_tasks()))
+                return await real(*args)
+
+            evaluator._run_single_task = _spy
+            results = await evaluator._run_tasks("Fake", graph, tasks)
+            return results, max(seen)
+
+        results, peak_tasks = _run(_count_tasks())
+
+        assert [r.task_id for r in results] == [t.id for t in tasks]
+        assert all(r.judge_success for r in results)
+        # main task + 3 workers (plus at most one ainvoke future per worker)
+        assert peak_tasks <= 1 + 3 * 2
+
+    def test_job_error_does_not_hang_pool(self):
+        tasks = [_make_task(f"T{i}") for i in range(5)]
+        evaluator = PatternEvaluator(delay_between_tasks=0, task_concurrency=2)
+
+        async def _boom(pattern_name, graph, task, prompt):
+            from src.evaluation.evaluator import TaskResult
+
+            if task.id == "T1":
+                raise RuntimeError("boom")
+            return TaskResult(task.id, task.category, task.complexity, pattern_name)
+
+        evaluator._run_single_task = _boom
+
+        try:
+            _run(evaluator._run_tasks("Fake", _FakeGraph({}), tasks))
+        except RuntimeError as exc:
+            assert str(exc) == "boom"
+        else:
+            raise AssertionError("expected RuntimeError")
+
+    def test_robustness_runs_every_perturbation(self):
+        tasks = [
+            _make_task("T1", perturbations=["variant a", "variant b"]),
+            _make_task("T2"),
+        ]
+        graph = _FakeGraph({"variant": "42"})
+        evaluator = PatternEvaluator(delay_between_tasks=0, task_concurrency=4)
+
+        results = _run(evaluator._run_robustness_tests("Fake", graph, tasks))
+
+        assert [r.task_id for r in results] == ["T1", "T1"]
+        assert len(graph.calls) == 2
+
+    def test_perturbations_are_expanded_once_per_task(self, monkeypatch):
+        tasks = [_make_task("T1", perturbations=["variant a", "variant b"])]
+        calls = []
+        real = TestTask.get_perturbations
+
+        def _counting(task):
+            calls.append(task.id)
+            return real(task)
+
+        monkeypatch.setattr(TestTask, "get_perturbations", _counting)
+        evaluator = PatternEvaluator(delay_between_tasks=0)
+
+        _run(
+            evaluator._run_robustness_tests(
+                "Fake", _FakeGraph({"variant": "42"}), tasks
+            )
+        )
+
+        assert calls == ["T1"]
+
+
+# ---------------------------------------------------------------------------
+# Graph invocation (native async vs. thread fallback)
+# ---------------------------------------------------------------------------
+
+
+class TestInvokeGraph:
+    def test_prefers_ainvoke(self):
+        tasks = [_make_task(f"T{i}") for i in range(4)]
+        graph = _AsyncFakeGraph({"prompt": "42"}, sleep=0.02)
+        evaluator = PatternEvaluator(delay_between_tasks=0, task_concurrency=4)
+
+        results = _run(evaluator._run_tasks("Fake", graph, tasks))
+
+        assert graph.max_in_flight == 4
+        assert all(r.judge_success for r in results)
+
+    def test_ainvoke_timeout(self):
+        graph = _AsyncFakeGraph({"prompt": "42"}, sleep=1.0)
+        evaluator = PatternEvaluator(delay_between_tasks=0, task_timeout=0.05)
+
+        [result] = _run(evaluator._run_tasks("Fake", graph, [_make_task("T1")]))
+
+        assert result.success is False
+        assert result.error.startswith("Task timed out")
+        assert result.latency < 0.5
+
+    def test_task_timeout_override_cancels_run(self):
+        graph = _AsyncFakeGraph({"prompt": "42"}, sleep=1.0)
+        evaluator = PatternEvaluator(delay_between_tasks=0, task_timeout=30)
+        task = _make_task("T1")
+        task.timeout = 0.05
+
+        [result] = _run(evaluator._run_tasks("Fake", graph, [task]))
+
+        assert result.error.startswith("Task timed out after 0.05s")
+        # The cancelled run never reached its answer.
+        assert graph.calls == []
+        assert graph.in_flight == 0
+
+    def test_long_output_is_truncated_after_judging(self):
+        from src.evaluation.evaluator import MAX_OUTPUT_CHARS
+
+        task = _make_task("T1")
+        task.judge = {"mode": "regex", "pattern": r"42$"}
+        graph = _FakeGraph({"prompt": "x" * (MAX_OUTPUT_CHARS * 2) + "42"})
+        evaluator = PatternEvaluator(delay_between_tasks=0)
+
+        [result] = _run(evaluator._run_tasks("Fake", graph, [task]))
+
+        assert result.judge_success  # judged on the full text
+        assert len(result.output) == MAX_OUTPUT_CHARS
+
+    def test_sync_fallback_timeout(self):
+        graph = _FakeGraph({"prompt": "42"}, sleep=0.3)
+        evaluator = PatternEvaluator(delay_between_tasks=0, task_timeout=0.05)
+
+        [result] = _run(evaluator._run_tasks("Fake", graph, [_make_task("T1")]))
+
+        assert result.success is False
+        assert result.error.startswith("Task timed out")
+
+
+# ---------------------------------------------------------------------------
+# Rate limiting
+# ---------------------------------------------------------------------------
+
+
+class TestRateLimiter:
+    def test_task_starts_are_spaced(self):
+        tasks = [_make_task(f"T{i}") for i in range(3)]
+        graph = _FakeGraph({"prompt": "42"})
+        evaluator = PatternEvaluator(delay_between_tasks=0.1)
+
+        start = time.monotonic()
+        _run(evaluator._run_tasks("Fake", graph, tasks))
+
+        # First start is immediate, the next two wait ~0.1s each.
+        assert time.monotonic() - start >= 0.18
+
+    def test_slow_tasks_are_not_followed_by_idle_wait(self):
+        tasks = [_make_task(f"T{i}") for i in range(3)]
+        graph = _FakeGraph({"prompt": "42"}, sleep=0.15)
+        evaluator = PatternEvaluator(delay_between_tasks=0.15)
+
+        start = time.monotonic()
+        _run(evaluator._run_tasks("Fake", graph, tasks))
+
+        # 3 x 0.15s of work; a fixed post-task sleep would add another ~0.3s.
+        assert time.monotonic() - start < 0.65
+
+    def test_zero_delay_disables_limiter(self):
+        assert PatternEvaluator(delay_between_tasks=0)._rate_limiter is None
+
+
+# ---------------------------------------------------------------------------
+# evaluate_pattern end-to-end (original + perturbed)
+# ---------------------------------------------------------------------------
+
+
+class TestEvaluatePattern:
+    def test_original_and_perturbed_batches_overlap(self, monkeypatch):
+        monkeypatch.setenv("LLM_PROVIDER", "ollama")
+        tasks = [
+            _make_task("T1", perturbations=["variant a"]),
+            _make_task("T2", perturbations=["variant b"]),
+        ]
+        graph = _FakeGraph({"prompt": "42", "variant a": "42"}, sleep=0.05)
+        evaluator = PatternEvaluator(delay_between_tasks=0, task_concurrency=4)
+        monkeypatch.setattr(
+            "src.evaluation.evaluator.compute_task_reasoning_quality",
+            lambda task, result, judge: None,
+        )
+
+        metrics = _run(evaluator.evaluate_pattern("Fake", graph, tasks))
+
+        assert graph.max_in_flight == 4
+        assert metrics.success.success_rate() == 1.0
+        assert metrics.robustness.perturbation_variant_count == 2
+        assert metrics.robustness.perturbed_success_rate == 0.5
+
+    def test_sequential_run_judges_after_timed_batch(self, monkeypatch):
+        monkeypatch.setenv("LLM_PROVIDER", "ollama")
+        tasks = [_make_task(f"T{i}") for i in range(3)]
+        graph = _FakeGraph({"prompt": "42"}, sleep=0.05)
+        evaluator = PatternEvaluator(delay_between_tasks=0)
+        seen_by_judge = []
+        monkeypatch.setattr(
+            "src.evaluation.evaluator.compute_task_reasoning_quality",
+            lambda task, result, judge: seen_by_judge.append(
+                (len(graph.calls), graph.in_flight)
+            ),
+        )
+
+        _run(evaluator.evaluate_pattern("Fake", graph, tasks, include_robustness=False))
+
+        # No judge call overlapped a timed run.
+        assert seen_by_judge == [(3, 0)] * 3
+
+    def test_concurrent_run_judging_shares_task_slots(self, monkeypatch):
+        monkeypatch.setenv("LLM_PROVIDER", "ollama")
+        tasks = [_make_task(f"T{i}") for i in range(4)]
+        graph = _FakeGraph({"prompt": "42"}, sleep=0.05)
+        evaluator = PatternEvaluator(delay_between_tasks=0, task_concurrency=2)
+        busy = []
+
+        def _judge(task, result, judge):
+            with graph._lock:
+                graph.in_flight += 1
+                busy.append(graph.in_flight)
+            time.sleep(0.05)
+            with graph._lock:
+                graph.in_flight -= 1
+
+        monkeypatch.setattr(
+            "src.evaluation.evaluator.compute_task_reasoning_quality", _judge
+        )
+
+        _run(evaluator.evaluate_pattern("Fake", graph, tasks, include_robustness=False))
+
+        assert len(busy) == 4
+        assert max(busy + [graph.max_in_flight]) <= 2
+
+    def test_failed_batch_cancels_pending_judging(self, monkeypatch):
+        from src.evaluation.evaluator import TaskResult
+
+        monkeypatch.setenv("LLM_PROVIDER", "ollama")
+        tasks = [_make_task(f"T{i}") for i in range(3)]
+        evaluator = PatternEvaluator(delay_between_tasks=0, task_concurrency=2)
+        monkeypatch.setattr(
+            "src.evaluation.evaluator.compute_task_reasoning_quality",
+            lambda task, result, judge: time.sleep(0.2),
+        )
+
+        async def _flaky(pattern_name, graph, task, prompt):
+            if task.id == "T2":
+                raise RuntimeError("boom")
+            return TaskResult(task.id, task.category, task.complexity, pattern_name)
+
+        evaluator._run_single_task = _flaky
+
+        async def _drive():
+            with pytest.raises(RuntimeError, match="boom"):
+                await evaluator.evaluate_pattern(
+                    "Fake", _FakeGraph({}), tasks, include_robustness=False
+                )
+            return [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+
+        assert _run(_drive()) == []
+
+
+class TestEvaluateMultiplePatterns:
+    def _patch_judge(self, monkeypatch):
+        monkeypatch.setenv("LLM_PROVIDER", "ollama")
+        monkeypatch.setattr(
+            "src.evaluation.evaluator.compute_task_reasoning_quality",
+            lambda task, result, judge: None,
+        )
+
+    def test_patterns_run_concurrently_and_keep_order(self, monkeypatch):
+        from src.evaluation.evaluator import evaluate_multiple_patterns
+
+        self._patch_judge(monkeypatch)
+        tasks = [_make_task("T1"), _make_task("T2")]
+        shared = _FakeGraph({"prompt": "42"}, sleep=0.05)
+
+        results = _run(
+            evaluate_multiple_patterns(
+                {"A": shared, "B": shared, "C": shared},
+                test_tasks=tasks,
+                include_robustness=False,
+                delay_between_tasks=0,
+                max_concurrency=3,
+            )
+        )
+
+        assert list(results) == ["A", "B", "C"]
+        assert shared.max_in_flight == 3
+        assert all(m.success.success_rate() == 1.0 for m in results.values())
+
+    def test_sequential_mode_runs_one_pattern_at_a_time(self, monkeypatch):
+        from src.evaluation.evaluator import evaluate_multiple_patterns
+
+        self._patch_judge(monkeypatch)
+        shared = _FakeGraph({"prompt": "42"}, sleep=0.02)
+
+        _run(
+            evaluate_multiple_patterns(
+                {"A": shared, "B": shared},
+                test_tasks=[_make_task("T1")],
+                include_robustness=False,
+                delay_between_tasks=0,
+                parallel=False,
+                max_concurrency=4,
+            )
+        )
+
+        assert shared.max_in_flight == 1
+
+
+# ---------------------------------------------------------------------------
+# Judge verdict cache
+# ---------------------------------------------------------------------------
+
+
+class TestJudgeCache:
+    def test_repeated_output_is_judged_once(self, monkeypatch):
+        from src.evaluation import evaluator as ev
+
+        calls = []
+        real = ev.Judge.evaluate_both
+
+        def _counting(*args, **kwargs):
+            calls.append(args[0])
+            return real(*args, **kwargs)
+
+        monkeypatch.setattr(ev, "_judge_cache", ev.OrderedDict())
+        monkeypatch.setattr(ev.Judge, "evaluate_both", staticmethod(_counting))
+        task = _make_task("T1")
+
+        first = ev._judge_with_cache("The answer is 42", task)
+        second = ev._judge_with_cache("The answer is 42", task)
+
+        assert first == second == (False, first[1], True, first[3])
+        assert calls == ["The answer is 42"]
+
+    def test_surrounding_whitespace_shares_entry_for_exact_mode(self):
+        from src.evaluation.evaluator import _judge_cache_key
+
+        task = _make_task("T1")
+        assert _judge_cache_key("42", task) == _judge_cache_key("\n 42 \n", task)
+
+        regex_task = _make_task("T2")
+        regex_task.judge = {"mode": "regex", "pattern": r"^42$"}
+        assert _judge_cache_key("42", regex_task) != _judge_cache_key(" 42", regex_task)
+
+    def test_key_depends_on_ground_truth(self):
+        from src.evaluation.evaluator import _judge_cache_key
+
+        assert _judge_cache_key("42", _make_task("T1", "42")) != _judge_cache_key(
+            "42", _make_task("T1", "43")
+        )
+
+
+# ---------------------------------------------------------------------------
+# Metric collection
+# ---------------------------------------------------------------------------
+
+
+class TestCollectSuccessMetrics:
+    def test_single_pass_tallies(self):
+        from src.evaluation.evaluator import TaskResult
+        from src.evaluation.metrics import SuccessMetrics
+
+        tasks = [_make_task("T1"), _make_task("T2"), _make_task("T3")]
+        tasks[2].category = "reasoning"
+        tasks[2].complexity = "complex"
+        results = [
+            TaskResult(
+                "T1",
+                "baseline",
+                "simple",
+                "P",
+                judge_success=True,
+                lenient_judge_success=True,
+            ),
+            TaskResult("T2", "baseline", "simple", "P", lenient_judge_success=True),
+            TaskResult("T3", "reasoning", "complex", "P"),
+        ]
+        metrics = SuccessMetrics()
+
+        PatternEvaluator()._collect_success_metrics(metrics, results, tasks)
+
+        assert (
+            metrics.total_tasks,
+            metrics.successful_tasks,
+            metrics.lenient_successful_tasks,
+            metrics.failed_tasks,
+        ) == (3, 1, 2, 2)
+        assert metrics.success_by_category == {"baseline": 0.5, "reasoning": 0.0}
+        assert metrics.success_by_complexity == {"simple": 0.5, "complex": 0.0}
+
+
+class TestTaskResult:
+    def test_has_no_instance_dict(self):
+        from src.evaluation.evaluator import TaskResult
+
+        if sys.version_info < (3, 10):
+            pytest.skip("dataclass slots require Python 3.10+")
+        result = TaskResult("T1", "baseline", "simple", "P")
+        assert not hasattr(result, "__dict__")
+        assert result.to_dict()["task_id"] == "T1"
+
+
+class TestCollectControllabilityMetrics:
+    def test_schema_and_tool_policy_lookup(self):
+        from src.evaluation.evaluator import TaskResult
+        from src.evaluation.metrics import ControllabilityMetrics
+
+        json_task = _make_task("J1")
+        json_task.schema = {"type": "object"}
+        tool_task = _make_task("W1")
+        tool_task.policy = {"tool_whitelist": ["calculator"]}
+        results = [
+            TaskResult(
+                "J1",
+                "baseline",
+                "simple",
+                "P",
+                success=True,
+                judge_success=True,
+                schema_compliant=True,
+            ),
+            TaskResult("W1", "baseline", "simple", "P", success=True),
+        ]
+        metrics = ControllabilityMetrics()
+
+        PatternEvaluator()._collect_controllability_metrics(
+            metrics, results, [json_task, tool_task]
+        )
+
+        assert metrics.total_json_tasks == 1
+        assert metrics.schema_compliant_tasks == 1
+        assert metrics.total_tool_tasks == 1
+        assert metrics.tool_policy_compliant_tasks == 1
+        assert metrics.format_compliance_rate == 0.5
@@ -0,0 +1,569 @@
+"""Unit tests for the rule-based Judge (exact / json / regex / lenient modes)."""
+
+import pytest
+
+from src.evaluation.judge import Judge
+from src.evaluation.test_suite import TEST_SUITE
+
+PRODUCT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "name": {"type": "string"},
+        "price": {"type": "number"},
+    },
+    "required": ["name", "price"],
+}
+
+
+# (output, ground_truth, judge_config, schema)
+CASES = [
+    ("408", "408", {"mode": "exact"}, None),
+    ("The answer is 408.", "408", {"mode": "exact"}, None),
+    ("paris", "Paris", {"mode": "exact"}, None),
+    ("The capital is **Paris**.", "Paris", {"mode": "exact"}, None),
+    ("20.0", "20", {"mode": "exact"}, None),
+    ("Normalised: 2025-10-12", "2025-10-12", {"mode": "exact"}, None),
+    ("Lyon", "Paris", {"mode": "exact"}, None),
+    (
+        '{"name": "iPhone 15", "price": 999}',
+        {"name": "iPhone 15", "price": 999},
+        {"mode": "json"},
+        PRODUCT_SCHEMA,
+    ),
+    (
+        '```json\n{"name": "iphone 15", "price": 999.0}\n```',
+        {"name": "iPhone 15", "price": 999},
+        {"mode": "json"},
+        PRODUCT_SCHEMA,
+    ),
+    (
+        'Here: {"name": "iPhone 15"}',
+        {"name": "iPhone 15", "price": 999},
+        {"mode": "json"},
+        PRODUCT_SCHEMA,
+    ),
+    ("not json", {"a": 1}, {"mode": "json"}, None),
+    (
+        '{"a": 1, "ts": 5}',
+        {"a": 1, "ts": 9},
+        {"mode": "json", "ignore_fields": ["ts"]},
+        None,
+    ),
+    ("PARIS", None, {"mode": "regex", "pattern": r"(?i)^paris$"}, None),
+    ("  paris", None, {"mode": "regex", "pattern": r"(?i)^paris$"}, None),
+    ("paris city", None, {"mode": "regex", "pattern": r"(?i)^paris$"}, None),
+    ("the answer is −3", "-3", {"mode": "lenient"}, None),
+    ("5 - 8 = 4", "-3", {"mode": "lenient"}, None),
+    ("anything", "x", {"mode": "nope"}, None),
+]
+
+
+class TestEvaluate:
+    def test_exact_strict_vs_lenient(self):
+        assert Judge.evaluate("paris", "Paris", {"mode": "exact"}) == (
+            False,
+            "Mismatch: got 'paris', expected 'Paris'",
+        )
+        ok, _ = Judge.evaluate("paris", "Paris", {"mode": "exact"}, lenient=True)
+        assert ok
+
+    def test_json_schema_failure(self):
+        ok, msg = Judge.evaluate(
+            '{"name": "x"}', None, {"mode": "json"}, PRODUCT_SCHEMA
+        )
+        assert not ok
+        assert msg.startswith("Schema validation failed")
+
+    def test_json_schema_message_matches_jsonschema_validate(self):
+        from jsonschema import ValidationError, validate
+
+        bad = {"name": 1}
+        with pytest.raises(ValidationError) as excinfo:
+            validate(instance=bad, schema=PRODUCT_SCHEMA)
+
+        _, msg = Judge.evaluate('{"name": 1}', None, {"mode": "json"}, PRODUCT_SCHEMA)
+        assert msg == f"Schema validation failed: {excinfo.value.message}"
+
+    def test_json_schema_validator_is_cached(self):
+        from src.evaluation import judge as judge_module
+
+        judge_module._VALIDATOR_CACHE.clear()
+        for _ in range(3):
+            Judge.evaluate(
+                '{"name": "x", "price": 1}', None, {"mode": "json"}, PRODUCT_SCHEMA
+            )
+        Judge.evaluate(
+            '{"name": "x", "price": 1}',
+            None,
+            {"mode": "json"},
+            dict(reversed(list(PRODUCT_SCHEMA.items()))),
+        )
+
+        assert len(judge_module._VALIDATOR_CACHE) == 1
+
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            '{"name": "x", "price": 1}',
+            '{"name": 1}',
+            '{"price": "1"}',
+        ],
+    )
+    def test_fastjsonschema_does_not_change_verdicts(self, monkeypatch, payload):
+        pytest.importorskip("fastjsonschema")
+        from src.evaluation import judge as judge_module
+
+        config = {"mode": "json"}
+        with_fast = Judge.evaluate(payload, None, config, PRODUCT_SCHEMA)
+        monkeypatch.setattr(judge_module, "fastjsonschema", None)
+        assert Judge.evaluate(payload, None, config, PRODUCT_SCHEMA) == with_fast
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            '{"a": 1, "b": [1.5, "x", null, true]}',
+            '{"big": 123456789012345678901234567890}',
+            '{"x": NaN}',
+        ],
+    )
+    def test_json_loads_matches_stdlib(self, text):
+        import json
+
+        from src.evaluation.judge import _json_loads
+
+        assert repr(_json_loads(text)) == repr(json.loads(text))
+
+    def test_json_ignore_fields(self):
+        ok, _ = Judge.evaluate(
+            '{"a": 1, "ts": 5}',
+            {"a": 1, "ts": 9},
+            {"mode": "json", "ignore_fields": ["ts"]},
+        )
+        assert ok
+
+    @pytest.mark.parametrize(
+        "output,ground_truth",
+        [
+            ('{"price": 999.0, "ok": true}', {"price": 999, "ok": 1}),
+            (
+                '{"b": [1, {"y": 2, "x": 1}], "a": 0}',
+                {"a": 0, "b": [1, {"x": 1, "y": 2}]},
+            ),
+        ],
+    )
+    def test_json_equality_is_value_based(self, output, ground_truth):
+        ok, _ = Judge.evaluate(output, ground_truth, {"mode": "json"})
+        assert ok
+
+    def test_json_ignore_fields_many_entries(self):
+        ignore = [f"f{i}" for i in range(50)] + ["ts"]
+        ok, msg = Judge.evaluate(
+            '{"a": 1, "ts": 5, "f3": 0}',
+            {"a": 1, "ts": 9},
+            {"mode": "json", "ignore_fields": ignore},
+        )
+        assert ok
+        assert msg == f"JSON match (ignoring {ignore}): {{'a': 1}}"
+
+    def test_regex(self):
+        assert Judge.evaluate(
+            "PARIS", None, {"mode": "regex", "pattern": r"(?i)^paris$"}
+        )[0]
+
+    def test_regex_pattern_compiled_once(self):
+        from src.evaluation.judge import _compile_user_pattern
+
+        _compile_user_pattern.cache_clear()
+        config = {"mode": "regex", "pattern": r"^\d+$"}
+        for output in ("1", "22", "x"):
+            Judge.evaluate(output, None, config)
+
+        info = _compile_user_pattern.cache_info()
+        assert (info.misses, info.hits) == (1, 2)
+
+    @pytest.mark.parametrize(
+        "output,expected",
+        [
+            ("The answer is: Carol.", "Carol"),
+            ("Based on the heights, **Carol**.", "Carol"),
+            ("it is   Carol!", "Carol"),
+            ("The answer is: it is Carol", "Carol"),
+            ("Carol, of course", "Carol, of course"),
+        ],
+    )
+    def test_extract_answer_strips_prefix_phrases(self, output, expected):
+        assert Judge._extract_answer(output, "Anna", {"mode": "exact"}) == expected
+
+    @pytest.mark.parametrize(
+        "output,ground_truth,expected",
+        [
+            ("The cost of 12 apples is $20.", "20", "20"),
+            ("I think 7, no wait 8", "20", "7"),
+            ("Normalised to ISO 2025-10-12", "2025-10-12", "2025-10-12"),
+            ("Anna is the shortest.", "anna", "Anna"),
+            ("The answer is Bob and co.", "Carol", "Bob and co"),
+            ("nothing to see", "a" * 40, "nothing to see"),
+        ],
+    )
+    def test_extract_answer_by_ground_truth_kind(self, output, ground_truth, expected):
+        assert (
+            Judge._extract_answer(output, ground_truth, {"mode": "exact"}) == expected
+        )
+
+    def test_ground_truth_classified_once(self):
+        from src.evaluation.judge import _classify_gt
+
+        _classify_gt.cache_clear()
+        for output in ("is 20", "is 21", "none"):
+            Judge._extract_answer(output, 20, {"mode": "exact"})
+
+        info = _classify_gt.cache_info()
+        assert (info.misses, info.hits) == (1, 2)
+
+    def test_invalid_regex(self):
+        ok, msg = Judge.evaluate("x", None, {"mode": "regex", "pattern": "("})
+        assert not ok
+        assert msg.startswith("Regex error")
+
+
+class TestEvaluateBatch:
+    def test_in_process_matches_evaluate(self):
+        items = [(o, gt, cfg, schema) for o, gt, cfg, schema in CASES]
+        items.append(("paris", "Paris", {"mode": "exact"}, None, True))
+
+        assert Judge.evaluate_batch(items) == [Judge.evaluate(*item) for item in items]
+
+    def test_process_pool_preserves_order(self):
+        items = [(str(i), str(i % 3), {"mode": "exact"}) for i in range(12)]
+
+        results = Judge.evaluate_batch(items, max_workers=2, chunksize=4)
+
+        assert results == [Judge.evaluate(*item) for item in items]
+
+    @pytest.mark.parametrize("size", [2, 6])
+    def test_rejects_items_outside_three_to_five_elements(self, size):
+        item = ("408", "408", {"mode": "exact"}, None, False, True)[:size]
+
+        with pytest.raises(ValueError, match="3 to 5 elements"):
+            Judge.evaluate_batch([item])
+
+
+class TestNeedExplanation:
+    @pytest.mark.parametrize("output,ground_truth,config,schema", CASES)
+    def test_only_success_explanations_are_dropped(
+        self, output, ground_truth, config, schema
+    ):
+        for lenient in (False, True):
+            full = Judge.evaluate(output, ground_truth, config, schema, lenient=lenient)
+            terse = Judge.evaluate(
+                output,
+                ground_truth,
+                config,
+                schema,
+                lenient=lenient,
+                need_explanation=False,
+            )
+            assert terse == ((True, "") if full[0] else full)
+
+    def test_json_success_does_not_stringify_output(self):
+        class _NoRepr(dict):
+            def __repr__(self):
+                raise AssertionError("success explanation was formatted")
+
+        ok, msg = Judge._compare_json(
+            _NoRepr(a=1), {"a": 1}, {"mode": "json"}, explain=False
+        )
+        assert (ok, msg) == (True, "")
+
+    @pytest.mark.parametrize(
+        "helper,args",
+        [
+            (Judge._judge_exact, ("paris", "Paris", True)),
+            (
+                Judge._judge_regex,
+                ("Paris", {"mode": "regex", "pattern": r"(?i)^paris$"}),
+            ),
+            (Judge._judge_lenient_numeric, ("the answer is \u22123", "-3")),
+            (Judge._judge_lenient_numeric, ("ANNA", "Anna")),
+        ],
+    )
+    def test_every_mode_skips_success_message(self, helper, args):
+        assert helper(*args, explain=False) == (True, "")
+        assert helper(*args)[1]
+
+    def test_batch_forwards_flag(self):
+        items = [("408", "408", {"mode": "exact"}), ("1", "2", {"mode": "exact"})]
+
+        results = Judge.evaluate_batch(items, need_explanation=False)
+
+        assert results == [(True, ""), Judge.evaluate(*items[1])]
+
+
+class TestCompileConfig:
+    @pytest.mark.parametrize("output,ground_truth,config,schema", CASES)
+    def test_compiled_config_matches_dict(self, output, ground_truth, config, schema):
+        compiled = Judge.compile_config(config, schema)
+
+        for lenient in (False, True):
+            assert Judge.evaluate(output, ground_truth, compiled, lenient=lenient) == (
+                Judge.evaluate(output, ground_truth, config, schema, lenient=lenient)
+            )
+        assert Judge.evaluate_both(output, ground_truth, compiled) == (
+            Judge.evaluate_both(output, ground_truth, config, schema)
+        )
+
+    def test_compiled_once_per_config(self):
+        config = {"mode": "json", "ignore_fields": ["ts"]}
+
+        compiled = Judge.compile_config(config, PRODUCT_SCHEMA)
+
+        assert Judge.compile_config(dict(config), PRODUCT_SCHEMA) is compiled
+        assert Judge.compile_config(compiled) is compiled
+        assert compiled.ignore_fields == frozenset({"ts"})
+        assert compiled.schema_key is not None
+
+
+class TestWhitespaceInvariance:
+    @pytest.mark.parametrize(
+        "output,ground_truth,config,schema",
+        [c for c in CASES if c[2]["mode"] in ("exact", "json")],
+    )
+    def test_exact_and_json_ignore_surrounding_whitespace(
+        self, output, ground_truth, config, schema
+    ):
+        # The evaluator's judge cache relies on this to key on output.strip().
+        assert Judge.evaluate_both(output, ground_truth, config, schema) == (
+            Judge.evaluate_both(f"\n  {output} \n", ground_truth, config, schema)
+        )
+
+
+class TestEvaluateBoth:
+    @pytest.mark.parametrize("output,ground_truth,config,schema", CASES)
+    def test_matches_two_separate_calls(self, output, ground_truth, config, schema):
+        strict = Judge.evaluate(output, ground_truth, config, schema, lenient=False)
+        lenient = Judge.evaluate(output, ground_truth, config, schema, lenient=True)
+
+        assert Judge.evaluate_both(output, ground_truth, config, schema) == (
+            *strict,
+            *lenient,
+        )
+
+    @pytest.mark.parametrize("task", TEST_SUITE, ids=lambda t: t.id)
+    def test_matches_on_test_suite_ground_truth(self, task):
+        output = (
+            task.ground_truth
+            if isinstance(task.ground_truth, str)
+            else str(task.ground_truth)
+        )
+        strict = Judge.evaluate(output, task.ground_truth, task.judge, task.schema)
+        lenient = Judge.evaluate(
+            output, task.ground_truth, task.judge, task.schema, lenient=True
+        )
+
+        assert Judge.evaluate_both(
+            output, task.ground_truth, task.judge, task.schema
+        ) == (*strict, *lenient)
+
+    @pytest.mark.parametrize(
+        "output,ground_truth,config,schema",
+        [
+            ("408", "408", {"mode": "exact"}, None),
+            ('{"a": 1}', {"a": 1}, {"mode": "json"}, None),
+        ],
+    )
+    def test_strict_pass_skips_lenient(
+        self, monkeypatch, output, ground_truth, config, schema
+    ):
+        real_evaluate = Judge.evaluate
+        real_compare = Judge._compare_json
+        lenient_calls = []
+
+        def _evaluate(*args, lenient=False, **kwargs):
+            lenient_calls.append(lenient)
+            return real_evaluate(*args, lenient=lenient, **kwargs)
+
+        def _compare(parsed, gt, cfg, lenient=False, **kwargs):
+            lenient_calls.append(lenient)
+            return real_compare(parsed, gt, cfg, lenient, **kwargs)
+
+        monkeypatch.setattr(Judge, "evaluate", staticmethod(_evaluate))
+        monkeypatch.setattr(Judge, "_compare_json", staticmethod(_compare))
+
+        ok, msg, lenient_ok, lenient_msg = Judge.evaluate_both(
+            output, ground_truth, config, schema
+        )
+
+        assert ok and lenient_ok and msg == lenient_msg
+        assert True not in lenient_calls
+
+
+class TestExtractAndParseJson:
+    @pytest.mark.parametrize(
+        "text,expected",
+        [
+            ('{"a": 1}', {"a": 1}),
+            ('```json\n{"a": 1}\n```', {"a": 1}),
+            ("```\n[1, 2]\n```", [1, 2]),
+            ('Result: {"a": {"b": 2}} -- done}', {"a": {"b": 2}}),
+            ('First {"a": 1} then {"b": 2}', {"a": 1}),
+            ('{not json} but {"a": 1}', {"a": 1}),
+            ('```python\nx = 1\n```\n{"a": 1}', {"a": 1}),
+        ],
+    )
+    def test_extracts_first_complete_value(self, text, expected):
+        assert Judge._extract_and_parse_json(text) == expected
+
+    def test_raises_when_nothing_decodes(self):
+        with pytest.raises(ValueError, match="Could not extract valid JSON"):
+            Judge._extract_and_parse_json("no json {here")
+
+    def test_long_unbalanced_input_is_linearish(self):
+        import time
+
+        text = "x" * 200_000 + "{" + "y" * 200_000
+        start = time.perf_counter()
+        with pytest.raises(ValueError):
+            Judge._extract_and_parse_json(text)
+        assert time.perf_counter() - start < 1.0
+
+
+class _CountingLLM:
+    def __init__(self):
+        self.calls = 0
+
+    def invoke(self, messages):
+        from types import SimpleNamespace
+
+        self.calls += 1
+        return SimpleNamespace(
+            content='{"relevance": 8, "accuracy": 6, '
+            '"completeness": 7, "conciseness": 9}'
+        )
+
+
+class _AsyncCountingLLM(_CountingLLM):
+    def __init__(self, failures=0):
+        super().__init__()
+        self.failures = failures
+        self.in_flight = self.peak = 0
+
+    async def ainvoke(self, messages):
+        import asyncio
+
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            if self.failures:
+                self.failures -= 1
+                raise RuntimeError("Error code: 429 - rate limit exceeded")
+            return self.invoke(messages)
+        finally:
+            self.in_flight -= 1
+
+
+class TestLLMJudgeAsync:
+    def _judge(self, monkeypatch, llm):
+        import src.llm_config
+        from src.evaluation import judge as judge_module
+
+        monkeypatch.setattr(src.llm_config, "get_llm", lambda: llm)
+        monkeypatch.setattr(judge_module, "_LLM_BACKOFF_SEC", 0.0)
+        return judge_module.LLMJudge()
+
+    def test_bounded_concurrency_and_order(self, monkeypatch):
+        import asyncio
+
+        llm = _AsyncCountingLLM()
+        judge = self._judge(monkeypatch, llm)
+        items = [("q", f"out {i}", "gt") for i in range(10)] + [("q", "out 0", "gt")]
+
+        results = asyncio.run(judge.aevaluate(items, max_concurrency=3))
+
+        assert len(results) == 11
+        assert all(r["overall"] == 7.5 for r in results)
+        assert llm.peak <= 3
+        calls = llm.calls
+        asyncio.run(judge.aevaluate([("q", "out 0", "gt")]))
+        assert llm.calls == calls  # served from the response cache
+
+    def test_rate_limited_calls_are_retried(self, monkeypatch):
+        import asyncio
+
+        llm = _AsyncCountingLLM(failures=2)
+        judge = self._judge(monkeypatch, llm)
+
+        (result,) = asyncio.run(judge.aevaluate([("q", "out")]))
+
+        assert result["overall"] == 7.5
+        assert llm.calls == 1
+
+    def test_other_errors_fall_back_to_neutral_scores(self, monkeypatch):
+        import asyncio
+
+        class _Broken(_AsyncCountingLLM):
+            async def ainvoke(self, messages):
+                raise ValueError("boom")
+
+        judge = self._judge(monkeypatch, _Broken())
+
+        (result,) = asyncio.run(judge.aevaluate([("q", "out")]))
+
+        assert result["overall"] == 5.0
+        assert result["explanation"] == "LLM evaluation failed: boom"
+
+
+class TestLLMJudgeCache:
+    @pytest.fixture
+    def llm(self, monkeypatch):
+        import src.llm_config
+
+        llm = _CountingLLM()
+        monkeypatch.setattr(src.llm_config, "get_llm", lambda: llm)
+        return llm
+
+    def test_repeat_call_is_served_from_memory(self, llm):
+        from src.evaluation.judge import LLMJudge
+
+        judge = LLMJudge()
+        first = judge.evaluate("q", "out", "gt")
+
+        assert judge.evaluate("q", "out", "gt") == first
+        assert first["overall"] == 7.5
+        assert llm.calls == 1
+        judge.evaluate("q", "other", "gt")
+        assert llm.calls == 2
+
+    def test_disk_cache_survives_new_instance(self, llm, tmp_path):
+        from src.evaluation.judge import LLMJudge
+
+        first = LLMJudge(cache_dir=tmp_path).evaluate("q", "out")
+        second = LLMJudge(cache_dir=tmp_path).evaluate("q", "out")
+
+        assert first == second
+        assert llm.calls == 1
+        assert [p.suffix for p in tmp_path.iterdir()] == [".json"]
+
+    def test_disk_cache_is_keyed_on_resolved_model(self, llm, tmp_path):
+        from src.evaluation.judge import LLMJudge
+
+        llm.model = "llama3.2"
+        LLMJudge(cache_dir=tmp_path).evaluate("q", "out")
+        llm.model = "qwen2.5:7b"
+        LLMJudge(cache_dir=tmp_path).evaluate("q", "out")
+
+        assert llm.calls == 2
+
+    def test_disk_cache_is_keyed_on_prompt(self, llm, tmp_path, monkeypatch):
+        from src.evaluation.judge import LLMJudge
+
+        LLMJudge(cache_dir=tmp_path).evaluate("q", "out")
+        build = LLMJudge._build_evaluation_prompt
+        monkeypatch.setattr(
+            LLMJudge,
+            "_build_evaluation_prompt",
+            lambda self, *args: build(self, *args) + "\nBe strict.",
+        )
+        LLMJudge(cache_dir=tmp_path).evaluate("q", "out")
+
+        assert llm.calls == 2
@@ -0,0 +1,87 @@
+"""Unit tests for LLM model construction."""
+
+import pytest
+
+from src import llm_config
+from src.llm_config import LLMConfig
+
+pytest.importorskip("langchain_ollama")
+
+
+@pytest.fixture(autouse=True)
+def _fresh_model_cache(monkeypatch):
+    monkeypatch.delenv("EVAL_SEED", raising=False)
+    llm_config._build_chat_model.cache_clear()
+    yield
+    llm_config._build_chat_model.cache_clear()
+
+
+class TestGetModel:
+    def test_same_configuration_shares_one_client(self):
+        assert LLMConfig.get_model("ollama") is LLMConfig.get_model("OLLAMA")
+
+    def test_seed_is_part_of_the_key(self):
+        assert LLMConfig.get_model("ollama", seed=1) is not LLMConfig.get_model(
+            "ollama", seed=2
+        )
+
+    def test_missing_api_key_still_raises(self, monkeypatch):
+        monkeypatch.delenv("GROQ_API_KEY", raising=False)
+        with pytest.raises(ValueError, match="GROQ_API_KEY"):
+            LLMConfig.get_model("groq")
+
+
+class TestProviderConfig:
+    def test_env_overrides_are_read_at_call_time(self, monkeypatch):
+        monkeypatch.delenv("OLLAMA_MODEL", raising=False)
+        assert LLMConfig.provider_config("ollama")["model"] == "llama3.2"
+
+        monkeypatch.setenv("OLLAMA_MODEL", "qwen2.5:7b")
+        monkeypatch.setenv("OLLAMA_BASE_URL", "http://gpu-box:11434")
+
+        config = LLMConfig.provider_config("ollama")
+        assert (config["model"], config["base_url"]) == (
+            "qwen2.5:7b",
+            "http://gpu-box:11434",
+        )
+        assert LLMConfig.get_model_info("ollama")["model"] == "qwen2.5:7b"
+        assert LLMConfig.PROVIDERS["ollama"]["model"] == "llama3.2"
+
+
+class TestCheckSetup:
+    def test_successful_ollama_probe_is_reused_within_ttl(self, monkeypatch):
+        import requests
+
+        calls = []
+
+        class _Response:
+            status_code = 200
+
+        def fake_get(url, timeout):
+            calls.append(url)
+            return _Response()
+
+        monkeypatch.setattr(requests, "get", fake_get)
+        monkeypatch.setattr(llm_config, "_OLLAMA_PROBE_OK", {})
+
+        first = LLMConfig.check_setup("ollama")
+        second = LLMConfig.check_setup("ollama")
+
+        assert first == second and first["status"] == "ok"
+        assert len(calls) == 1
+
+    def test_failed_probe_is_not_cached(self, monkeypatch):
+        import requests
+
+        calls = []
+
+        def failing_get(url, timeout):
+            calls.append(url)
+            raise requests.ConnectionError("refused")
+
+        monkeypatch.setattr(requests, "get", failing_get)
+        monkeypatch.setattr(llm_config, "_OLLAMA_PROBE_OK", {})
+
+        assert LLMConfig.check_setup("ollama")["status"] == "error"
+        assert LLMConfig.check_setup("ollama")["status"] == "error"
+        assert len(calls) == 2
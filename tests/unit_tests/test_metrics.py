@@ -0,0 +1,154 @@
+"""Unit tests for MetricsAggregator cross-pattern comparison."""
+
+import sys
+
+import pytest
+
+from src.evaluation.metrics import (
+    AlignmentMetrics,
+    BehaviouralSafetyMetrics,
+    EfficiencyMetrics,
+    MetricsAggregator,
+    PatternMetrics,
+    RobustnessMetrics,
+    SuccessMetrics,
+    _argmax_argmin,
+)
+
+
+def _pattern(name, successes, latencies, degradation=0.0, original=1.0):
+    return PatternMetrics(
+        pattern_name=name,
+        success=SuccessMetrics(total_tasks=4, successful_tasks=successes),
+        efficiency=EfficiencyMetrics(latencies=latencies),
+        robustness=RobustnessMetrics(
+            original_success_rate=original, degradation_percentage=degradation
+        ),
+    )
+
+
+class TestArgmaxArgmin:
+    @pytest.mark.parametrize(
+        "scores",
+        [
+            {"a": 1.0},
+            {"a": 0.5, "b": 0.9, "c": 0.1},
+            {"a": 0.5, "b": 0.5, "c": 0.5},
+            {"a": 0.2, "b": 0.9, "c": 0.9, "d": 0.2},
+        ],
+    )
+    def test_matches_builtin_max_min(self, scores):
+        assert _argmax_argmin(scores) == (
+            max(scores, key=scores.get),
+            min(scores, key=scores.get),
+        )
+
+
+class TestComparePatterns:
+    def test_dimension_winners(self):
+        patterns = {
+            "A": _pattern("A", 3, [2.0], degradation=10.0),
+            "B": _pattern("B", 4, [5.0], degradation=40.0),
+            "C": _pattern("C", 1, [], degradation=0.0, original=0.0),
+        }
+
+        comparison = MetricsAggregator.compare_patterns(patterns)
+
+        success = comparison["success_dimension"]
+        assert (success["best_pattern"], success["worst_pattern"]) == ("B", "C")
+        efficiency = comparison["efficiency_dimension"]
+        # C has no successful tasks (latency 0) and is excluded.
+        assert (efficiency["fastest_pattern"], efficiency["slowest_pattern"]) == (
+            "A",
+            "B",
+        )
+        robustness = comparison["robustness_dimension"]
+        # C's 0% degradation is ignored because its original success is 0.
+        assert robustness["most_robust_pattern"] == "A"
+        assert robustness["least_robust_pattern"] == "B"
+
+
+class TestEfficiencyFinalize:
+    def test_aggregates_are_memoised_after_finalize(self):
+        eff = EfficiencyMetrics(latencies=[1.0, 3.0]).finalize()
+        assert eff.avg_latency() == 2.0
+
+        # Bypass the reset hook: a memoised value must not be recomputed.
+        object.__setattr__(eff, "latencies", (100.0,))
+
+        assert eff.avg_latency() == 2.0
+        assert eff.to_dict()["avg_latency_sec"] == 2.0
+
+    def test_finalize_packs_series_into_typed_arrays(self):
+        from array import array
+
+        eff = EfficiencyMetrics()
+        eff.record(1.5, 10, 4, 3, 1)
+        eff.record(2.5, 20, 6, 5, 0)
+        eff.finalize()
+
+        assert eff.latencies == array("d", [1.5, 2.5])
+        assert eff.input_tokens == array("q", [10, 20])
+        assert eff.tool_call_counts == array("q", [1, 0])
+        assert eff.avg_total_tokens() == 20.0
+        assert eff.to_dict()["total_input_tokens"] == 30
+
+    def test_reassigning_series_clears_memo(self):
+        eff = EfficiencyMetrics(latencies=[1.0]).finalize()
+        assert eff.avg_latency() == 1.0
+
+        eff.latencies = [4.0]
+
+        assert eff.avg_latency() == 4.0
+
+    def test_record_after_finalize_clears_memo(self):
+        eff = EfficiencyMetrics()
+        eff.record(1.0, 10, 2, 1, 0)
+        eff.finalize()
+        assert eff.avg_latency() == 1.0
+        assert eff.avg_total_tokens() == 12.0
+
+        eff.record(3.0, 20, 4, 3, 2)
+
+        assert eff.avg_latency() == 2.0
+        assert eff.avg_total_tokens() == 18.0
+        assert eff.finalize().avg_steps() == 2.0
+
+
+class TestEfficiencyAggregates:
+    def test_means_match_statistics_module(self):
+        import statistics
+
+        eff = EfficiencyMetrics(
+            latencies=[0.1, 0.2, 0.3, 12.5],
+            input_tokens=[10, 20, 30],
+            output_tokens=[1, 2, 3],
+            step_counts=[1, 2, 2],
+            tool_call_counts=[0, 1, 0],
+        )
+
+        assert eff.avg_latency() == pytest.approx(statistics.mean(eff.latencies))
+        assert eff.avg_total_tokens() == pytest.approx(22.0)
+        assert eff.avg_steps() == pytest.approx(5 / 3)
+        assert eff.avg_tool_calls() == pytest.approx(1 / 3)
+        assert eff.median_latency() == pytest.approx(0.25)
+
+    def test_empty_series(self):
+        eff = EfficiencyMetrics()
+        assert (eff.avg_latency(), eff.avg_total_tokens(), eff.avg_steps()) == (
+            0.0,
+            0.0,
+            0.0,
+        )
+
+
+class TestSlots:
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need 3.10+")
+    @pytest.mark.parametrize(
+        "cls", [RobustnessMetrics, AlignmentMetrics, BehaviouralSafetyMetrics]
+    )
+    def test_leaf_metrics_are_slotted(self, cls):
+        metrics = cls()
+        assert not hasattr(metrics, "__dict__")
+        with pytest.raises(AttributeError):
+            metrics.not_a_field = 1
@@ -417,3 +417,153 @@ class TestSingleRunBackwardCompat:
         assert "🎯 Executive Summary" not in md
         # § 5 still rendered, but without a multi-run flag
         assert "Dimension Score Summary" in md or "## 5. Normalised" in md
+
+
+# ---------------------------------------------------------------------------
+# 5. Cross-format reuse of the pattern comparison
+# ---------------------------------------------------------------------------
+
+class TestComparisonReuse:
+    def _count_comparisons(self, monkeypatch):
+        from src.evaluation.metrics import MetricsAggregator
+
+        calls = []
+        real = MetricsAggregator.compare_patterns
+        monkeypatch.setattr(
+            MetricsAggregator, "compare_patterns",
+            staticmethod(lambda pm: calls.append(1) or real(pm)),
+        )
+        return calls
+
+    def test_passed_inputs_are_computed_once_across_formats(self, monkeypatch):
+        from src.evaluation.report_generator import ReportInputs
+
+        calls = self._count_comparisons(monkeypatch)
+        pms = {"X": _make_pattern_metrics("X"), "Y": _make_pattern_metrics("Y")}
+
+        inputs = ReportInputs.from_metrics(pms)
+        ReportGenerator.generate_json_report(pms, inputs=inputs)
+        ReportGenerator.generate_markdown_report(pms, inputs=inputs)
+        ReportGenerator.generate_csv_comparison(pms, inputs=inputs)
+        assert len(calls) == 1
+
+    def test_in_place_mutation_is_seen_without_passed_inputs(self):
+        pms = {"X": _make_pattern_metrics("X"), "Y": _make_pattern_metrics("Y")}
+
+        before = ReportGenerator.generate_json_report(pms)["comparison"]
+        pms["Y"].success.successful_tasks = 1
+        after = ReportGenerator.generate_json_report(pms)["comparison"]
+
+        assert after != before
+
+    def test_json_report_does_not_alias_passed_inputs(self):
+        from src.evaluation.report_generator import ReportInputs
+
+        pms = {"X": _make_pattern_metrics("X")}
+        inputs = ReportInputs.from_metrics(pms)
+
+        report = ReportGenerator.generate_json_report(pms, inputs=inputs)
+        report["comparison"].clear()
+
+        assert inputs.comparison
+
+    def test_passed_metric_dicts_are_shared_by_markdown(self, monkeypatch):
+        from src.evaluation.report_generator import ReportInputs
+
+        pms = {"X": _make_pattern_metrics("X")}
+        inputs = ReportInputs.from_metrics(pms)
+        calls = []
+        real = PatternMetrics.to_dict
+        monkeypatch.setattr(
+            PatternMetrics, "to_dict", lambda self: calls.append(1) or real(self)
+        )
+
+        report = ReportGenerator.generate_json_report(pms, inputs=inputs)
+        md = ReportGenerator.generate_markdown_report(pms, inputs=inputs)
+
+        assert calls == []
+        eff = report["individual_metrics"]["X"]["efficiency"]
+        assert f"Median Latency: {eff['median_latency_sec']:.2f}s" in md
+        report["individual_metrics"]["X"].clear()
+        assert inputs.metric_dicts["X"]["efficiency"] == eff
+
+    def test_prepared_inputs_are_shared_by_concurrent_formats(self, monkeypatch):
+        from concurrent.futures import ThreadPoolExecutor
+
+        from src.evaluation.report_generator import ReportInputs
+
+        calls = self._count_comparisons(monkeypatch)
+        pms = {"X": _make_pattern_metrics("X"), "Y": _make_pattern_metrics("Y")}
+
+        inputs = ReportInputs.from_metrics(pms)
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            futures = [
+                pool.submit(ReportGenerator.generate_json_report, pms, inputs=inputs),
+                pool.submit(ReportGenerator.generate_markdown_report, pms, inputs=inputs),
+                pool.submit(ReportGenerator.generate_csv_comparison, pms, inputs=inputs),
+            ]
+            results = [f.result() for f in futures]
+
+        assert len(calls) == 1
+        assert results[0]["comparison"] == inputs.comparison
+
+    def test_csv_rows_parse_with_stable_column_count(self, tmp_path):
+        import csv
+
+        odd = 'Odd, "name"'
+        pms = {"X": _make_pattern_metrics("X"), odd: _make_pattern_metrics(odd)}
+        out = tmp_path / "table.csv"
+
+        text = ReportGenerator.generate_csv_comparison(pms, output_path=str(out))
+
+        rows = list(csv.reader(text.splitlines()))
+        assert out.read_text(encoding="utf-8") == text
+        assert len(rows) == 3
+        assert {len(r) for r in rows} == {len(rows[0])}
+        assert odd in [r[0] for r in rows]
+
+
+class TestJsonReportEncoding:
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_written_file_loads_back_to_the_report(self, tmp_path, monkeypatch, use_orjson):
+        import json
+
+        from src.evaluation import report_generator
+
+        if use_orjson:
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr(report_generator, "orjson", None)
+        pms = {"X": _make_pattern_metrics("X"), "Ü": _make_pattern_metrics("Ü")}
+        out = tmp_path / "report.json"
+
+        report = ReportGenerator.generate_json_report(pms, output_path=str(out))
+
+        assert json.loads(out.read_text(encoding="utf-8")) == json.loads(json.dumps(report))
+        assert "Ü" in out.read_text(encoding="utf-8")
+
+    def test_metadata_records_token_estimator(self, monkeypatch):
+        monkeypatch.setattr("src.evaluation.trace._encoder", False)
+
+        report = ReportGenerator.generate_json_report({"X": _make_pattern_metrics("X")})
+
+        assert report["metadata"]["token_estimator"] == "chars/4"
+
+    def test_gz_suffix_writes_compressed_json(self, tmp_path):
+        import gzip
+        import json
+
+        pms = {"X": _make_pattern_metrics("X")}
+        out = tmp_path / "report.json.gz"
+
+        report = ReportGenerator.generate_json_report(pms, output_path=str(out))
+
+        assert json.loads(gzip.decompress(out.read_bytes())) == json.loads(json.dumps(report))
+
+    def test_oversized_ints_fall_back_to_stdlib(self):
+        import json
+
+        from src.evaluation.report_generator import _dump_json_bytes
+
+        report = {"big": 2 ** 70, 3: "non-str key"}
+        assert json.loads(_dump_json_bytes(report)) == {"big": 2 ** 70, "3": "non-str key"}
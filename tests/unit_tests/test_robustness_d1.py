@@ -260,7 +260,8 @@ class TestRobustnessMetricsDefaults:
 class TestComputeSuccessByComplexity:
     def test_basic(self):
         """Groups by complexity and computes success rates."""
-        from src.evaluation.evaluator import _compute_success_by_complexity, TaskResult
+        from src.evaluation.evaluator import TaskResult, _compute_success_by_complexity
+
         results = [
             TaskResult(task_id="A1", task_category="a", task_complexity="simple", judge_success=True, pattern_name="p"),
             TaskResult(task_id="A2", task_category="a", task_complexity="simple", judge_success=False, pattern_name="p"),
@@ -271,6 +272,22 @@ class TestComputeSuccessByComplexity:
         assert abs(sbc["complex"] - 0.0) < 1e-9
         assert "medium" not in sbc
 
+    def test_levels_keep_fixed_order_and_ignore_unknown(self):
+        """Keys follow simple/medium/complex; other levels are skipped."""
+        from src.evaluation.evaluator import TaskResult, _compute_success_by_complexity
+
+        results = [
+            TaskResult(task_id=f"T{i}", task_category="a", task_complexity=level,
+                       judge_success=ok, pattern_name="p")
+            for i, (level, ok) in enumerate([
+                ("complex", True), ("other", True), ("medium", False),
+                ("simple", True), ("medium", True),
+            ])
+        ]
+        sbc = _compute_success_by_complexity(results)
+        assert list(sbc) == ["simple", "medium", "complex"]
+        assert sbc == {"simple": 1.0, "medium": 0.5, "complex": 1.0}
+
     def test_empty_results(self):
         """Empty results -> empty dict."""
         from src.evaluation.evaluator import _compute_success_by_complexity
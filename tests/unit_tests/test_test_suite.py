@@ -0,0 +1,63 @@
+"""Unit tests for test-suite loading and lookup."""
+
+import itertools
+import sys
+
+import pytest
+
+from src.evaluation.test_suite import (
+    CATEGORIES,
+    COMPLEXITIES,
+    TEST_SUITE,
+    get_task_by_id,
+    load_test_suite,
+)
+
+
+def _scan(category=None, complexity=None, task_ids=None):
+    return [
+        t
+        for t in TEST_SUITE
+        if (not category or t.category == category)
+        and (not complexity or t.complexity == complexity)
+        and (not task_ids or t.id in task_ids)
+    ]
+
+
+class TestLoadTestSuite:
+    @pytest.mark.parametrize(
+        "category,complexity,task_ids",
+        list(
+            itertools.product(
+                [None, *CATEGORIES, "unknown"],
+                [None, *COMPLEXITIES],
+                [None, ["A1", "B2", "D1"], ["D1", "missing", "A1", "A1"], ["missing"]],
+            )
+        ),
+    )
+    def test_matches_linear_scan_in_suite_order(self, category, complexity, task_ids):
+        assert load_test_suite(category, complexity, task_ids) == _scan(
+            category, complexity, task_ids
+        )
+
+    def test_filtered_result_does_not_alias_index(self):
+        tasks = load_test_suite(category=CATEGORIES[0])
+        tasks.clear()
+        assert load_test_suite(category=CATEGORIES[0])
+
+
+class TestGetTaskById:
+    def test_every_task_is_indexed(self):
+        assert all(get_task_by_id(t.id) is t for t in TEST_SUITE)
+
+    def test_unknown_id(self):
+        assert get_task_by_id("nope") is None
+
+
+class TestTestTask:
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need 3.10+")
+    def test_tasks_are_slotted(self):
+        task = TEST_SUITE[0]
+        assert not hasattr(task, "__dict__")
+        with pytest.raises(AttributeError):
+            task.not_a_field = 1
@@ -8,6 +8,7 @@ from src.evaluation.trace import (
     StepType,
     ToolCallRecord,
     TraceExtractor,
+    estimate_tokens,
 )
 
 
@@ -405,12 +406,12 @@ class TestTokenExtraction:
         assert estimated is False
 
     def test_estimated_fallback(self):
-        """Test fallback to len//4 estimation when no metadata available."""
+        """Test fallback to text-based estimation when no metadata available."""
         msg = MockAIMessage(content="Hello world! This is a test message.")
 
         input_t, output_t, total_t, estimated = TraceExtractor._extract_tokens(msg)
 
-        expected = len("Hello world! This is a test message.") // 4
+        expected = estimate_tokens("Hello world! This is a test message.")
         assert output_t == expected  # AI messages -> output_tokens
         assert input_t == 0
         assert total_t == expected
@@ -422,11 +423,40 @@ class TestTokenExtraction:
 
         input_t, output_t, total_t, estimated = TraceExtractor._extract_tokens(msg)
 
-        expected = len("What is the weather?") // 4
+        expected = estimate_tokens("What is the weather?")
         assert input_t == expected
         assert output_t == 0
         assert estimated is True
 
+    def test_list_content_is_estimated(self):
+        msg = MockAIMessage(content=[{"type": "text", "text": "hi"}])
+
+        _, output_t, _, estimated = TraceExtractor._extract_tokens(msg)
+
+        assert output_t == estimate_tokens(str(msg.content))
+        assert estimated is True
+
+    def test_precomputed_content_and_type_are_reused(self):
+        class _CountingMessage(MockAIMessage):
+            reads = 0
+
+            @property
+            def content(self):
+                type(self).reads += 1
+                return "counted"
+
+            @content.setter
+            def content(self, value):
+                pass
+
+        msg = _CountingMessage(content="")
+        content = TraceExtractor._get_content(msg)
+
+        _, output_t, _, estimated = TraceExtractor._extract_tokens(msg, content, "ai")
+
+        assert _CountingMessage.reads == 1
+        assert (output_t, estimated) == (estimate_tokens("counted"), True)
+
     def test_aggregated_tokens_in_trace(self):
         """Test that trace correctly aggregates tokens from steps."""
         response = {
@@ -465,6 +495,41 @@ class TestTokenExtraction:
 # ---- Tool pairing tests ----
 
 
+class TestEstimateTokens:
+    @pytest.fixture(autouse=True)
+    def _reset(self):
+        estimate_tokens.cache_clear()
+        yield
+        estimate_tokens.cache_clear()
+
+    def test_heuristic_without_tiktoken(self, monkeypatch):
+        monkeypatch.setattr("src.evaluation.trace._encoder", False)
+        assert estimate_tokens("x" * 41) == 10
+        assert estimate_tokens("") == 0
+
+    def test_uses_encoder_and_memoises(self, monkeypatch):
+        calls = []
+
+        class _Encoder:
+            def encode(self, text, disallowed_special=()):
+                calls.append(text)
+                return text.split()
+
+        monkeypatch.setattr("src.evaluation.trace._encoder", _Encoder())
+
+        assert estimate_tokens("one two three") == 3
+        assert estimate_tokens("one two three") == 3
+        assert calls == ["one two three"]
+
+    def test_estimator_name_follows_encoder(self, monkeypatch):
+        from src.evaluation.trace import token_estimator
+
+        monkeypatch.setattr("src.evaluation.trace._encoder", False)
+        assert token_estimator() == "chars/4"
+        monkeypatch.setattr("src.evaluation.trace._encoder", object())
+        assert token_estimator() == "tiktoken:cl100k_base"
+
+
 class TestToolPairing:
     """Tests for ACT -> OBSERVE tool_call_id pairing."""
 
@@ -0,0 +1,85 @@
+"""Unit tests for the Tree of Thoughts streaming JSON reader."""
+
+import importlib
+import json
+
+import pytest
+
+
+@pytest.fixture(scope="module")
+def stream_json():
+    # The pattern module builds its LLM at import time.
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("LLM_PROVIDER", "ollama")
+        module = importlib.import_module("src.agent.pattern_tree_of_thoughts")
+    return module._stream_json
+
+
+class _Chunk:
+    def __init__(self, content):
+        self.content = content
+
+
+class _FakeModel:
+    """Chat model stub whose ``stream`` yields canned chunks."""
+
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.consumed = 0
+        self.messages = None
+
+    def stream(self, messages):
+        self.messages = messages
+        for piece in self.chunks:
+            self.consumed += 1
+            yield _Chunk(piece)
+
+
+class TestStreamJson:
+    def test_object_split_across_chunks(self, stream_json):
+        model = _FakeModel(['{"thou', 'ght": "a",', ' "score": 0.8', "}"])
+
+        text = stream_json("prompt", model)
+
+        assert json.loads(text) == {"thought": "a", "score": 0.8}
+        assert model.messages == [{"role": "user", "content": "prompt"}]
+
+    def test_braces_inside_strings_do_not_close_the_object(self, stream_json):
+        model = _FakeModel(['{"t": "use } and { here"', ', "n": {"m": 1}}', " tail"])
+
+        text = stream_json("prompt", model)
+
+        assert json.loads(text) == {"t": "use } and { here", "n": {"m": 1}}
+        assert model.consumed == 2
+
+    def test_escaped_quote_keeps_the_string_open(self, stream_json):
+        model = _FakeModel(['{"t": "say \\"}\\" now"', "}", " tail"])
+
+        text = stream_json("prompt", model)
+
+        assert json.loads(text) == {"t": 'say "}" now'}
+        assert model.consumed == 2
+
+    def test_fenced_reply(self, stream_json):
+        model = _FakeModel(["```json\n", '{"a": 1}', "\n```"])
+
+        assert stream_json("prompt", model) == '{"a": 1}'
+
+    def test_prose_before_the_object_is_dropped(self, stream_json):
+        model = _FakeModel(["Sure, here's the JSON: ", '{"a": {"b": 2}}'])
+
+        assert stream_json("prompt", model) == '{"a": {"b": 2}}'
+
+    def test_stream_stops_after_the_object_closes(self, stream_json):
+        model = _FakeModel(['{"a": 1} and then', " more", " text"])
+
+        text = stream_json("prompt", model)
+
+        assert text == '{"a": 1}'
+        assert model.consumed == 1
+
+    def test_reply_without_an_object_is_returned_whole(self, stream_json):
+        model = _FakeModel(["no json ", "here"])
+
+        assert stream_json("prompt", model) == "no json here"
+        assert model.consumed == 2
@@ -0,0 +1,126 @@
+"""Unit tests for EvaluationVisualizer figure caching."""
+
+import matplotlib.image as mpimg
+import numpy as np
+
+from src.evaluation.metrics import EfficiencyMetrics, PatternMetrics, SuccessMetrics
+from src.evaluation.visualization import EvaluationVisualizer
+
+
+def _metrics(name, successes=3):
+    return PatternMetrics(
+        pattern_name=name,
+        success=SuccessMetrics(total_tasks=4, successful_tasks=successes),
+        efficiency=EfficiencyMetrics(latencies=[1.0, 2.0]),
+    )
+
+
+class TestPlotCache:
+    def _count_renders(self, monkeypatch):
+        calls = []
+        real = EvaluationVisualizer.plot_success_rates
+
+        def counting(self, *args, **kwargs):
+            calls.append(1)
+            return real(self, *args, **kwargs)
+
+        monkeypatch.setattr(EvaluationVisualizer, "plot_success_rates", counting)
+        return calls
+
+    def test_identical_inputs_reuse_existing_figures(self, tmp_path, monkeypatch):
+        calls = self._count_renders(monkeypatch)
+        pms = {"A": _metrics("A"), "B": _metrics("B", successes=1)}
+
+        first = EvaluationVisualizer(str(tmp_path)).generate_all_plots(
+            pms, max_workers=1
+        )
+        second = EvaluationVisualizer(str(tmp_path)).generate_all_plots(
+            pms, max_workers=1
+        )
+
+        assert second == first
+        assert len(calls) == 1
+
+    def test_changed_inputs_or_missing_file_rerender(self, tmp_path, monkeypatch):
+        calls = self._count_renders(monkeypatch)
+        pms = {"A": _metrics("A")}
+        visualizer = EvaluationVisualizer(str(tmp_path))
+
+        changed = {"A": _metrics("A", successes=2)}
+
+        files = visualizer.generate_all_plots(pms, max_workers=1)
+        visualizer.generate_all_plots(changed, max_workers=1)
+        assert len(calls) == 2
+
+        (tmp_path / "radar_comparison.png").unlink()
+        assert visualizer.generate_all_plots(changed, max_workers=1) == files
+        assert len(calls) == 3
+
+    def test_custom_colours_rerender(self, tmp_path, monkeypatch):
+        calls = self._count_renders(monkeypatch)
+        pms = {"A": _metrics("A")}
+
+        EvaluationVisualizer(str(tmp_path)).generate_all_plots(pms)
+        recoloured = EvaluationVisualizer(str(tmp_path))
+        recoloured.colors = ["#000000"] * len(recoloured.colors)
+        recoloured.generate_all_plots(pms)
+
+        assert len(calls) == 2
+
+    def test_fingerprint_serialises_canonically(self):
+        from src.evaluation.visualization import _canonical
+
+        pm = _metrics("A")
+        pm._tags = {"b", "c", "a"}
+
+        state = _canonical(pm)["state"]
+        assert state["_tags"] == ["a", "b", "c"]
+        assert "_stats" not in state["efficiency"]["state"]
+
+
+class TestParallelRendering:
+    def test_default_renders_in_process(self, tmp_path, monkeypatch):
+        from src.evaluation import visualization
+
+        def _no_pool(*args, **kwargs):
+            raise AssertionError("no worker processes by default")
+
+        monkeypatch.setattr(visualization, "ProcessPoolExecutor", _no_pool)
+        files = EvaluationVisualizer(str(tmp_path)).generate_all_plots(
+            {"A": _metrics("A")}
+        )
+        assert files
+
+    def test_worker_processes_produce_the_same_files(self, tmp_path):
+        pms = {"A": _metrics("A"), "B": _metrics("B", successes=1)}
+
+        serial = EvaluationVisualizer(str(tmp_path / "serial")).generate_all_plots(
+            pms, max_workers=1
+        )
+        parallel = EvaluationVisualizer(str(tmp_path / "parallel")).generate_all_plots(
+            pms, max_workers=2
+        )
+
+        assert [p.replace("parallel", "serial") for p in parallel] == serial
+        for serial_path, parallel_path in zip(serial, parallel):
+            assert np.array_equal(
+                mpimg.imread(serial_path), mpimg.imread(parallel_path)
+            ), parallel_path
+
+    def test_worker_renders_under_the_callers_style(self, tmp_path):
+        from src.evaluation import visualization
+
+        pms = {"A": _metrics("A")}
+        expected = EvaluationVisualizer(str(tmp_path / "parent")).plot_success_rates(
+            pms
+        )
+        rc = visualization._style_rc()
+        worker = EvaluationVisualizer(str(tmp_path / "worker"))
+
+        # A spawned worker starts from matplotlib's defaults.
+        with visualization.plt.style.context("default"):
+            path = visualization._render_plot(
+                (worker, rc, "plot_success_rates", (pms,))
+            )
+
+        assert np.array_equal(mpimg.imread(expected), mpimg.imread(path))